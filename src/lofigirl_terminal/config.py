@@ -27,9 +27,34 @@ class Config(BaseSettings):
         audio_quality: Audio quality setting
         audio_cache_enabled: Whether to enable audio caching
         audio_cache_dir: Directory for audio cache
-        connection_timeout: Connection timeout in seconds
-        retry_attempts: Number of retry attempts for network requests
-        stream_buffer_size: Size of streaming buffer
+        stream_cache_enabled: Whether to cache resolved stream URLs on disk
+        stream_cache_max_entries: Maximum number of cached stream URLs
+        hls_variant_selection: Whether to pick the HLS variant for mpv
+        connection_timeout: Deadline in seconds for resolving a stream
+        retry_attempts: Number of retries for failed stream resolutions
+        stream_buffer_size: Balanced audio read-ahead of mpv's cache, in KiB
+        cache_profile: mpv cache profile
+        resolver_backend: How station URLs are resolved to stream URLs
+        resolver_hedging: Whether to hedge slow resolutions with a second run
+                          (subprocess backend only)
+        fake_resolver_map: JSON file used by the fake resolver backend
+        fake_resolver_latency_ms: Simulated latency of the fake resolver
+        resolverd_enabled: Whether to use a running resolver daemon
+        resolverd_socket: Unix socket of the resolver daemon
+        prefetch_enabled: Whether to resolve all stations in the background
+        prefetch_workers: Number of concurrent background resolutions
+        stream_refresh_enabled: Whether to re-resolve stream URLs before expiry
+        stream_refresh_hot_swap: Whether to reload a playing stream on refresh
+        playlist_prefetch_enabled: Whether to queue neighbouring stations in mpv
+        crossfade_enabled: Whether to crossfade between stations
+        crossfade_seconds: Length of the crossfade
+        live_discovery_enabled: Whether to map channel URLs to live streams
+        live_discovery_ttl: Lifetime of discovered live stream mappings
+        failure_cooldown_seconds: Fail-fast period after a failed resolve
+        failure_cooldown_max_seconds: Upper bound for the growing cooldown
+        watchdog_enabled: Whether to reconnect stalled or failed streams
+        watchdog_stall_seconds: Time without progress that counts as a stall
+        watchdog_max_attempts: Consecutive reconnects before giving up
         theme: UI theme
         show_visualizer: Whether to show audio visualizer
         update_interval: UI update interval in seconds
@@ -71,7 +96,7 @@ class Config(BaseSettings):
     )
     audio_quality: Literal["low", "medium", "high"] = Field(
         default="high",
-        description="Audio quality setting",
+        description="Stream quality tier; caps the bitrate/resolution yt-dlp picks",
     )
     audio_cache_enabled: bool = Field(
         default=False,
@@ -81,6 +106,20 @@ class Config(BaseSettings):
         default=Path(".cache/audio"),
         description="Directory for audio cache",
     )
+    stream_cache_enabled: bool = Field(
+        default=True,
+        description="Cache resolved stream URLs on disk until they expire",
+    )
+    stream_cache_max_entries: int = Field(
+        default=64,
+        ge=1,
+        le=1024,
+        description="Maximum number of cached stream URLs",
+    )
+    hls_variant_selection: bool = Field(
+        default=True,
+        description="Hand mpv the HLS variant matching audio_quality",
+    )
 
     # Network Settings
     connection_timeout: int = Field(
@@ -99,7 +138,112 @@ class Config(BaseSettings):
         default=4096,
         ge=1024,
         le=65536,
-        description="Stream buffer size in bytes",
+        description="mpv read-ahead in KiB for audio with the balanced profile",
+    )
+    cache_profile: Literal["minimal", "balanced", "resilient"] = Field(
+        default="balanced",
+        description="mpv cache size: minimal, balanced or resilient",
+    )
+    resolver_backend: Literal["auto", "subprocess", "inprocess", "direct", "fake"] = (
+        Field(
+            default="auto",
+            description="Resolver backend (auto, subprocess, inprocess, direct, fake)",
+        )
+    )
+    resolver_hedging: bool = Field(
+        default=False,
+        description=(
+            "Start a second yt-dlp run when a resolve exceeds its p90 "
+            "(subprocess backend only)"
+        ),
+    )
+    fake_resolver_map: Optional[Path] = Field(
+        default=None,
+        description="JSON file mapping station IDs to local files or URLs",
+    )
+    fake_resolver_latency_ms: int = Field(
+        default=0,
+        ge=0,
+        le=60000,
+        description="Latency the fake resolver adds to every resolution",
+    )
+    resolverd_enabled: bool = Field(
+        default=True,
+        description="Resolve through 'lofigirl resolverd' when it is running",
+    )
+    resolverd_socket: Optional[Path] = Field(
+        default=None,
+        description="Resolver daemon socket (default: $XDG_RUNTIME_DIR or /tmp)",
+    )
+    prefetch_enabled: bool = Field(
+        default=True,
+        description="Resolve all stations in the background at startup",
+    )
+    prefetch_workers: int = Field(
+        default=2,
+        ge=1,
+        le=8,
+        description="Number of concurrent background station resolutions",
+    )
+    stream_refresh_enabled: bool = Field(
+        default=True,
+        description="Re-resolve current and neighbouring stations before expiry",
+    )
+    stream_refresh_hot_swap: bool = Field(
+        default=False,
+        description="Reload a playing stream as soon as its URL is refreshed",
+    )
+    playlist_prefetch_enabled: bool = Field(
+        default=True,
+        description="Queue neighbouring stations in mpv so switching is a jump",
+    )
+    crossfade_enabled: bool = Field(
+        default=False,
+        description="Crossfade station changes using a second mpv instance",
+    )
+    crossfade_seconds: float = Field(
+        default=2.0,
+        ge=0.1,
+        le=10.0,
+        description="Crossfade duration in seconds",
+    )
+    live_discovery_enabled: bool = Field(
+        default=True,
+        description="Resolve channel station URLs to their current live stream",
+    )
+    live_discovery_ttl: int = Field(
+        default=21600,
+        ge=60,
+        le=604800,
+        description="Seconds a discovered live stream mapping is reused",
+    )
+    failure_cooldown_seconds: int = Field(
+        default=15,
+        ge=1,
+        le=3600,
+        description="Seconds a station fails fast after a failed resolve",
+    )
+    failure_cooldown_max_seconds: int = Field(
+        default=600,
+        ge=1,
+        le=86400,
+        description="Upper bound for the cooldown, which doubles per failure",
+    )
+    watchdog_enabled: bool = Field(
+        default=True,
+        description="Reconnect automatically when playback stalls or fails",
+    )
+    watchdog_stall_seconds: int = Field(
+        default=15,
+        ge=3,
+        le=300,
+        description="Seconds without playback progress before reconnecting",
+    )
+    watchdog_max_attempts: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Consecutive reconnect attempts before giving up",
     )
 
     # UI Settings
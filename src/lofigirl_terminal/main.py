@@ -5,6 +5,7 @@ This module provides the CLI interface for the application using Click.
 """
 
 import sys
+from pathlib import Path
 from typing import Optional
 
 import click
@@ -14,6 +15,7 @@ from rich.table import Table
 from lofigirl_terminal import __version__
 from lofigirl_terminal.config import get_config
 from lofigirl_terminal.logger import setup_logger
+from lofigirl_terminal.modules.cache_profiles import get_cache_profile
 from lofigirl_terminal.modules.player import AudioPlayer
 from lofigirl_terminal.modules.stations import StationManager
 
@@ -176,6 +178,11 @@ def info() -> None:
     info_table.add_row("Log Level", config.log_level)
     info_table.add_row("Default Volume", f"{config.default_volume}%")
     info_table.add_row("Audio Quality", config.audio_quality)
+    for mode, video in (("Audio", False), ("Video", True)):
+        profile = get_cache_profile(
+            config.cache_profile, config.stream_buffer_size, video
+        )
+        info_table.add_row(f"{mode} Cache", profile.describe())
     info_table.add_row("Default Station", config.default_station)
     info_table.add_row("Theme", config.theme)
     info_table.add_row("Debug Mode", str(config.debug_mode))
@@ -323,6 +330,42 @@ def tui(style: str) -> None:
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket to listen on (default: RESOLVERD_SOCKET or per-user path)",
+)
+@click.option(
+    "--shared",
+    is_flag=True,
+    help="Allow every user on this machine to connect",
+)
+def resolverd(socket_path: Optional[Path], shared: bool) -> None:
+    """
+    🛰️  Run the shared stream resolver daemon.
+
+    Every lofigirl instance on this machine resolves streams through the
+    daemon while it runs, sharing one yt-dlp engine and one URL cache.
+    Instances fall back to resolving on their own when it is not running.
+
+    Examples:
+        lofigirl resolverd                          # Per-user daemon
+        lofigirl resolverd --socket /tmp/lofi.sock --shared
+    """
+    from lofigirl_terminal.modules.resolverd import run_resolverd
+
+    console.print("\n[cyan]🛰️  Starting resolver daemon...[/cyan]")
+    console.print("[dim]Press Ctrl+C to stop[/dim]\n")
+    try:
+        run_resolverd(socket_path=socket_path, shared=shared)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}", style="bold")
+        logger.exception(f"Error running resolver daemon: {e}")
+        sys.exit(1)
+
+
 def main() -> None:
     """
     Main entry point for the application.
@@ -0,0 +1,166 @@
+"""
+mpv cache profiles for LofiGirl Terminal.
+
+mpv's demuxer cache holds stream data ahead of (and behind) the playback
+position. Sized for video, it dwarfs what an audio-only session needs: at
+128 kbps a minute of audio is under 1 MiB. This module derives the cache
+limits from ``stream_buffer_size`` (the balanced audio read-ahead, in KiB),
+the selected profile and the audio/video mode, capped by a memory budget
+per mode, and reports the process RSS so the result can be checked.
+"""
+
+import os
+import sys
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+try:
+    import resource
+
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    # Not available on Windows
+    RESOURCE_AVAILABLE = False
+
+KIB = 1024
+MIB = 1024 * KIB
+
+# Read-ahead multiplier, back-buffer share and cache_secs per profile
+PROFILES: Dict[str, Tuple[float, float, int]] = {
+    # Just enough to ride out a short network hiccup
+    "minimal": (0.25, 0.0, 10),
+    "balanced": (1.0, 0.25, 30),
+    # Long read-ahead for flaky connections
+    "resilient": (4.0, 0.5, 120),
+}
+
+# Video streams need far more bytes for the same duration
+VIDEO_FACTOR = 16
+
+# Upper bound for read-ahead plus back buffer, per mode
+MEMORY_BUDGETS: Dict[str, int] = {
+    "audio": 32 * MIB,
+    "video": 256 * MIB,
+}
+
+
+@dataclass(frozen=True)
+class CacheProfile:
+    """
+    Effective mpv cache limits.
+
+    Attributes:
+        name: Profile name ("minimal", "balanced" or "resilient")
+        mode: "audio" or "video"
+        max_bytes: Read-ahead limit (demuxer_max_bytes)
+        max_back_bytes: Limit for already played data (demuxer_max_back_bytes)
+        cache_secs: Read-ahead limit in seconds
+    """
+
+    name: str
+    mode: str
+    max_bytes: int
+    max_back_bytes: int
+    cache_secs: int
+
+    @property
+    def total_bytes(self) -> int:
+        """Upper bound of the cache's memory use."""
+        return self.max_bytes + self.max_back_bytes
+
+    def mpv_options(self) -> Dict[str, object]:
+        """
+        Get the mpv options applying this profile.
+
+        Returns:
+            Options for mpv.MPV()
+        """
+        return {
+            "cache": True,
+            "cache_secs": self.cache_secs,
+            "demuxer_max_bytes": str(self.max_bytes),
+            "demuxer_max_back_bytes": str(self.max_back_bytes),
+        }
+
+    def describe(self) -> str:
+        """Summarize the limits, e.g. for ``lofigirl info``."""
+        return (
+            f"{self.name} ({self.mode}): {format_bytes(self.max_bytes)} ahead, "
+            f"{format_bytes(self.max_back_bytes)} back, {self.cache_secs}s"
+        )
+
+
+def get_cache_profile(name: str, buffer_kib: int, video: bool) -> CacheProfile:
+    """
+    Compute the cache limits for a profile.
+
+    Args:
+        name: Profile name ("minimal", "balanced" or "resilient")
+        buffer_kib: Balanced audio read-ahead in KiB (``stream_buffer_size``)
+        video: Whether video is played
+
+    Returns:
+        CacheProfile within the mode's memory budget
+
+    Raises:
+        ValueError: If the profile name is unknown
+
+    Example:
+        >>> get_cache_profile("balanced", 4096, video=False).describe()
+        'balanced (audio): 4.0 MiB ahead, 1.0 MiB back, 30s'
+    """
+    if name not in PROFILES:
+        raise ValueError(f"Unknown cache profile: {name}")
+    ahead, back_share, cache_secs = PROFILES[name]
+    mode = "video" if video else "audio"
+
+    max_bytes = int(buffer_kib * KIB * ahead * (VIDEO_FACTOR if video else 1))
+    max_back_bytes = int(max_bytes * back_share)
+    budget = MEMORY_BUDGETS[mode]
+    if max_bytes + max_back_bytes > budget:
+        scale = budget / (max_bytes + max_back_bytes)
+        max_bytes = int(max_bytes * scale)
+        max_back_bytes = int(max_back_bytes * scale)
+
+    return CacheProfile(name, mode, max_bytes, max_back_bytes, cache_secs)
+
+
+def current_rss_bytes() -> Optional[int]:
+    """
+    Get the resident set size of this process, libmpv included.
+
+    Reads /proc on Linux. On other Unix systems only the peak RSS is
+    available, which is returned instead.
+
+    Returns:
+        RSS in bytes, or None if it cannot be determined
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if not RESOURCE_AVAILABLE:
+        return None
+    try:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (OSError, ValueError):
+        return None
+    # Reported in bytes on macOS and in KiB elsewhere
+    return peak if sys.platform == "darwin" else peak * KIB
+
+
+def format_bytes(size: int) -> str:
+    """
+    Format a byte count for display.
+
+    Args:
+        size: Number of bytes
+
+    Returns:
+        Size in KiB below one MiB, otherwise in MiB
+    """
+    if size < MIB:
+        return f"{size / KIB:.0f} KiB"
+    return f"{size / MIB:.1f} MiB"
@@ -0,0 +1,216 @@
+"""
+Circuit breaker for failing stream resolutions in LofiGirl Terminal.
+
+A resolve that fails can take the full yt-dlp timeout. This module remembers
+failures per stream so that repeated attempts on a known-bad station fail
+immediately instead. Each failure opens the station's circuit for a cooldown
+that doubles with every consecutive failure; once it elapses a single probe
+is let through (half-open) and its outcome closes or re-opens the circuit.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, Optional
+
+from lofigirl_terminal.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Cooldown after the first failure, doubled for each further failure
+DEFAULT_BASE_COOLDOWN_SECONDS = 15.0
+
+# Upper bound for the cooldown
+DEFAULT_MAX_COOLDOWN_SECONDS = 600.0
+
+# A half-open probe that reports no outcome within this time (e.g. because
+# it was cancelled) is given up on and another probe is let through
+PROBE_LEASE_SECONDS = 60.0
+
+
+class CircuitState(Enum):
+    """
+    Enum representing the state of a circuit.
+
+    Attributes:
+        CLOSED: Requests pass through normally
+        OPEN: Requests fail fast until the cooldown elapses
+        HALF_OPEN: A single probe request is in progress
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+@dataclass
+class _Circuit:
+    """Failure bookkeeping for one key."""
+
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    # End of the cooldown (OPEN) or of the probe lease (HALF_OPEN)
+    open_until: float = 0.0
+
+
+class CircuitBreaker:
+    """
+    Thread-safe per-key circuit breaker acting as a negative-result cache.
+
+    Attributes:
+        base_cooldown: Cooldown after the first failure, in seconds
+        max_cooldown: Upper bound for the cooldown, in seconds
+    """
+
+    def __init__(
+        self,
+        base_cooldown: float = DEFAULT_BASE_COOLDOWN_SECONDS,
+        max_cooldown: float = DEFAULT_MAX_COOLDOWN_SECONDS,
+    ) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            base_cooldown: Cooldown after the first failure, in seconds
+            max_cooldown: Upper bound for the cooldown, in seconds
+        """
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self._circuits: Dict[str, _Circuit] = {}
+        self._probes: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        """
+        Check whether a request for a key may proceed.
+
+        An open circuit whose cooldown has elapsed turns half-open and lets
+        exactly this one caller through as the probe.
+
+        Args:
+            key: Key identifying the stream
+            now: Current monotonic time (defaults to time.monotonic())
+
+        Returns:
+            True if the request may proceed, False if it should fail fast
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == CircuitState.CLOSED:
+                return True
+            if now < circuit.open_until:
+                return False
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.open_until = now + PROBE_LEASE_SECONDS
+            logger.debug(f"Circuit half-open, probing: {key}")
+            return True
+
+    def record_success(self, key: str) -> None:
+        """
+        Close the circuit for a key after a successful request.
+
+        Args:
+            key: Key identifying the stream
+        """
+        with self._lock:
+            if self._circuits.pop(key, None) is not None:
+                logger.info(f"Circuit closed: {key}")
+
+    def record_failure(self, key: str, now: Optional[float] = None) -> float:
+        """
+        Open the circuit for a key after a failed request.
+
+        Args:
+            key: Key identifying the stream
+            now: Current monotonic time (defaults to time.monotonic())
+
+        Returns:
+            Cooldown in seconds before the key is probed again
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            failures = circuit.failures
+            cooldown = min(
+                self.base_cooldown * 2.0 ** (failures - 1), self.max_cooldown
+            )
+            circuit.state = CircuitState.OPEN
+            circuit.open_until = now + cooldown
+
+        logger.warning(
+            f"Circuit open for {cooldown:.0f}s after {failures} failure(s): {key}"
+        )
+        return cooldown
+
+    def state(self, key: str) -> CircuitState:
+        """
+        Get the state of the circuit for a key.
+
+        Args:
+            key: Key identifying the stream
+
+        Returns:
+            The current CircuitState
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return circuit.state if circuit else CircuitState.CLOSED
+
+    def retry_in(self, key: str, now: Optional[float] = None) -> float:
+        """
+        Get the time left until a key may be probed again.
+
+        Args:
+            key: Key identifying the stream
+            now: Current monotonic time (defaults to time.monotonic())
+
+        Returns:
+            Seconds until the cooldown elapses, 0 if it is not open
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, circuit.open_until - now)
+
+    def schedule_probe(self, key: str, probe: Callable[[], object]) -> None:
+        """
+        Run a probe in the background once the key's cooldown elapses.
+
+        At most one probe is scheduled per key at a time. The probe is
+        expected to go through allow() and record its own outcome.
+
+        Args:
+            key: Key identifying the stream
+            probe: Callable that retries the request
+        """
+        delay = self.retry_in(key)
+        with self._lock:
+            if key in self._probes:
+                return
+            timer = threading.Timer(delay, self._run_probe, args=(key, probe))
+            timer.daemon = True
+            self._probes[key] = timer
+        logger.debug(f"Probing {key} in {delay:.0f}s")
+        timer.start()
+
+    def cancel_probes(self) -> None:
+        """Cancel all scheduled background probes."""
+        with self._lock:
+            timers = list(self._probes.values())
+            self._probes.clear()
+        for timer in timers:
+            timer.cancel()
+
+    def _run_probe(self, key: str, probe: Callable[[], object]) -> None:
+        """Run a scheduled probe, never raising into the timer thread."""
+        with self._lock:
+            self._probes.pop(key, None)
+        try:
+            probe()
+        except Exception as e:
+            logger.warning(f"Background probe failed for {key}: {e}")
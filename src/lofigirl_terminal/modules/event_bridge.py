@@ -0,0 +1,119 @@
+"""
+Thread-safe event delivery into an asyncio event loop for LofiGirl Terminal.
+
+mpv reports state changes on its own event thread, while Textual widgets
+may only be touched from the app's event loop. An EventBridge accepts
+events from any thread without blocking, holds them in a bounded queue and
+hands them to a handler on the loop. Events published while a delivery is
+pending share one wakeup, and events with the same coalescing key replace
+each other, so a burst of state changes costs a single UI update.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+from lofigirl_terminal.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Pending events kept before the oldest are dropped
+DEFAULT_MAX_PENDING = 64
+
+
+class EventBridge(Generic[T]):
+    """
+    Bounded, coalescing queue from any thread into an event loop.
+
+    Attributes:
+        dropped: Number of events discarded because the queue was full
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        handler: Callable[[T], None],
+        coalesce: Optional[Callable[[T], Hashable]] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """
+        Initialize the bridge.
+
+        Args:
+            loop: Event loop the handler runs on
+            handler: Called on the loop with each delivered event
+            coalesce: Maps an event to a key; a pending event with the same
+                      key is replaced by the newer one. Events are never
+                      coalesced without it.
+            max_pending: Bound of the queue; the oldest events are dropped
+                         beyond it
+        """
+        self.loop = loop
+        self.handler = handler
+        self.coalesce = coalesce
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending: "OrderedDict[Hashable, T]" = OrderedDict()
+        self._sequence = 0
+        self._scheduled = False
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def publish(self, event: T) -> None:
+        """
+        Queue an event for delivery; safe to call from any thread.
+
+        Never blocks on the loop, so it can be called from libmpv's event
+        thread.
+
+        Args:
+            event: Event to deliver
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._sequence += 1
+            key: Hashable = (
+                self.coalesce(event) if self.coalesce else ("event", self._sequence)
+            )
+            # A replaced event moves to the end, keeping delivery order
+            self._pending.pop(key, None)
+            self._pending[key] = event
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        try:
+            self.loop.call_soon_threadsafe(self._deliver)
+        except RuntimeError:
+            # The loop is closed; the app is shutting down
+            with self._lock:
+                self._scheduled = False
+
+    def close(self) -> None:
+        """Discard pending events and ignore further ones."""
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+
+    def _take(self) -> Tuple[T, ...]:
+        """Remove and return all pending events."""
+        with self._lock:
+            events = tuple(self._pending.values())
+            self._pending.clear()
+            self._scheduled = False
+            return events
+
+    def _deliver(self) -> None:
+        """Hand the pending events to the handler; runs on the loop."""
+        for event in self._take():
+            try:
+                self.handler(event)
+            except Exception as e:
+                logger.exception(f"Error handling {event!r}: {e}")
@@ -0,0 +1,325 @@
+"""
+HLS manifest handling for LofiGirl Terminal.
+
+Live YouTube streams resolve to an HLS master playlist that lists one
+variant per quality. Given the master, mpv downloads it, probes the
+variants and picks the best one itself, which for audio-only sessions means
+fetching video segments nobody watches. This module parses the master
+playlist instead and picks the variant matching ``audio_quality``, so mpv
+can be handed that media playlist directly. The pick is remembered until
+the master URL expires, so cached stream URLs are not fetched again.
+"""
+
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.stream_cache import (
+    DEFAULT_TTL_SECONDS,
+    EXPIRY_SAFETY_MARGIN_SECONDS,
+    parse_expiry,
+)
+
+logger = get_logger(__name__)
+
+# Timeout for fetching a master playlist, in seconds
+PLAYLIST_TIMEOUT_SECONDS = 5.0
+
+# Idle connections kept open to the manifest servers
+MAX_KEEPALIVE_CONNECTIONS = 4
+
+# Variant picks remembered at most, across stations and quality tiers
+MAX_CACHED_SELECTIONS = 64
+
+# Codec prefixes that mark a variant as carrying video
+VIDEO_CODECS = ("avc1", "avc3", "hvc1", "hev1", "vp09", "vp9", "av01")
+
+# Caps per audio_quality, mirroring QUALITY_FORMATS in youtube_fetcher.
+# None means uncapped; a cap below every variant selects the smallest one.
+AUDIO_BANDWIDTH_CAPS: Dict[str, Optional[int]] = {
+    "low": 64_000,
+    "medium": 128_000,
+    "high": None,
+}
+# Audio-only sessions on streams without audio-only variants
+AUDIO_FALLBACK_HEIGHT_CAPS: Dict[str, Optional[int]] = {
+    "low": 0,
+    "medium": 480,
+    "high": None,
+}
+VIDEO_HEIGHT_CAPS: Dict[str, Optional[int]] = {
+    "low": 360,
+    "medium": 720,
+    "high": None,
+}
+
+_ATTRIBUTE_RE = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+
+
+@dataclass(frozen=True)
+class HlsVariant:
+    """
+    One playable rendition listed in a master playlist.
+
+    Attributes:
+        uri: Absolute URL of the media playlist
+        bandwidth: Peak bitrate in bits per second (0 if unknown)
+        codecs: Codec strings, e.g. ("mp4a.40.2", "avc1.4d401e")
+        height: Vertical resolution, None for audio-only variants
+    """
+
+    uri: str
+    bandwidth: int = 0
+    codecs: Tuple[str, ...] = ()
+    height: Optional[int] = None
+
+    @property
+    def audio_only(self) -> bool:
+        """Whether the variant declares codecs and none of them is video."""
+        return bool(self.codecs) and not any(
+            codec.startswith(VIDEO_CODECS) for codec in self.codecs
+        )
+
+
+@dataclass
+class MasterPlaylist:
+    """
+    Parsed HLS master playlist.
+
+    Attributes:
+        variants: Variant streams (#EXT-X-STREAM-INF)
+        audio_renditions: Separate audio renditions (#EXT-X-MEDIA)
+    """
+
+    variants: List[HlsVariant] = field(default_factory=list)
+    audio_renditions: List[HlsVariant] = field(default_factory=list)
+
+
+def is_hls_master_url(url: str) -> bool:
+    """
+    Check whether a URL points at an HLS master playlist.
+
+    Only URLs recognizable without a request qualify: YouTube's
+    ``/hls_variant/`` manifests and files named ``master.m3u8``.
+
+    Args:
+        url: Stream URL
+
+    Returns:
+        True if the URL is an HLS master playlist
+    """
+    path = urlsplit(url).path
+    return "/hls_variant/" in path or path.endswith("master.m3u8")
+
+
+def _parse_attributes(text: str) -> Dict[str, str]:
+    """Parse an HLS attribute list such as ``BANDWIDTH=1,CODECS="a,b"``."""
+    return {key: value.strip('"') for key, value in _ATTRIBUTE_RE.findall(text)}
+
+
+def parse_master_playlist(text: str, base_url: str) -> Optional[MasterPlaylist]:
+    """
+    Parse an HLS master playlist.
+
+    Args:
+        text: Playlist contents
+        base_url: URL the playlist was loaded from, for relative URIs
+
+    Returns:
+        MasterPlaylist, or None if the text is not a master playlist
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if not lines or lines[0] != "#EXTM3U":
+        return None
+
+    playlist = MasterPlaylist()
+    pending: Optional[Dict[str, str]] = None
+    for line in lines[1:]:
+        if line.startswith("#EXT-X-STREAM-INF:"):
+            pending = _parse_attributes(line.split(":", 1)[1])
+        elif line.startswith("#EXT-X-MEDIA:"):
+            attributes = _parse_attributes(line.split(":", 1)[1])
+            if attributes.get("TYPE") == "AUDIO" and attributes.get("URI"):
+                uri = urljoin(base_url, attributes["URI"])
+                playlist.audio_renditions.append(HlsVariant(uri=uri))
+        elif not line.startswith("#") and pending is not None:
+            resolution = pending.get("RESOLUTION", "")
+            height = resolution.split("x")[-1] if "x" in resolution else ""
+            playlist.variants.append(
+                HlsVariant(
+                    uri=urljoin(base_url, line),
+                    bandwidth=int(pending.get("BANDWIDTH", "0") or 0),
+                    codecs=tuple(
+                        codec.strip()
+                        for codec in pending.get("CODECS", "").split(",")
+                        if codec.strip()
+                    ),
+                    height=int(height) if height.isdigit() else None,
+                )
+            )
+            pending = None
+
+    return playlist if playlist.variants else None
+
+
+def _pick(
+    candidates: List[HlsVariant], cap: Optional[int], by_height: bool
+) -> HlsVariant:
+    """
+    Pick the best candidate within a cap, or the smallest one if none fits.
+
+    Among equally good candidates the lowest bandwidth wins, since smaller
+    segments start playing sooner.
+    """
+
+    def metric(variant: HlsVariant) -> int:
+        return (variant.height or 0) if by_height else variant.bandwidth
+
+    within = [v for v in candidates if cap is None or metric(v) <= cap]
+    if not within:
+        return min(candidates, key=lambda v: (metric(v), v.bandwidth))
+    return max(within, key=lambda v: (metric(v), -v.bandwidth))
+
+
+def select_variant(
+    playlist: MasterPlaylist, quality: str, audio_only: bool = True
+) -> HlsVariant:
+    """
+    Choose the variant for a quality tier.
+
+    Audio-only sessions use an audio-only variant when the playlist has one
+    and otherwise the smallest muxed variant allowed by the tier, like the
+    yt-dlp format selectors do. Separate audio renditions (#EXT-X-MEDIA)
+    carry no bandwidth to rank them by, so when they are the only
+    audio-only choice the first one listed is used for every tier.
+
+    Args:
+        playlist: Parsed master playlist
+        quality: Quality tier ("low", "medium" or "high")
+        audio_only: Whether video is not needed
+
+    Returns:
+        The selected variant
+    """
+    if audio_only:
+        audio = [v for v in playlist.variants if v.audio_only]
+        if audio:
+            return _pick(audio, AUDIO_BANDWIDTH_CAPS.get(quality), by_height=False)
+        if playlist.audio_renditions:
+            return playlist.audio_renditions[0]
+        height_cap = AUDIO_FALLBACK_HEIGHT_CAPS.get(quality)
+    else:
+        height_cap = VIDEO_HEIGHT_CAPS.get(quality)
+    return _pick(playlist.variants, height_cap, by_height=True)
+
+
+# Shared HTTP client, so manifest requests reuse pooled connections
+_client: Optional["httpx.Client"] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> "httpx.Client":
+    """
+    Get or create the shared HTTP client for manifest requests.
+
+    Returns:
+        httpx.Client with connection pooling
+
+    Raises:
+        RuntimeError: If httpx is not installed
+    """
+    global _client
+    if not HTTPX_AVAILABLE:
+        raise RuntimeError("httpx is not installed. Install it with: pip install httpx")
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                timeout=PLAYLIST_TIMEOUT_SECONDS,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                ),
+            )
+        return _client
+
+
+# Variant picks by (master URL, quality, audio_only): (expiry, media URL)
+_selections: Dict[Tuple[str, str, bool], Tuple[float, str]] = {}
+_selections_lock = threading.Lock()
+
+
+def _remember_selection(key: Tuple[str, str, bool], media_url: str) -> None:
+    """Remember a variant pick until its master URL expires."""
+    now = time.time()
+    expires_at = parse_expiry(key[0]) or now + DEFAULT_TTL_SECONDS
+    with _selections_lock:
+        for stale in [k for k, (expiry, _) in _selections.items() if expiry <= now]:
+            del _selections[stale]
+        while len(_selections) >= MAX_CACHED_SELECTIONS:
+            # Dicts keep insertion order; the oldest pick goes first
+            del _selections[next(iter(_selections))]
+        _selections[key] = (expires_at, media_url)
+
+
+def select_media_playlist(url: str, quality: str, audio_only: bool = True) -> str:
+    """
+    Replace an HLS master playlist URL with its matching media playlist.
+
+    Any other URL, or a master that cannot be fetched or parsed, is returned
+    unchanged so mpv can still open it. Picks are remembered per master URL
+    until it expires, so only the first call for a URL makes a request.
+
+    Args:
+        url: Resolved stream URL
+        quality: Quality tier ("low", "medium" or "high")
+        audio_only: Whether video is not needed
+
+    Returns:
+        URL to hand to mpv
+
+    Example:
+        >>> select_media_playlist(info.url, "low")
+        'https://manifest.googlevideo.com/api/manifest/hls_playlist/...'
+    """
+    if not HTTPX_AVAILABLE or not is_hls_master_url(url):
+        return url
+
+    key = (url, quality, audio_only)
+    with _selections_lock:
+        selection = _selections.get(key)
+    if selection is not None:
+        expires_at, media_url = selection
+        if time.time() < expires_at - EXPIRY_SAFETY_MARGIN_SECONDS:
+            return media_url
+
+    try:
+        response = get_http_client().get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning(f"Could not fetch HLS master playlist: {e}")
+        return url
+
+    playlist = parse_master_playlist(response.text, str(response.url))
+    if playlist is None:
+        logger.debug("Stream URL is not an HLS master playlist")
+        return url
+
+    variant = select_variant(playlist, quality, audio_only)
+    logger.info(
+        f"Selected HLS variant: {variant.bandwidth // 1000} kbps"
+        f"{f', {variant.height}p' if variant.height else ''}"
+        f"{', audio only' if variant.audio_only else ''}"
+    )
+    _remember_selection(key, variant.uri)
+    return variant.uri
@@ -0,0 +1,446 @@
+"""
+Live stream discovery for LofiGirl Terminal.
+
+Several stations point at a channel's streams tab (for example
+``https://www.youtube.com/@LofiGirl/streams``) rather than a single video.
+Resolving such a URL makes yt-dlp crawl the whole tab and play whatever
+comes first. This module lists the channel's current live streams once with
+a flat-playlist extraction, matches them to stations by title and genre, and
+caches the resulting ``watch?v=`` URLs on disk for a configurable TTL.
+"""
+
+import json
+import re
+import subprocess  # nosec B404 - subprocess is needed for yt-dlp integration
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from urllib.parse import urlsplit
+
+from lofigirl_terminal.config import get_config
+from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.stations import Station
+from lofigirl_terminal.modules.stream_cache import normalize_url, write_json_atomic
+
+logger = get_logger(__name__)
+
+DISCOVERY_FILE_NAME = "live_streams.json"
+
+# Default lifetime of a station-to-video mapping
+DEFAULT_DISCOVERY_TTL_SECONDS = 6 * 3600.0
+
+# How long a failed channel listing is remembered before it is retried
+FAILED_LISTING_RETRY_SECONDS = 60.0
+
+# Maximum number of channel entries inspected per listing
+MAX_LISTED_ENTRIES = 30
+
+# Channel URLs: /@handle, /channel/<id>, /c/<name> and /user/<name>
+_CHANNEL_PATH_RE = re.compile(r"^/(@[^/]+|channel/[^/]+|c/[^/]+|user/[^/]+)(/.*)?$")
+
+# Words too common in LofiGirl titles to tell streams apart
+_STOP_WORDS = {"lofi", "radio", "beats", "music", "live", "the", "and", "for", "to"}
+
+
+@dataclass
+class LiveStream:
+    """
+    A live stream listed on a channel.
+
+    Attributes:
+        video_id: YouTube video ID of the stream
+        title: Stream title
+    """
+
+    video_id: str
+    title: str
+
+    @property
+    def url(self) -> str:
+        """Return the canonical watch URL of the stream."""
+        return f"https://www.youtube.com/watch?v={self.video_id}"
+
+
+@dataclass
+class DiscoveryEntry:
+    """
+    A cached station-to-stream mapping.
+
+    Attributes:
+        url: Watch URL the station resolves to
+        expires_at: Unix timestamp after which discovery runs again
+    """
+
+    url: str
+    expires_at: float
+
+
+def is_channel_url(url: str) -> bool:
+    """
+    Check if a URL points at a YouTube channel rather than a video.
+
+    Args:
+        url: URL to check
+
+    Returns:
+        True for channel URLs such as ``https://www.youtube.com/@LofiGirl/streams``
+    """
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host not in ("youtube.com", "www.youtube.com", "m.youtube.com"):
+        return False
+    return _CHANNEL_PATH_RE.match(parts.path) is not None
+
+
+def streams_tab_url(channel_url: str) -> str:
+    """
+    Get the URL of a channel's streams tab.
+
+    Args:
+        channel_url: Any URL of the channel
+
+    Returns:
+        The channel's ``/streams`` URL
+    """
+    parts = urlsplit(normalize_url(channel_url))
+    match = _CHANNEL_PATH_RE.match(parts.path)
+    channel = match.group(1) if match else parts.path.strip("/")
+    return f"https://www.youtube.com/{channel}/streams"
+
+
+def station_key(station: Station) -> str:
+    """
+    Get a key that is equal for stations resolving to the same stream.
+
+    Stations sharing a video URL play the same stream. Stations sharing a
+    channel URL do not, since discovery maps each of them separately.
+
+    Args:
+        station: Station to identify
+
+    Returns:
+        The station ID for channel URLs, otherwise the normalized URL
+    """
+    return station.id if is_channel_url(station.url) else normalize_url(station.url)
+
+
+def _keywords(text: str) -> Set[str]:
+    """Return the distinctive lowercase words of a title or genre."""
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    return {word for word in words if len(word) > 1 and word not in _STOP_WORDS}
+
+
+def match_stream(
+    station: Station, streams: Sequence[LiveStream]
+) -> Optional[LiveStream]:
+    """
+    Pick the live stream that best matches a station.
+
+    Streams are scored by how many of the station's name and genre keywords
+    appear in their title; genre keywords count double.
+
+    Args:
+        station: Station to match
+        streams: Live streams currently listed on the channel
+
+    Returns:
+        The best matching stream, or None if no stream shares a keyword
+
+    Example:
+        >>> match_stream(synthwave_station, streams).title
+        'synthwave radio 🌌 beats to chill/game to'
+    """
+    name_words = _keywords(station.name)
+    genre_words = _keywords(station.genre.replace("-", " "))
+
+    best: Optional[LiveStream] = None
+    best_score = 0
+    for stream in streams:
+        title_words = _keywords(stream.title)
+        score = len(name_words & title_words) + 2 * len(genre_words & title_words)
+        if score > best_score:
+            best, best_score = stream, score
+    return best
+
+
+def parse_flat_playlist(stdout: str) -> List[LiveStream]:
+    """
+    Parse ``yt-dlp --flat-playlist --dump-json`` output into live streams.
+
+    Entries that report a live status other than ``is_live`` (finished or
+    upcoming streams) are skipped. Older yt-dlp versions report no live
+    status in flat mode; their entries are all kept.
+
+    Args:
+        stdout: One JSON object per line
+
+    Returns:
+        Live streams in channel order
+    """
+    streams: List[LiveStream] = []
+    for line in stdout.splitlines():
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+
+        live_status = entry.get("live_status")
+        if live_status is not None and live_status != "is_live":
+            continue
+        if entry.get("id") and entry.get("title"):
+            streams.append(LiveStream(video_id=entry["id"], title=entry["title"]))
+    return streams
+
+
+def list_live_streams(channel_url: str) -> Optional[List[LiveStream]]:
+    """
+    List the live streams of a channel with a flat-playlist extraction.
+
+    Only the streams tab itself is fetched; yt-dlp does not visit the
+    individual videos.
+
+    Args:
+        channel_url: Any URL of the channel
+
+    Returns:
+        Live streams on the channel, or None if the listing failed
+    """
+    cmd = [
+        "yt-dlp",
+        "--flat-playlist",
+        "--dump-json",
+        "--no-warnings",
+        "--quiet",
+        "--playlist-end",
+        str(MAX_LISTED_ENTRIES),
+        streams_tab_url(channel_url),
+    ]
+    try:
+        # Safe: command is built from a list, not shell=True
+        result = subprocess.run(  # nosec B603
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=get_config().connection_timeout,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        logger.error(f"Timeout while listing live streams of {channel_url}")
+        return None
+    except OSError as e:
+        logger.error(f"Failed to run yt-dlp: {e}")
+        return None
+
+    if result.returncode != 0:
+        logger.error(f"Failed to list live streams: {result.stderr}")
+        return None
+
+    streams = parse_flat_playlist(result.stdout)
+    logger.info(f"Found {len(streams)} live streams on {channel_url}")
+    return streams
+
+
+class LiveDiscovery:
+    """
+    Maps channel-URL stations to concrete live stream URLs.
+
+    Mappings are persisted to a JSON file and reused until they expire. Each
+    channel is listed at most once per TTL, however many stations share it,
+    and a failed listing is only retried after FAILED_LISTING_RETRY_SECONDS.
+    """
+
+    def __init__(
+        self,
+        cache_file: Path,
+        ttl: float = DEFAULT_DISCOVERY_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize live stream discovery.
+
+        Args:
+            cache_file: Path of the JSON file used for persistence
+            ttl: Lifetime of station mappings and channel listings in seconds
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._entries: Dict[str, DiscoveryEntry] = {}
+        # Streams tab URL -> (expiry, streams or None if the listing failed)
+        self._listings: Dict[str, Tuple[float, Optional[List[LiveStream]]]] = {}
+        # Listings in progress, so concurrent lookups list a channel once
+        self._inflight: Dict[str, "Future[Optional[List[LiveStream]]]"] = {}
+        self._loaded = False
+        # Guards the state above; listings run without holding it
+        self._lock = threading.RLock()
+
+    def source_url(self, station: Station) -> str:
+        """
+        Get the URL that should be resolved for a station.
+
+        Stations pointing at a channel are mapped to the matching live
+        stream; all other stations, and channel stations without a match,
+        keep their own URL.
+
+        Args:
+            station: Station to resolve
+
+        Returns:
+            A ``watch?v=`` URL for matched channel stations, else station.url
+
+        Example:
+            >>> get_live_discovery().source_url(station)
+            'https://www.youtube.com/watch?v=...'
+        """
+        if not is_channel_url(station.url):
+            return station.url
+
+        key = self._key(station)
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.time():
+                return entry.url
+
+        streams = self._listing(station.url)
+        stream = match_stream(station, streams) if streams else None
+        if stream is None:
+            logger.warning(f"No live stream found for {station.name}")
+            return station.url
+
+        with self._lock:
+            self._entries[key] = DiscoveryEntry(
+                url=stream.url, expires_at=time.time() + self.ttl
+            )
+            self._save()
+
+        logger.info(f"Discovered live stream for {station.name}: {stream.title}")
+        return stream.url
+
+    def invalidate(self, station: Station) -> bool:
+        """
+        Forget the mapping of a station, e.g. after its stream ended.
+
+        Args:
+            station: Station whose mapping is dropped
+
+        Returns:
+            True if a mapping was removed, False if not found
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self._listings.pop(streams_tab_url(station.url), None)
+            if self._entries.pop(self._key(station), None) is None:
+                return False
+            self._save()
+            return True
+
+    @staticmethod
+    def _key(station: Station) -> str:
+        """Return the mapping key of a station."""
+        return f"{streams_tab_url(station.url)}|{station.id}"
+
+    def _listing(self, channel_url: str) -> Optional[List[LiveStream]]:
+        """
+        Return the channel's live streams, listing it at most once per TTL.
+
+        Concurrent callers for the same channel share one listing.
+        """
+        tab_url = streams_tab_url(channel_url)
+        with self._lock:
+            listed = self._listings.get(tab_url)
+            if listed is not None and listed[0] > time.time():
+                return listed[1]
+            flight = self._inflight.get(tab_url)
+            if flight is None:
+                owner: "Future[Optional[List[LiveStream]]]" = Future()
+                self._inflight[tab_url] = owner
+        if flight is not None:
+            return flight.result()
+
+        streams: Optional[List[LiveStream]] = None
+        try:
+            streams = list_live_streams(tab_url)
+        finally:
+            lifetime = (
+                self.ttl
+                if streams is not None
+                else min(self.ttl, FAILED_LISTING_RETRY_SECONDS)
+            )
+            with self._lock:
+                self._listings[tab_url] = (time.time() + lifetime, streams)
+                del self._inflight[tab_url]
+            owner.set_result(streams)
+        return streams
+
+    def _ensure_loaded(self) -> None:
+        """Load mappings from disk once, discarding expired or corrupt ones."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.cache_file.exists():
+            return
+
+        try:
+            raw: Dict[str, Dict] = json.loads(self.cache_file.read_text("utf-8"))
+            now = time.time()
+            for key, data in raw.items():
+                entry = DiscoveryEntry(**data)
+                if entry.expires_at > now:
+                    self._entries[key] = entry
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(
+                f"Ignoring unreadable discovery cache {self.cache_file}: {e}"
+            )
+            self._entries.clear()
+
+    def _save(self) -> None:
+        """Write mappings to disk atomically."""
+        try:
+            data = {key: asdict(entry) for key, entry in self._entries.items()}
+            write_json_atomic(self.cache_file, data)
+        except OSError as e:
+            logger.warning(f"Failed to persist live stream discovery: {e}")
+
+
+# Cached discovery instance
+_live_discovery: Optional[LiveDiscovery] = None
+
+
+def get_live_discovery() -> LiveDiscovery:
+    """
+    Get or create the global LiveDiscovery instance.
+
+    The mapping file lives in ``config.audio_cache_dir``.
+
+    Returns:
+        LiveDiscovery instance
+    """
+    global _live_discovery
+    if _live_discovery is None:
+        config = get_config()
+        _live_discovery = LiveDiscovery(
+            cache_file=config.audio_cache_dir / DISCOVERY_FILE_NAME,
+            ttl=config.live_discovery_ttl,
+        )
+    return _live_discovery
+
+
+def station_source_url(station: Station) -> str:
+    """
+    Get the URL to resolve for a station, honouring the configuration.
+
+    Args:
+        station: Station to resolve
+
+    Returns:
+        The discovered live stream URL when discovery is enabled and the
+        station points at a channel, otherwise station.url
+    """
+    if not get_config().live_discovery_enabled or not is_channel_url(station.url):
+        return station.url
+    return get_live_discovery().source_url(station)
@@ -6,8 +6,13 @@ It supports YouTube streams via yt-dlp integration and provides full
 playback control.
 """
 
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 try:
     import mpv
@@ -18,11 +23,59 @@ except ImportError:
 
 from lofigirl_terminal.config import get_config
 from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.cache_profiles import (
+    current_rss_bytes,
+    format_bytes,
+    get_cache_profile,
+)
+from lofigirl_terminal.modules.hls import select_media_playlist
+from lofigirl_terminal.modules.live_discovery import station_source_url
+from lofigirl_terminal.modules.refresh import StreamRefreshScheduler
+from lofigirl_terminal.modules.resolvers import (
+    StreamResolver,
+    YtDlpResolver,
+    get_resolver,
+)
 from lofigirl_terminal.modules.stations import Station
-from lofigirl_terminal.modules.youtube_fetcher import get_fetcher
+from lofigirl_terminal.modules.youtube_fetcher import (
+    StreamInfo,
+    YouTubeFetcher,
+    get_format_selector,
+    is_youtube_url,
+)
 
 logger = get_logger(__name__)
 
+# Upper bound for waiting on mpv to terminate when the player is closed
+SHUTDOWN_TIMEOUT_SECONDS = 2.0
+
+# Label of the audio filter that ramps a core's volume during a crossfade
+CROSSFADE_FILTER_LABEL = "crossfade"
+
+
+def _fade_filter(direction: str, seconds: float) -> str:
+    """
+    Build an mpv audio filter that ramps the volume in or out.
+
+    The ramp is evaluated by ffmpeg per audio frame, starting from the first
+    frame the filter sees, so no polling is needed to drive it.
+
+    Args:
+        direction: "in" or "out"
+        seconds: Length of the ramp
+
+    Returns:
+        Value for mpv's ``af`` property
+    """
+    progress = f"(t-startt)/{seconds:g}"
+    if direction == "in":
+        expression = f"min(1,{progress})"
+    else:
+        expression = f"max(0,1-{progress})"
+    return (
+        f"@{CROSSFADE_FILTER_LABEL}:" f"lavfi=[volume=volume='{expression}':eval=frame]"
+    )
+
 
 class PlayerState(Enum):
     """
@@ -45,12 +98,131 @@ class PlayerState(Enum):
     ERROR = "error"
 
 
+def _terminate_cores(cores: Sequence["mpv.MPV"]) -> None:
+    """
+    Terminate mpv cores; runs on the teardown thread.
+
+    Args:
+        cores: Cores to terminate
+    """
+    for core in cores:
+        try:
+            core.terminate()
+        except Exception:  # nosec B110
+            # Intentionally ignore errors during cleanup
+            pass
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Run an event loop until it is stopped, then close it."""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+async def _cancel_tasks() -> None:
+    """Cancel the other tasks of the running loop, then stop it."""
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    asyncio.get_running_loop().stop()
+
+
+# mpv properties mirrored into PlayerSnapshot, by snapshot field
+SNAPSHOT_PROPERTIES: Dict[str, str] = {
+    "time-pos": "time_pos",
+    "duration": "duration",
+    "volume": "volume",
+    "mute": "muted",
+    "audio-bitrate": "bitrate",
+    "demuxer-cache-state": "cache_bytes",
+    "demuxer-cache-duration": "cache_duration",
+    "cache-buffering-state": "buffering_percent",
+    "cache-speed": "cache_speed",
+    "paused-for-cache": "buffering",
+    "eof-reached": "eof_reached",
+}
+
+
+@dataclass(frozen=True)
+class PlayerSnapshot:
+    """
+    Immutable view of mpv's playback properties.
+
+    mpv pushes property changes to observers on its event thread, which
+    replace the player's snapshot as a whole. Reading it is a plain
+    attribute access, so UI code never waits on libmpv.
+
+    Attributes:
+        time_pos: Playback position in seconds
+        duration: Stream duration in seconds, None for live streams
+        paused: Whether mpv is paused
+        volume: mpv volume (0-100)
+        muted: Whether mpv is muted
+        cache_bytes: Bytes held in the demuxer cache
+        cache_duration: Seconds of media held ahead in the cache
+        bitrate: Audio bitrate in bits per second
+        buffering: Whether playback is paused because the cache ran dry
+        buffering_percent: Cache fill while buffering (0-100)
+        cache_speed: Network throughput into the cache, in bytes per second
+        stalls: Rebuffering events since the player was created
+        stall_seconds: Total time spent rebuffering, in seconds
+        eof_reached: Whether the stream has ended; with keep-open mpv then
+                     pauses instead of stopping
+    """
+
+    time_pos: Optional[float] = None
+    duration: Optional[float] = None
+    paused: bool = False
+    volume: Optional[float] = None
+    muted: bool = False
+    cache_bytes: Optional[int] = None
+    cache_duration: Optional[float] = None
+    bitrate: Optional[float] = None
+    buffering: bool = False
+    buffering_percent: Optional[int] = None
+    cache_speed: Optional[float] = None
+    stalls: int = 0
+    stall_seconds: float = 0.0
+    eof_reached: bool = False
+
+    def describe_health(self) -> str:
+        """
+        Summarize cache health for display.
+
+        Returns:
+            e.g. "cache 12s · 48 KiB/s · 2 stalls (3.4s)"
+        """
+        parts = []
+        if self.buffering:
+            percent = self.buffering_percent
+            parts.append(
+                f"buffering {percent}%" if percent is not None else "buffering"
+            )
+        elif self.cache_duration is not None:
+            parts.append(f"cache {self.cache_duration:.0f}s")
+        if self.cache_speed:
+            parts.append(f"{format_bytes(int(self.cache_speed))}/s")
+        if self.stalls:
+            label = "stall" if self.stalls == 1 else "stalls"
+            parts.append(f"{self.stalls} {label} ({self.stall_seconds:.1f}s)")
+        return " · ".join(parts)
+
+
+# States in which mpv is playing a stream, possibly waiting for data
+ACTIVE_STATES = (PlayerState.PLAYING, PlayerState.BUFFERING)
+
+
 class MPVPlayer:
     """
     Real audio/video player using python-mpv.
 
     This player can stream YouTube videos/audio using yt-dlp integration
     and provides full control over playback, volume, seeking, etc.
+    Use it as a context manager, or call cleanup(), to release mpv.
 
     Attributes:
         state: Current player state
@@ -58,6 +230,7 @@ class MPVPlayer:
         muted: Whether audio is muted
         current_station: Currently loaded station
         is_video_mode: Whether playing video or audio-only
+        cache_profile: Effective mpv cache limits
     """
 
     def __init__(self, video_mode: bool = False) -> None:
@@ -77,17 +250,48 @@ class MPVPlayer:
 
         self.config = get_config()
         self.state: PlayerState = PlayerState.STOPPED
+        # Serializes state transitions and their callbacks across threads
+        self._state_lock = threading.RLock()
         self.volume: int = self.config.default_volume
         self.muted: bool = False
         self.current_station: Optional[Station] = None
         self.is_video_mode: bool = video_mode
+        self.cache_profile = get_cache_profile(
+            self.config.cache_profile, self.config.stream_buffer_size, video_mode
+        )
         self._mpv: Optional[mpv.MPV] = None
         self._stream_url: Optional[str] = None
         self._on_state_change: Optional[Callable[[PlayerState], None]] = None
+        self._neighbor_stations: List[Station] = []
+        self._refresher: Optional[StreamRefreshScheduler] = None
+        # Station loads run as tasks on their own event loop, so a newer load
+        # cancels the one it supersedes; blocking work goes to the executor
+        self._load_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._load_executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="station-load"
+        )
+        self._load_lock = threading.Lock()
+        self._load_generation = 0
+        self._load_future: Optional["Future[bool]"] = None
+        self._play_when_loaded = False
+        self._fetch_stream = True
+        # Mirror of mpv's playlist as (station ID, URL); index 0 is playing
+        self._queued: List[Tuple[str, str]] = []
+        # Whether the current core is producing sound, so a switch can fade
+        self._audible = False
+        # Replaced, never mutated, by mpv's property observers
+        self._snapshot = PlayerSnapshot()
+        self._snapshot_lock = threading.Lock()
+        # Start of the rebuffering event in progress (monotonic clock)
+        self._stall_started: Optional[float] = None
+        # Core fading out during a crossfade, and the timer releasing it
+        self._outgoing: Optional[mpv.MPV] = None
+        self._release_timer: Optional[threading.Timer] = None
+        self._closed = False
 
         logger.info(f"MPVPlayer initialized (video_mode={video_mode})")
 
-    def _init_mpv(self) -> None:  # noqa: C901
+    def _init_mpv(self) -> None:
         """
         Initialize the mpv player instance.
 
@@ -96,23 +300,49 @@ class MPVPlayer:
         if self._mpv is not None:
             return
 
+        self._mpv = self._create_mpv()
+        logger.info("MPV instance initialized successfully")
+
+    def _create_mpv(self) -> "mpv.MPV":  # noqa: C901
+        """
+        Create an mpv core with the player's options and event observers.
+
+        Events from a core that is no longer the player's current one (a core
+        fading out during a crossfade) are ignored.
+
+        Raises:
+            RuntimeError: If mpv fails to initialize or the player is closed
+        """
+        if self._closed:
+            raise RuntimeError("Player has been closed")
         try:
             logger.debug("Initializing mpv instance...")
 
             # MPV options
-            mpv_options = {
+            mpv_options: Dict[str, object] = {
                 "ytdl": True,  # Enable yt-dlp integration
+                # Same quality tier as the fetcher when mpv resolves itself
+                "ytdl_format": get_format_selector(
+                    self.config.audio_quality, not self.is_video_mode
+                ),
                 "volume": self.volume,
-                "cache": True,
-                "cache_secs": 30,
-                "demuxer_max_bytes": "50M",
-                "demuxer_max_back_bytes": "30M",
+                **self.cache_profile.mpv_options(),
                 # Silence output to prevent UI interference
                 "terminal": False,  # Don't use terminal output
                 "msg_level": "all=no",  # Disable all messages
                 "quiet": True,  # Quiet mode
             }
 
+            if self.config.playlist_prefetch_enabled:
+                # Neighbouring stations are queued in mpv's playlist; never
+                # advance into them on our own, only on a station switch
+                mpv_options.update(
+                    {
+                        "prefetch_playlist": True,
+                        "keep_open": "always",
+                    }
+                )
+
             if not self.is_video_mode:
                 # Audio-only mode
                 mpv_options.update(
@@ -130,59 +360,193 @@ class MPVPlayer:
                     }
                 )
 
-            self._mpv = mpv.MPV(**mpv_options)
+            core = mpv.MPV(**mpv_options)
 
             # Set up event observers
-            @self._mpv.property_observer("pause")
+            @core.property_observer("pause")
             def on_pause_change(_name: str, value: bool) -> None:
+                if core is not self._mpv:
+                    return
+                self._update_snapshot(paused=bool(value))
                 if value:
                     self._update_state(PlayerState.PAUSED)
-                elif self.state != PlayerState.STOPPED:
-                    self._update_state(PlayerState.PLAYING)
+                else:
+                    self._update_state(
+                        PlayerState.PLAYING, only_from=(PlayerState.PAUSED,)
+                    )
 
-            @self._mpv.event_callback("start-file")
+            @core.event_callback("start-file")
             def on_start_file(_event: dict) -> None:
+                if core is not self._mpv:
+                    return
+                self._end_stall()
+                self._update_snapshot(
+                    buffering=False,
+                    buffering_percent=None,
+                    time_pos=None,
+                    duration=None,
+                    cache_bytes=None,
+                    cache_duration=None,
+                    bitrate=None,
+                    eof_reached=False,
+                )
                 self._update_state(PlayerState.LOADING)
                 logger.debug("Stream loading...")
 
-            @self._mpv.event_callback("file-loaded")
+            @core.event_callback("file-loaded")
             def on_file_loaded(_event: dict) -> None:
+                if core is not self._mpv:
+                    return
                 self._update_state(PlayerState.PLAYING)
                 logger.info("Stream loaded and playing")
+                logger.debug(f"Cache: {self.describe_cache()}")
+
+            def on_property_change(name: str, value: Any) -> None:
+                if core is self._mpv:
+                    self._on_property_change(name, value)
+
+            for name in SNAPSHOT_PROPERTIES:
+                core.observe_property(name, on_property_change)
 
-            @self._mpv.event_callback("end-file")
+            @core.event_callback("playback-restart")
+            def on_playback_restart(_event: dict) -> None:
+                if core is self._mpv:
+                    # The incoming stream is audible: fade out the old one
+                    self._fade_out_outgoing()
+
+            @core.event_callback("end-file")
             def on_end_file(event: dict) -> None:
+                if core is not self._mpv:
+                    return
                 reason = event.get("reason", "unknown")
                 logger.debug(f"Stream ended: {reason}")
                 if reason == "error":
+                    self._audible = False
+                    self._release_outgoing()
                     self._update_state(PlayerState.ERROR)
                 elif reason != "stop":
                     self._update_state(PlayerState.STOPPED)
 
-            logger.info("MPV instance initialized successfully")
+            return core
 
         except Exception as e:
             logger.exception(f"Failed to initialize mpv: {e}")
-            self._mpv = None
             raise RuntimeError(f"Failed to initialize mpv: {e}")
 
-    def _update_state(self, new_state: PlayerState) -> None:
-        """Update player state and notify callbacks."""
-        old_state = self.state
-        self.state = new_state
+    def _on_property_change(self, name: str, value: Any) -> None:
+        """Mirror an observed mpv property into the snapshot."""
+        if name == "paused-for-cache":
+            self._on_paused_for_cache(bool(value))
+        elif name == "eof-reached":
+            # None while no file is loaded
+            self._update_snapshot(eof_reached=bool(value))
+        elif name == "demuxer-cache-state":
+            cache_state = value if isinstance(value, dict) else {}
+            total = cache_state.get("total-bytes")
+            self._update_snapshot(cache_bytes=int(total) if total is not None else None)
+        elif name in SNAPSHOT_PROPERTIES:
+            self._update_snapshot(**{SNAPSHOT_PROPERTIES[name]: value})
+
+    def _on_paused_for_cache(self, paused: bool) -> None:
+        """Enter or leave BUFFERING as mpv's cache runs dry or refills."""
+        if not paused:
+            self._update_snapshot(buffering=False, buffering_percent=None)
+            self._end_stall()
+            self._update_state(PlayerState.PLAYING, only_from=(PlayerState.BUFFERING,))
+            return
 
-        if old_state != new_state:
-            logger.debug(f"State changed: {old_state.value} -> {new_state.value}")
-            if self._on_state_change:
-                try:
-                    self._on_state_change(new_state)
-                except Exception as e:
-                    logger.exception(f"Error in state change callback: {e}")
+        if self._stall_started is not None or not self._update_state(
+            PlayerState.BUFFERING, only_from=(PlayerState.PLAYING,)
+        ):
+            # Initial buffering of a new stream is part of LOADING
+            self._update_snapshot(buffering=True)
+            return
+
+        self._stall_started = time.monotonic()
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            self._snapshot = replace(
+                snapshot, buffering=True, stalls=snapshot.stalls + 1
+            )
+        logger.warning(
+            f"Buffering: cache ran dry (stall #{snapshot.stalls + 1}, "
+            f"{self._snapshot.describe_health() or 'no throughput data'})"
+        )
+
+    def _end_stall(self) -> None:
+        """Record the duration of the rebuffering event in progress."""
+        started, self._stall_started = self._stall_started, None
+        if started is None:
+            return
+        stalled = time.monotonic() - started
+        with self._snapshot_lock:
+            self._snapshot = replace(
+                self._snapshot, stall_seconds=self._snapshot.stall_seconds + stalled
+            )
+        logger.info(
+            f"Playback resumed after {stalled:.1f}s of buffering "
+            f"({self._snapshot.describe_health()})"
+        )
+
+    def _update_snapshot(self, **changes: Any) -> None:
+        """Replace the snapshot with one carrying the given changes."""
+        with self._snapshot_lock:
+            self._snapshot = replace(self._snapshot, **changes)
+
+    def get_snapshot(self) -> PlayerSnapshot:
+        """
+        Get the latest playback properties reported by mpv.
+
+        Safe to call from any thread; it never calls into libmpv.
+
+        Returns:
+            Current PlayerSnapshot
+        """
+        return self._snapshot
+
+    def _update_state(
+        self,
+        new_state: PlayerState,
+        only_from: Optional[Tuple[PlayerState, ...]] = None,
+    ) -> bool:
+        """
+        Update player state and notify callbacks.
+
+        Transitions from mpv's event thread, loader threads and the UI are
+        applied one at a time, and callbacks see them in the same order.
+
+        Args:
+            new_state: State to enter
+            only_from: If given, only leave one of these states; checked
+                       atomically with the update
+
+        Returns:
+            True if the state was updated
+        """
+        with self._state_lock:
+            old_state = self.state
+            if only_from is not None and old_state not in only_from:
+                return False
+            self.state = new_state
+
+            if old_state != new_state:
+                logger.debug(f"State changed: {old_state.value} -> {new_state.value}")
+                if self._on_state_change:
+                    try:
+                        self._on_state_change(new_state)
+                    except Exception as e:
+                        logger.exception(f"Error in state change callback: {e}")
+            return True
 
     def set_state_callback(self, callback: Callable[[PlayerState], None]) -> None:
         """
         Set a callback to be called when player state changes.
 
+        The callback runs on whichever thread changed the state, often
+        libmpv's event thread, while transitions are serialized. It must
+        return quickly and must not touch UI widgets; hand the state to the
+        UI thread instead, e.g. with an EventBridge.
+
         Args:
             callback: Function that takes PlayerState as argument
         """
@@ -192,45 +556,417 @@ class MPVPlayer:
         """
         Load a station for playback.
 
+        This blocks while the stream is resolved, which can take seconds;
+        interactive callers should use load_station_async() instead.
+
         Args:
             station: The Station object to load
-            fetch_stream: If True, fetch actual stream URL using yt-dlp
+            fetch_stream: If True, resolve the stream URL with the configured
+                          resolver; otherwise mpv resolves YouTube URLs itself
 
         Raises:
             ValueError: If station URL is invalid
             RuntimeError: If failed to fetch stream URL
         """
+        generation = self._begin_load(station, False, fetch_stream)
+        url = self._resolve_stream_url(station, fetch_stream)
+        self._finish_load(generation, station, url)
+
+    def load_station_async(
+        self, station: Station, fetch_stream: bool = True, auto_play: bool = False
+    ) -> "Future[bool]":
+        """
+        Load a station without blocking the caller.
+
+        The player enters PlayerState.LOADING right away and the stream is
+        resolved in the background. When it is ready the player moves to
+        PLAYING (with auto_play, or if play() was called meanwhile) or
+        STOPPED, firing the state callback from a background thread. A newer
+        load supersedes this one: a resolve still in progress is cancelled,
+        which kills its yt-dlp process, and a finished one is discarded.
+
+        Args:
+            station: The Station object to load
+            fetch_stream: If True, resolve the stream URL with the configured
+                          resolver; otherwise mpv resolves YouTube URLs itself
+            auto_play: Start playback as soon as the station is loaded
+
+        Returns:
+            Future resolving to True once the station is loaded, or to False
+            if a newer load superseded it after it resolved. It is cancelled
+            if superseded while resolving, and raises the load's error
+            (ValueError or RuntimeError) if loading failed.
+
+        Example:
+            >>> future = player.load_station_async(station, auto_play=True)
+            >>> future.add_done_callback(on_loaded)
+        """
+        if auto_play and self._switch_to_queued(station, fetch_stream):
+            done: "Future[bool]" = Future()
+            done.set_result(True)
+            return done
+
+        generation = self._begin_load(station, auto_play, fetch_stream)
+        loop = self._get_load_loop()
+        with self._load_lock:
+            self._cancel_pending_load()
+            future = asyncio.run_coroutine_threadsafe(
+                self._load(generation, station, fetch_stream), loop
+            )
+            self._load_future = future
+        return future
+
+    def _cancel_pending_load(self) -> None:
+        """
+        Cancel a load still resolving, killing its yt-dlp process.
+
+        Must be called with ``_load_lock`` held.
+        """
+        if self._load_future is not None:
+            self._load_future.cancel()
+            self._load_future = None
+
+    def _get_load_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop running station loads on first use."""
+        with self._load_lock:
+            if self._load_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=_run_loop, args=(loop,), name="station-load", daemon=True
+                ).start()
+                self._load_loop = loop
+            return self._load_loop
+
+    def _begin_load(
+        self, station: Station, auto_play: bool, fetch_stream: bool = True
+    ) -> int:
+        """
+        Make a station current and enter the LOADING state.
+
+        Returns:
+            Generation number identifying this load
+        """
         if not station.url:
             raise ValueError("Station URL cannot be empty")
 
         self._init_mpv()
 
-        self.current_station = station
-        self.state = PlayerState.LOADING
+        with self._load_lock:
+            self._load_generation += 1
+            generation = self._load_generation
+            self._play_when_loaded = auto_play
+            self._fetch_stream = fetch_stream
+            self.current_station = station
+            self._stream_url = None
         logger.info(f"Loading station: {station.name}")
+        self._update_state(PlayerState.LOADING)
+        return generation
 
-        # For YouTube URLs, fetch the actual stream URL
-        if "youtube.com" in station.url or "youtu.be" in station.url:
-            if fetch_stream:
-                logger.info("Fetching stream URL from YouTube...")
-                fetcher = get_fetcher(prefer_audio_only=not self.is_video_mode)
+    async def _load(
+        self, generation: int, station: Station, fetch_stream: bool
+    ) -> bool:
+        """Resolve and commit a load; runs on the load loop."""
+        try:
+            url = await self._resolve_stream_url_async(station, fetch_stream)
+        except Exception:
+            if generation == self._load_generation:
+                self._update_state(PlayerState.ERROR)
+            raise
+
+        if not self._finish_load(generation, station, url):
+            return False
+        if self._play_when_loaded:
+            self.play()
+        else:
+            # The previous station must not keep playing while STOPPED
+            self._halt_playback()
+            self._update_state(PlayerState.STOPPED)
+        return True
 
-                if not fetcher.check_yt_dlp_installed():
-                    raise RuntimeError(
-                        "yt-dlp is not installed. Install it with: pip install yt-dlp"
-                    )
+    def _switch_to_queued(self, station: Station, fetch_stream: bool) -> bool:
+        """
+        Jump to a station already queued in mpv's playlist.
 
-                stream_url = fetcher.get_stream_url(station.url)
-                if not stream_url:
-                    raise RuntimeError(f"Failed to fetch stream URL for {station.name}")
+        Returns:
+            True if the station was queued and is now playing
+        """
+        with self._load_lock:
+            ids = [station_id for station_id, _url in self._queued]
+            if (
+                self._mpv is None
+                or fetch_stream != self._fetch_stream
+                or station.id not in ids[1:]
+            ):
+                return False
+            index = ids.index(station.id)
+            url = self._queued[index][1]
+            crossfade = self._should_crossfade()
+            self._cancel_pending_load()
+            self._load_generation += 1
+            self._play_when_loaded = False
+            self.current_station = station
+            self._stream_url = url
+            if not crossfade:
+                self._mpv.playlist_pos = index
+
+        if crossfade:
+            # The fade needs a second core; it gets its own queue
+            self._crossfade_to(url)
+            self._queued = [(station.id, url)]
+        logger.info(f"Switched to queued station: {station.name}")
+        self._update_state(PlayerState.PLAYING)
+        self._schedule_queue()
+        return True
+
+    def _schedule_queue(self) -> None:
+        """Queue the neighbouring stations behind the current one in mpv."""
+        if not self.config.playlist_prefetch_enabled or not self._neighbor_stations:
+            return
+        with self._load_lock:
+            if self._closed:
+                return
+            generation = self._load_generation
+        try:
+            self._load_executor.submit(self._queue_neighbors, generation)
+        except RuntimeError:
+            # The player was cleaned up
+            pass
+
+    def _queue_neighbors(self, generation: int) -> None:
+        """Resolve the neighbours and replace mpv's queued entries with them."""
+        current = self.current_station
+        if current is None or self._closed:
+            return
 
-                self._stream_url = stream_url
-                logger.info(f"Got stream URL: {stream_url[:50]}...")
-            else:
-                # Let mpv handle it with ytdl
-                self._stream_url = station.url
-        else:
-            self._stream_url = station.url
+        # The next station directly follows the current one, so it is the
+        # entry mpv prefetches
+        entries: List[Tuple[str, str]] = []
+        for station in reversed(self._neighbor_stations):
+            if station.id == current.id:
+                continue
+            try:
+                url = self._resolve_stream_url(station, self._fetch_stream)
+            except Exception as e:
+                logger.debug(f"Not queueing {station.name}: {e}")
+                continue
+            entries.append((station.id, url))
+
+        with self._load_lock:
+            if (
+                generation != self._load_generation
+                or self._mpv is None
+                or self._stream_url is None
+                or self.state not in (*ACTIVE_STATES, PlayerState.LOADING)
+            ):
+                return
+            # Removes every entry except the one playing
+            self._mpv.playlist_clear()
+            for _station_id, url in entries:
+                self._mpv.loadfile(url, "append")
+            self._queued = [(current.id, self._stream_url), *entries]
+        logger.debug(f"Queued {len(entries)} neighbouring station(s) in mpv")
+
+    def _finish_load(self, generation: int, station: Station, url: str) -> bool:
+        """
+        Adopt a resolved stream URL unless a newer load started meanwhile.
+
+        Returns:
+            True if the URL was adopted
+        """
+        with self._load_lock:
+            if generation != self._load_generation:
+                logger.debug(f"Discarding superseded load of {station.name}")
+                return False
+            self._stream_url = url
+        return True
+
+    def _resolve_stream_url(
+        self, station: Station, fetch_stream: bool, bypass_cache: bool = False
+    ) -> str:
+        """
+        Get the URL mpv should open for a station.
+
+        Raises:
+            RuntimeError: If failed to fetch stream URL
+        """
+        if not fetch_stream:
+            if is_youtube_url(station.url):
+                # Let mpv handle it with ytdl; channel URLs are narrowed down
+                # to the station's live stream
+                return station_source_url(station)
+            return station.url
+
+        resolver = get_resolver(prefer_audio_only=not self.is_video_mode)
+        started = time.perf_counter()
+        stream_info = resolver.resolve_station(station, bypass_cache=bypass_cache)
+        return self._adopt_resolution(resolver, station, stream_info, started)
+
+    async def _resolve_stream_url_async(
+        self, station: Station, fetch_stream: bool
+    ) -> str:
+        """
+        Get the URL mpv should open for a station without blocking the loop.
+
+        yt-dlp resolutions are awaited, so cancelling this kills yt-dlp.
+        Other resolvers block and run on the load executor.
+
+        Raises:
+            RuntimeError: If failed to fetch stream URL
+        """
+        loop = asyncio.get_running_loop()
+        resolver = get_resolver(prefer_audio_only=not self.is_video_mode)
+        if not fetch_stream or not isinstance(resolver, YtDlpResolver):
+            return await loop.run_in_executor(
+                self._load_executor, self._resolve_stream_url, station, fetch_stream
+            )
+
+        started = time.perf_counter()
+        stream_info = await resolver.resolve_station_async(station)
+        # Variant selection may fetch the master playlist
+        return await loop.run_in_executor(
+            self._load_executor,
+            self._adopt_resolution,
+            resolver,
+            station,
+            stream_info,
+            started,
+        )
+
+    def _adopt_resolution(
+        self,
+        resolver: StreamResolver,
+        station: Station,
+        stream_info: Optional[StreamInfo],
+        started: float,
+    ) -> str:
+        """
+        Turn a resolver's result into the URL mpv should open.
+
+        Raises:
+            RuntimeError: If the station did not resolve
+        """
+        if stream_info is None:
+            # Failing stations are retried in the background
+            retry_in = resolver.retry_in(station)
+            hint = f" (retrying in {retry_in:.0f}s)" if retry_in else ""
+            raise RuntimeError(f"Failed to fetch stream URL for {station.name}{hint}")
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"Resolved {station.name} via {resolver.name} in {elapsed_ms:.0f}ms"
+        )
+        logger.debug(f"Stream URL: {stream_info.url[:50]}...")
+        if isinstance(resolver, YtDlpResolver):
+            self._track_refresh(resolver.fetcher)
+        return self._select_variant(stream_info.url)
+
+    def reconnect(self) -> bool:
+        """
+        Re-resolve the current station and restart its playback.
+
+        Used when a stream stalls or fails: cached URLs are bypassed, since
+        the one in use is likely the one that stopped working. This blocks
+        while the station resolves.
+
+        Returns:
+            True if playback restarted, False if there is no station or a
+            station change superseded the reconnect
+
+        Raises:
+            RuntimeError: If the station cannot be resolved or played
+        """
+        station = self.current_station
+        if station is None:
+            return False
+        with self._load_lock:
+            generation = self._load_generation
+
+        logger.warning(f"Reconnecting to {station.name}")
+        url = self._resolve_stream_url(station, self._fetch_stream, bypass_cache=True)
+        if not self._finish_load(generation, station, url):
+            return False
+        # Nothing left to fade out of a dead stream
+        self._audible = False
+        if self.state == PlayerState.PAUSED:
+            # mpv pauses at the end of a kept-open stream; resuming would
+            # only unpause the ended file, so start the new URL instead
+            if self._mpv:
+                self._mpv.pause = False
+            self._update_state(PlayerState.STOPPED)
+        self.play()
+        return True
+
+    def set_neighbor_stations(self, stations: Sequence[Station]) -> None:
+        """
+        Tell the player which stations are adjacent to the current one.
+
+        Their stream URLs are kept fresh alongside the current station's,
+        and once the current station plays they are queued in mpv's playlist
+        so that switching to them is a playlist jump.
+
+        Args:
+            stations: Neighbouring stations, typically previous and next
+        """
+        self._neighbor_stations = list(stations)
+        refresher = self._refresher
+        if refresher is not None and self.current_station is not None:
+            refresher.track([self.current_station, *self._neighbor_stations])
+
+    def _select_variant(self, url: str) -> str:
+        """Narrow an HLS master playlist down to the variant to play."""
+        if not self.config.hls_variant_selection:
+            return url
+        return select_media_playlist(
+            url, self.config.audio_quality, audio_only=not self.is_video_mode
+        )
+
+    def _track_refresh(self, fetcher: YouTubeFetcher) -> None:
+        """Keep the current station and its neighbours' URLs fresh."""
+        if not self.config.stream_refresh_enabled or fetcher.cache is None:
+            return
+        if self.current_station is None:
+            return
+
+        with self._load_lock:
+            if self._closed:
+                # A load that outlived cleanup() must not start a new thread
+                return
+            if self._refresher is None:
+                self._refresher = StreamRefreshScheduler(
+                    fetcher, on_refresh=self._on_stream_refreshed
+                )
+                self._refresher.start()
+            refresher = self._refresher
+        refresher.track([self.current_station, *self._neighbor_stations])
+
+    def _on_stream_refreshed(self, station: Station, stream_info: StreamInfo) -> None:
+        """
+        Adopt a refreshed URL for the current or a queued station.
+
+        The fresh URL is used by the next play(). While playing it is only
+        handed to mpv immediately when ``stream_refresh_hot_swap`` is set,
+        since reopening a live stream costs a short rebuffer. Queued
+        neighbours are re-queued with their fresh URLs.
+        """
+        if self.current_station is None:
+            return
+        if station.id != self.current_station.id:
+            if any(queued_id == station.id for queued_id, _url in self._queued[1:]):
+                self._schedule_queue()
+            return
+
+        self._stream_url = self._select_variant(stream_info.url)
+        logger.info(f"Refreshed stream URL for {station.name}")
+
+        if (
+            self.config.stream_refresh_hot_swap
+            and self.state == PlayerState.PLAYING
+            and self._mpv
+        ):
+            logger.info("Hot-swapping refreshed stream URL into mpv")
+            self._mpv.loadfile(self._stream_url, "replace")
+            self._queued = [(station.id, self._stream_url)]
+            self._schedule_queue()
 
     def play(self) -> None:
         """
@@ -244,39 +980,160 @@ class MPVPlayer:
 
         self._init_mpv()
 
+        with self._load_lock:
+            if self._stream_url is None and self.state == PlayerState.LOADING:
+                # Still resolving; the pending load starts playback
+                self._play_when_loaded = True
+                logger.info("Playback will start once the station is loaded")
+                return
+
         if self.state == PlayerState.PAUSED:
             # Resume from pause
             logger.info("Resuming playback")
             if self._mpv:
                 self._mpv.pause = False
+                self._audible = True
         else:
             # Start playback
             logger.info(f"Starting playback: {self.current_station.name}")
             if self._mpv and self._stream_url:
                 try:
-                    self._mpv.play(self._stream_url)
+                    if self._should_crossfade():
+                        self._crossfade_to(self._stream_url)
+                    else:
+                        self._mpv.play(self._stream_url)
+                    self._audible = True
+                    self._queued = [(self.current_station.id, self._stream_url)]
                     self._update_state(PlayerState.PLAYING)
+                    self._schedule_queue()
                 except Exception as e:
                     logger.exception(f"Failed to start playback: {e}")
                     self._update_state(PlayerState.ERROR)
                     raise RuntimeError(f"Failed to start playback: {e}")
 
+    def _should_crossfade(self) -> bool:
+        """Whether starting a new stream should fade from the current one."""
+        # A second core would open a second video window
+        return (
+            self.config.crossfade_enabled
+            and not self.is_video_mode
+            and self._audible
+            and self._mpv is not None
+        )
+
+    def _crossfade_to(self, url: str) -> None:
+        """
+        Start a URL on a second mpv core while the current one keeps playing.
+
+        The incoming core fades in from its first audio frame. The outgoing
+        core keeps playing at full volume until then, fades out over the same
+        window once the incoming stream is audible, and is terminated when
+        the fade ends. At most two cores exist at once: an earlier crossfade
+        still in progress is cut short.
+
+        Args:
+            url: Stream URL to start
+        """
+        # Bounds the overlap to two cores
+        self._release_outgoing()
+
+        seconds = self.config.crossfade_seconds
+        incoming = self._create_mpv()
+        incoming.af = _fade_filter("in", seconds)
+        with self._load_lock:
+            self._outgoing = self._mpv
+            self._mpv = incoming
+        incoming.mute = self.muted
+        logger.info(f"Crossfading to new stream over {seconds:g}s")
+        incoming.play(url)
+
+    def _fade_out_outgoing(self) -> None:
+        """Fade out the outgoing core and schedule its release."""
+        seconds = self.config.crossfade_seconds
+        with self._load_lock:
+            outgoing = self._outgoing
+            if outgoing is None or self._release_timer is not None:
+                return
+            timer = threading.Timer(seconds, self._release_outgoing)
+            timer.daemon = True
+            self._release_timer = timer
+
+        try:
+            outgoing.af = _fade_filter("out", seconds)
+        except Exception as e:
+            # Cut instead of fading
+            logger.debug(f"Could not fade out previous stream: {e}")
+            timer.cancel()
+            self._release_outgoing()
+            return
+        timer.start()
+
+    def _release_outgoing(self) -> None:
+        """
+        Silence and terminate the core left over from a crossfade, if any.
+
+        Terminating waits for mpv to shut down, so it runs on a background
+        thread rather than the caller's, which may be the UI thread.
+        """
+        with self._load_lock:
+            outgoing, self._outgoing = self._outgoing, None
+            timer, self._release_timer = self._release_timer, None
+        if timer is not None:
+            timer.cancel()
+        if outgoing is not None:
+            logger.debug("Releasing previous mpv instance")
+            try:
+                outgoing.mute = True
+            except Exception:  # nosec B110
+                # Terminating silences it as well
+                pass
+            threading.Thread(
+                target=_terminate_cores,
+                args=([outgoing],),
+                name="mpv-release",
+                daemon=True,
+            ).start()
+
     def pause(self) -> None:
         """Pause playback."""
-        if self.state == PlayerState.PLAYING and self._mpv:
+        if self.state in ACTIVE_STATES and self._mpv:
             logger.info("Pausing playback")
             self._mpv.pause = True
+            self._audible = False
+            # A fading-out stream would otherwise play on
+            self._release_outgoing()
 
     def stop(self) -> None:
-        """Stop playback."""
-        if self.state in (PlayerState.PLAYING, PlayerState.PAUSED) and self._mpv:
+        """Stop playback, or cancel a station load still in progress."""
+        with self._load_lock:
+            loading = self.state == PlayerState.LOADING and self._stream_url is None
+            if loading:
+                self._cancel_pending_load()
+                # A resolve that finishes anyway is discarded
+                self._load_generation += 1
+                self._play_when_loaded = False
+        if loading:
+            logger.info("Cancelling station load")
+            self._halt_playback()
+            self._update_state(PlayerState.STOPPED)
+        elif self.state in (*ACTIVE_STATES, PlayerState.PAUSED) and self._mpv:
             logger.info("Stopping playback")
-            self._mpv.stop()
+            self._halt_playback()
             self._update_state(PlayerState.STOPPED)
 
+    def _halt_playback(self) -> None:
+        """Stop mpv and drop its queue; the caller sets the state."""
+        if self._mpv:
+            self._mpv.stop()
+        self._queued = []
+        self._audible = False
+        self._release_outgoing()
+        self._end_stall()
+        self._update_snapshot(buffering=False, buffering_percent=None)
+
     def toggle_pause(self) -> None:
         """Toggle between play and pause."""
-        if self.state == PlayerState.PLAYING:
+        if self.state in ACTIVE_STATES:
             self.pause()
         elif self.state == PlayerState.PAUSED:
             self.play()
@@ -297,8 +1154,8 @@ class MPVPlayer:
         self.volume = volume
         logger.debug(f"Volume set to {volume}")
 
-        if self._mpv:
-            self._mpv.volume = volume
+        for core in self._cores():
+            core.volume = volume
 
     def get_volume(self) -> int:
         """
@@ -334,17 +1191,37 @@ class MPVPlayer:
         self.muted = not self.muted
         logger.debug(f"Mute: {self.muted}")
 
-        if self._mpv:
-            self._mpv.mute = self.muted
+        for core in self._cores():
+            core.mute = self.muted
+
+    def _cores(self) -> List["mpv.MPV"]:
+        """Get the current core and, during a crossfade, the outgoing one."""
+        with self._load_lock:
+            return [core for core in (self._mpv, self._outgoing) if core]
 
     def is_playing(self) -> bool:
         """
         Check if player is currently playing.
 
         Returns:
-            True if playing, False otherwise
+            True if playing or rebuffering, False otherwise
+        """
+        return self.state in ACTIVE_STATES
+
+    def wants_playback(self) -> bool:
+        """
+        Check if the player is playing or about to.
+
+        Unlike is_playing(), this includes a station load that will start
+        playback once it is ready, so a second station change during a load
+        keeps playing.
+
+        Returns:
+            True if playing, rebuffering or loading a station to play
         """
-        return self.state == PlayerState.PLAYING
+        return self.is_playing() or (
+            self.state == PlayerState.LOADING and self._play_when_loaded
+        )
 
     def get_state(self) -> PlayerState:
         """
@@ -362,12 +1239,9 @@ class MPVPlayer:
         Returns:
             Current position in seconds, or None if not playing
         """
-        if self._mpv and self.state in (PlayerState.PLAYING, PlayerState.PAUSED):
-            try:
-                pos = self._mpv.time_pos
-                return float(pos) if pos is not None else None
-            except Exception:
-                return None
+        if self.state in (*ACTIVE_STATES, PlayerState.PAUSED):
+            pos = self._snapshot.time_pos
+            return float(pos) if pos is not None else None
         return None
 
     def get_duration(self) -> Optional[float]:
@@ -377,12 +1251,9 @@ class MPVPlayer:
         Returns:
             Duration in seconds, or None if unavailable (e.g., live stream)
         """
-        if self._mpv and self.state in (PlayerState.PLAYING, PlayerState.PAUSED):
-            try:
-                dur = self._mpv.duration
-                return float(dur) if dur is not None else None
-            except Exception:
-                return None
+        if self.state in (*ACTIVE_STATES, PlayerState.PAUSED):
+            dur = self._snapshot.duration
+            return float(dur) if dur is not None else None
         return None
 
     def is_live_stream(self) -> bool:
@@ -396,27 +1267,111 @@ class MPVPlayer:
         duration = self.get_duration()
         return duration is None or duration == 0
 
-    def cleanup(self) -> None:
+    def get_cache_report(self) -> Dict[str, Optional[int]]:
         """
-        Clean up player resources.
+        Get the effective cache limits next to the actual memory use.
 
-        Should be called when the player is no longer needed.
+        Returns:
+            Dictionary with the limits ("max_bytes", "max_back_bytes",
+            "cache_secs"), the bytes mpv currently holds ("cached_bytes",
+            None if not playing) and the process RSS ("rss_bytes", None if
+            unknown)
         """
-        logger.info("Cleaning up player...")
-        self.stop()
+        cached = self._snapshot.cache_bytes if self._mpv else None
+        return {
+            "max_bytes": self.cache_profile.max_bytes,
+            "max_back_bytes": self.cache_profile.max_back_bytes,
+            "cache_secs": self.cache_profile.cache_secs,
+            "cached_bytes": cached,
+            "rss_bytes": current_rss_bytes(),
+        }
+
+    def describe_cache(self) -> str:
+        """
+        Summarize get_cache_report() in one line.
 
-        if self._mpv:
-            try:
-                self._mpv.terminate()
-            except Exception:  # nosec B110
-                # Intentionally ignore errors during cleanup
-                pass
+        Returns:
+            Profile limits, cached bytes and RSS, e.g.
+            "balanced (audio): ... | cached 1.2 MiB | RSS 80.3 MiB"
+        """
+        report = self.get_cache_report()
+        parts = [self.cache_profile.describe()]
+        if report["cached_bytes"] is not None:
+            parts.append(f"cached {format_bytes(report['cached_bytes'])}")
+        if report["rss_bytes"] is not None:
+            parts.append(f"RSS {format_bytes(report['rss_bytes'])}")
+        return " | ".join(parts)
+
+    def cleanup(self, timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> bool:
+        """
+        Release the player's resources.
+
+        Only the first call does anything, so it is safe to call again (or
+        to leave a ``with`` block after an explicit call). The mpv cores are
+        terminated on a background thread and waiting for them is bounded by
+        ``timeout``: a core still draining its stream is left to finish on
+        its own instead of holding up the caller.
+
+        Args:
+            timeout: Seconds to wait for mpv to terminate
+
+        Returns:
+            True if mpv terminated within the timeout
+        """
+        started = time.monotonic()
+        with self._load_lock:
+            if self._closed:
+                return True
+            self._closed = True
+            # Any load still running is discarded when it finishes
+            self._load_generation += 1
+            # Detached cores are ignored by their own event callbacks
+            cores = [core for core in (self._mpv, self._outgoing) if core]
             self._mpv = None
+            self._outgoing = None
+            timer, self._release_timer = self._release_timer, None
+            refresher, self._refresher = self._refresher, None
+
+        logger.info("Cleaning up player...")
+        if timer is not None:
+            timer.cancel()
+        if self._load_loop is not None:
+            asyncio.run_coroutine_threadsafe(_cancel_tasks(), self._load_loop)
+        self._load_executor.shutdown(wait=False)
+        if refresher is not None:
+            refresher.stop()
+        self._queued = []
+        self._audible = False
+        self._end_stall()
+        self._update_snapshot(buffering=False, buffering_percent=None)
+        self._update_state(PlayerState.STOPPED)
+
+        teardown = threading.Thread(
+            target=_terminate_cores,
+            args=(cores,),
+            name="mpv-teardown",
+            daemon=True,
+        )
+        teardown.start()
+        teardown.join(timeout)
+        elapsed = time.monotonic() - started
+        if teardown.is_alive():
+            logger.warning(
+                f"mpv did not terminate within {timeout:g}s, "
+                "leaving it to finish in the background"
+            )
+            return False
 
+        logger.debug(f"Player closed in {elapsed * 1000:.0f} ms")
         logger.info("Player cleanup complete")
+        return True
+
+    def __enter__(self) -> "MPVPlayer":
+        """Use the player as a context manager that closes it on exit."""
+        return self
 
-    def __del__(self) -> None:
-        """Destructor to ensure cleanup."""
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the player."""
         self.cleanup()
 
 
@@ -0,0 +1,171 @@
+"""
+Station pre-resolution for LofiGirl Terminal.
+
+This module resolves station stream URLs in the background at startup so
+that later station switches find them in the stream cache instead of
+waiting on yt-dlp. Stations closest to the current one are resolved first.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from lofigirl_terminal.config import get_config
+from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.live_discovery import station_key, station_source_url
+from lofigirl_terminal.modules.resolvers import YT_DLP_BACKENDS
+from lofigirl_terminal.modules.stations import Station
+from lofigirl_terminal.modules.youtube_fetcher import (
+    StreamInfo,
+    YouTubeFetcher,
+    is_youtube_url,
+)
+
+logger = get_logger(__name__)
+
+
+def prioritize_stations(
+    stations: Sequence[Station], current_index: int
+) -> List[Station]:
+    """
+    Order stations by distance from the current one.
+
+    The current station comes first, then its next and previous neighbours,
+    and so on around the station ring. Stations that share a video URL are
+    only listed once; stations sharing a channel URL are kept, since live
+    discovery maps each of them to its own stream.
+
+    Args:
+        stations: All stations in display order
+        current_index: Index of the currently selected station
+
+    Returns:
+        Stations in resolution priority order
+
+    Example:
+        >>> [s.id for s in prioritize_stations(stations, 0)]
+        ['lofi-hip-hop', 'lofi-sleep', 'lofi-jazz', 'synthwave']
+    """
+    count = len(stations)
+    ordered: List[Station] = []
+    seen_urls = set()
+
+    for distance in range(count):
+        for offset in (distance, -distance):
+            station = stations[(current_index + offset) % count]
+            url = station_key(station)
+            if url not in seen_urls:
+                seen_urls.add(url)
+                ordered.append(station)
+
+    return ordered
+
+
+class StationPrefetcher:
+    """
+    Resolves stations on a bounded thread pool to warm the stream cache.
+
+    Attributes:
+        fetcher: Fetcher used for resolution (its cache receives the results)
+        max_workers: Maximum number of concurrent resolutions
+    """
+
+    def __init__(self, fetcher: YouTubeFetcher, max_workers: int = 2) -> None:
+        """
+        Initialize the prefetcher.
+
+        Args:
+            fetcher: Fetcher used for resolution
+            max_workers: Maximum number of concurrent resolutions
+        """
+        self.fetcher = fetcher
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: List["Future[Optional[StreamInfo]]"] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(
+        self, stations: Sequence[Station], current_index: int = 0
+    ) -> List["Future[Optional[StreamInfo]]"]:
+        """
+        Queue every YouTube station for background resolution.
+
+        Args:
+            stations: All stations in display order
+            current_index: Index of the currently selected station
+
+        Returns:
+            Futures for the queued resolutions, in priority order
+        """
+        targets = [
+            s
+            for s in prioritize_stations(stations, current_index)
+            if is_youtube_url(s.url)
+        ]
+
+        with self._lock:
+            if self._closed:
+                return []
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="prefetch"
+                )
+            futures = [
+                self._executor.submit(self._resolve, station) for station in targets
+            ]
+            self._futures.extend(futures)
+
+        logger.info(f"Prefetching {len(futures)} stations in the background")
+        return futures
+
+    def shutdown(self) -> None:
+        """Cancel queued resolutions and release the thread pool."""
+        with self._lock:
+            self._closed = True
+            for future in self._futures:
+                future.cancel()
+            self._futures.clear()
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+            logger.debug("Station prefetcher shut down")
+
+    def _resolve(self, station: Station) -> Optional[StreamInfo]:
+        """Resolve one station; failures are logged and never raised."""
+        try:
+            stream_info = self.fetcher.resolve(station_source_url(station))
+            if stream_info:
+                logger.debug(f"Prefetched station: {station.name}")
+            return stream_info
+        except Exception as e:
+            logger.warning(f"Prefetch failed for {station.name}: {e}")
+            return None
+
+
+def start_prefetch(
+    fetcher: YouTubeFetcher, stations: Sequence[Station], current_index: int = 0
+) -> Optional[StationPrefetcher]:
+    """
+    Start background pre-resolution if enabled in the configuration.
+
+    Args:
+        fetcher: Fetcher used for resolution
+        stations: All stations in display order
+        current_index: Index of the currently selected station
+
+    Returns:
+        The running StationPrefetcher, or None if prefetching is disabled
+        or the resolver backend does not use yt-dlp
+    """
+    config = get_config()
+    if not config.prefetch_enabled:
+        return None
+    if config.resolver_backend not in YT_DLP_BACKENDS:
+        # Only yt-dlp resolutions are slow enough to be worth warming
+        return None
+
+    prefetcher = StationPrefetcher(fetcher, max_workers=config.prefetch_workers)
+    prefetcher.start(stations, current_index)
+    return prefetcher
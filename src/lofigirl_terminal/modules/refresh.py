@@ -0,0 +1,176 @@
+"""
+Proactive stream URL refresh for LofiGirl Terminal.
+
+Resolved googlevideo URLs expire after a few hours. This module runs a
+background scheduler that re-resolves the current station and its
+neighbours shortly before their cached URLs expire, so a reconnect or
+station switch during a long listening session never waits on yt-dlp.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.live_discovery import station_key, station_source_url
+from lofigirl_terminal.modules.stations import Station
+from lofigirl_terminal.modules.stream_cache import EXPIRY_SAFETY_MARGIN_SECONDS
+from lofigirl_terminal.modules.youtube_fetcher import (
+    StreamInfo,
+    YouTubeFetcher,
+    is_youtube_url,
+)
+
+logger = get_logger(__name__)
+
+# How long before the cache would drop a URL it is refreshed
+REFRESH_LEAD_SECONDS = 600.0
+
+# Wait before retrying a station whose refresh failed
+RETRY_DELAY_SECONDS = 60.0
+
+# Bounds for the scheduler's sleep between checks
+MIN_SLEEP_SECONDS = 1.0
+MAX_SLEEP_SECONDS = 600.0
+
+
+class StreamRefreshScheduler:
+    """
+    Keeps the cached URLs of the tracked stations fresh.
+
+    The first tracked station is the one currently playing; the refreshed
+    StreamInfo for every station is passed to ``on_refresh`` so the player
+    can pick up the new URL.
+    """
+
+    def __init__(
+        self,
+        fetcher: YouTubeFetcher,
+        on_refresh: Optional[Callable[[Station, StreamInfo], None]] = None,
+        lead_seconds: float = REFRESH_LEAD_SECONDS,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            fetcher: Fetcher whose cache is kept fresh
+            on_refresh: Called with each station and its fresh StreamInfo
+            lead_seconds: How long before cache expiry to refresh
+        """
+        self.fetcher = fetcher
+        self.on_refresh = on_refresh
+        self.lead_seconds = lead_seconds
+        self._stations: List[Station] = []
+        self._retry_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, stations: Sequence[Station]) -> None:
+        """
+        Set the stations to keep fresh and wake the scheduler.
+
+        Args:
+            stations: Current station first, then its neighbours. Stations
+                      that are not YouTube URLs or share a video URL are
+                      skipped.
+        """
+        tracked: List[Station] = []
+        seen = set()
+        for station in stations:
+            url = station_key(station)
+            if is_youtube_url(station.url) and url not in seen:
+                seen.add(url)
+                tracked.append(station)
+
+        with self._lock:
+            self._stations = tracked
+        logger.debug(f"Refresh scheduler tracking {[s.id for s in tracked]}")
+        self._wake.set()
+
+    def start(self) -> None:
+        """Start the background refresh thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # A fresh event per thread so a stopped thread can never be revived
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stopped,), name="stream-refresh", daemon=True
+        )
+        self._thread.start()
+        logger.debug("Stream refresh scheduler started")
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stopped.set()
+        self._wake.set()
+        self._thread = None
+        logger.debug("Stream refresh scheduler stopped")
+
+    def refresh_due(self, now: Optional[float] = None) -> float:
+        """
+        Refresh every tracked station that is close to expiry.
+
+        Args:
+            now: Current Unix timestamp (defaults to time.time())
+
+        Returns:
+            Seconds until the next station becomes due
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            stations = list(self._stations)
+
+        next_due = now + MAX_SLEEP_SECONDS
+        for station in stations:
+            if self._stopped.is_set():
+                break
+            due_at = self._due_at(station, now)
+            if due_at <= now:
+                due_at = self._refresh(station, now)
+            next_due = min(next_due, due_at)
+
+        return max(MIN_SLEEP_SECONDS, next_due - now)
+
+    def _due_at(self, station: Station, now: float) -> float:
+        """Return when a station's cached URL should be refreshed."""
+        retry_at = self._retry_at.get(station.id)
+        if retry_at is not None and retry_at > now:
+            return retry_at
+
+        expires_at = self.fetcher.get_cached_expiry(station_source_url(station))
+        if expires_at is None:
+            return now
+        return expires_at - EXPIRY_SAFETY_MARGIN_SECONDS - self.lead_seconds
+
+    def _refresh(self, station: Station, now: float) -> float:
+        """Re-resolve a station and return when it is next due."""
+        logger.info(f"Refreshing stream URL for {station.name}")
+        try:
+            stream_info = self.fetcher.resolve(
+                station_source_url(station), bypass_cache=True
+            )
+        except Exception as e:
+            logger.warning(f"Stream refresh failed for {station.name}: {e}")
+            stream_info = None
+
+        if stream_info is None:
+            self._retry_at[station.id] = now + RETRY_DELAY_SECONDS
+            return self._retry_at[station.id]
+
+        self._retry_at.pop(station.id, None)
+        if self.on_refresh is not None:
+            try:
+                self.on_refresh(station, stream_info)
+            except Exception as e:
+                logger.exception(f"Error in stream refresh callback: {e}")
+        # Short-lived URLs must not turn into a refresh loop
+        return max(self._due_at(station, time.time()), now + RETRY_DELAY_SECONDS)
+
+    def _run(self, stopped: threading.Event) -> None:
+        """Background loop: refresh due stations, then sleep until the next."""
+        while not stopped.is_set():
+            delay = self.refresh_due()
+            self._wake.wait(timeout=delay)
+            self._wake.clear()
@@ -0,0 +1,217 @@
+"""
+Shared resolver daemon for LofiGirl Terminal.
+
+``lofigirl resolverd`` runs this server. It owns the yt-dlp engine and the
+stream URL cache and answers resolve requests from every lofigirl instance
+on the machine over a Unix socket (see resolverd_client for the protocol),
+so streams are resolved once no matter how many terminals play them.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from lofigirl_terminal import __version__
+from lofigirl_terminal.config import get_config
+from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.resolvers import YT_DLP_BACKENDS
+from lofigirl_terminal.modules.resolverd_client import (
+    ResolverClient,
+    default_socket_path,
+    encode_message,
+)
+from lofigirl_terminal.modules.youtube_fetcher import YouTubeFetcher, is_youtube_url
+
+logger = get_logger(__name__)
+
+# Socket permissions: owner only, or everyone for a machine-wide daemon
+PRIVATE_SOCKET_MODE = 0o600
+SHARED_SOCKET_MODE = 0o666
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers JSON-line requests on one client connection."""
+
+    server: "_ResolverServer"
+
+    def handle(self) -> None:
+        """Serve requests until the client disconnects."""
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                response = self.server.daemon.handle_request(request)
+            except ValueError:
+                response = {"ok": False, "error": "invalid request"}
+            self.wfile.write(encode_message(response))
+            self.wfile.flush()
+
+
+class _ResolverServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server bound to a ResolverDaemon."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, daemon: "ResolverDaemon") -> None:
+        self.daemon = daemon
+        super().__init__(socket_path, _RequestHandler)
+
+
+class ResolverDaemon:
+    """
+    Serves stream resolutions to other lofigirl processes.
+
+    One YouTubeFetcher is kept per (audio-only, quality) combination. They
+    share the stream cache and the in-process engine, and never forward
+    requests to a daemon themselves.
+
+    Attributes:
+        socket_path: Path of the Unix socket
+        shared: Whether other users may connect
+    """
+
+    def __init__(self, socket_path: Path, shared: bool = False) -> None:
+        """
+        Initialize the daemon.
+
+        Args:
+            socket_path: Path of the Unix socket
+            shared: Allow every user on the machine to connect
+        """
+        self.socket_path = socket_path
+        self.shared = shared
+        self._fetchers: Dict[Tuple[bool, str], YouTubeFetcher] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[_ResolverServer] = None
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Answer one protocol request.
+
+        Only YouTube URLs are resolved, so a shared daemon cannot be used to
+        make yt-dlp fetch arbitrary URLs.
+
+        Args:
+            request: Decoded request message
+
+        Returns:
+            Response message
+        """
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "version": __version__}
+        if op != "resolve":
+            return {"ok": False, "error": f"unknown op: {op}"}
+
+        url = request.get("url")
+        if not isinstance(url, str) or not is_youtube_url(url):
+            return {"ok": False, "error": "only YouTube URLs are resolved"}
+
+        fetcher = self._fetcher(
+            bool(request.get("audio_only", True)),
+            str(request.get("quality") or get_config().audio_quality),
+        )
+        try:
+            stream_info = fetcher.resolve(
+                url, bypass_cache=bool(request.get("bypass_cache", False))
+            )
+        except Exception as e:
+            logger.exception(f"Error resolving {url}: {e}")
+            return {"ok": False, "error": str(e)}
+
+        if stream_info is None:
+            return {"ok": False, "error": "resolution failed"}
+        return {"ok": True, "info": asdict(stream_info)}
+
+    def serve_forever(self) -> None:
+        """
+        Bind the socket and serve requests until shutdown() is called.
+
+        Raises:
+            RuntimeError: If another daemon is already listening
+        """
+        self._claim_socket()
+        self._server = _ResolverServer(str(self.socket_path), self)
+        os.chmod(
+            self.socket_path, SHARED_SOCKET_MODE if self.shared else PRIVATE_SOCKET_MODE
+        )
+        logger.info(f"Resolver daemon listening on {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._remove_socket()
+            logger.info("Resolver daemon stopped")
+
+    def shutdown(self) -> None:
+        """Stop serving; serve_forever() returns once pending work ends."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _fetcher(self, audio_only: bool, quality: str) -> YouTubeFetcher:
+        """Get the fetcher for a mode and quality tier."""
+        key = (audio_only, quality)
+        with self._lock:
+            fetcher = self._fetchers.get(key)
+            if fetcher is None:
+                backend = get_config().resolver_backend
+                fetcher = YouTubeFetcher(
+                    prefer_audio_only=audio_only,
+                    quality=quality,
+                    backend=backend if backend in YT_DLP_BACKENDS else "auto",
+                )
+                self._fetchers[key] = fetcher
+            return fetcher
+
+    def _claim_socket(self) -> None:
+        """Remove a stale socket file, refusing if a daemon is still alive."""
+        if not self.socket_path.exists():
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            return
+        if ResolverClient(self.socket_path, timeout=1).ping():
+            raise RuntimeError(
+                f"A resolver daemon is already running on {self.socket_path}"
+            )
+        logger.debug(f"Removing stale socket {self.socket_path}")
+        self.socket_path.unlink()
+
+    def _remove_socket(self) -> None:
+        """Delete the socket file."""
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            pass
+
+
+def run_resolverd(socket_path: Optional[Path] = None, shared: bool = False) -> None:
+    """
+    Run the resolver daemon in the foreground until interrupted.
+
+    Args:
+        socket_path: Socket to listen on. Defaults to ``config.resolverd_socket``
+                     or the per-user default path.
+        shared: Allow every user on the machine to connect
+
+    Raises:
+        RuntimeError: If Unix sockets are unsupported or a daemon is running
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("The resolver daemon needs Unix socket support")
+
+    path = socket_path or get_config().resolverd_socket or default_socket_path()
+    daemon = ResolverDaemon(path, shared=shared)
+
+    def _stop(_signum: int, _frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    # Treat SIGTERM like Ctrl+C so the socket file is removed on exit
+    signal.signal(signal.SIGTERM, _stop)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,230 @@
+"""
+Client for the shared resolver daemon of LofiGirl Terminal.
+
+``lofigirl resolverd`` serves stream resolutions over a local Unix socket so
+that several terminal instances share one yt-dlp engine and one URL cache.
+This module holds the wire protocol and the client used by YouTubeFetcher;
+when no daemon is listening the client raises ResolverUnavailable and the
+fetcher resolves locally instead.
+
+Protocol: one JSON object per line in each direction. Requests carry an
+``op`` ("ping" or "resolve"); responses carry ``ok`` and either the result
+or an ``error`` message.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from lofigirl_terminal.config import get_config
+from lofigirl_terminal.logger import get_logger
+
+logger = get_logger(__name__)
+
+SOCKET_NAME = "lofigirl-resolverd.sock"
+
+# Time allowed to connect to the daemon before falling back
+CONNECT_TIMEOUT_SECONDS = 0.5
+
+# Unix sockets are unavailable on some platforms (e.g. older Windows)
+UNIX_SOCKETS_AVAILABLE = hasattr(socket, "AF_UNIX")
+
+
+class ResolverUnavailable(Exception):
+    """Raised when no resolver daemon is listening on the socket."""
+
+
+def default_socket_path() -> Path:
+    """
+    Get the default socket path of the resolver daemon.
+
+    Uses ``$XDG_RUNTIME_DIR`` when set, otherwise a per-user file in the
+    system temporary directory.
+
+    Returns:
+        Path of the Unix socket
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / SOCKET_NAME
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(tempfile.gettempdir()) / f"lofigirl-resolverd-{uid}.sock"
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode a protocol message as a JSON line."""
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+class ResolverClient:
+    """
+    Sends resolve requests to a running resolver daemon.
+
+    Attributes:
+        socket_path: Path of the daemon's Unix socket
+        timeout: Maximum time to wait for a response, in seconds
+    """
+
+    def __init__(self, socket_path: Path, timeout: float) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            socket_path: Path of the daemon's Unix socket
+            timeout: Maximum time to wait for a response, in seconds
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def ping(self) -> bool:
+        """
+        Check whether a daemon is listening.
+
+        Returns:
+            True if the daemon answered
+        """
+        try:
+            return bool(self._request({"op": "ping"}).get("ok"))
+        except (ResolverUnavailable, OSError, ValueError):
+            return False
+
+    def extract(
+        self,
+        url: str,
+        audio_only: bool,
+        quality: str,
+        bypass_cache: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a URL through the daemon.
+
+        Args:
+            url: The YouTube video/stream URL
+            audio_only: Whether to prefer audio-only streams
+            quality: Quality tier ("low", "medium" or "high")
+            bypass_cache: Ask the daemon to ignore its cached URL
+
+        Returns:
+            Stream info dictionary if the daemon resolved the URL, None if
+            the resolution failed
+
+        Raises:
+            ResolverUnavailable: If no daemon is listening
+        """
+        request = self._resolve_request(url, audio_only, quality, bypass_cache)
+        try:
+            response = self._request(request)
+        except (OSError, ValueError) as e:
+            logger.error(f"Resolver daemon request failed: {e}")
+            return None
+        return self._result(url, response)
+
+    async def extract_async(
+        self,
+        url: str,
+        audio_only: bool,
+        quality: str,
+        bypass_cache: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a URL through the daemon without blocking the event loop.
+
+        Args:
+            url: The YouTube video/stream URL
+            audio_only: Whether to prefer audio-only streams
+            quality: Quality tier ("low", "medium" or "high")
+            bypass_cache: Ask the daemon to ignore its cached URL
+
+        Returns:
+            Stream info dictionary if the daemon resolved the URL, None if
+            the resolution failed
+
+        Raises:
+            ResolverUnavailable: If no daemon is listening
+        """
+        request = self._resolve_request(url, audio_only, quality, bypass_cache)
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(str(self.socket_path)),
+                timeout=CONNECT_TIMEOUT_SECONDS,
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ResolverUnavailable(str(e)) from e
+
+        try:
+            writer.write(encode_message(request))
+            await writer.drain()
+            line = await asyncio.wait_for(reader.readline(), timeout=self.timeout)
+            response = json.loads(line) if line else {}
+        except (OSError, ValueError, asyncio.TimeoutError) as e:
+            logger.error(f"Resolver daemon request failed: {e}")
+            return None
+        finally:
+            writer.close()
+        return self._result(url, response)
+
+    @staticmethod
+    def _resolve_request(
+        url: str, audio_only: bool, quality: str, bypass_cache: bool
+    ) -> Dict[str, Any]:
+        """Build a resolve request message."""
+        return {
+            "op": "resolve",
+            "url": url,
+            "audio_only": audio_only,
+            "quality": quality,
+            "bypass_cache": bypass_cache,
+        }
+
+    @staticmethod
+    def _result(url: str, response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Extract the stream info from a resolve response."""
+        if not response.get("ok"):
+            logger.error(
+                f"Resolver daemon failed for {url}: {response.get('error', 'no reply')}"
+            )
+            return None
+        logger.debug(f"Resolved via daemon: {url}")
+        info: Dict[str, Any] = response["info"]
+        return info
+
+    def _request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one message and wait for its response."""
+        if not UNIX_SOCKETS_AVAILABLE:
+            raise ResolverUnavailable("Unix sockets are not supported")
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError as e:
+                raise ResolverUnavailable(str(e)) from e
+
+            sock.settimeout(self.timeout)
+            sock.sendall(encode_message(message))
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+
+        response: Dict[str, Any] = json.loads(line) if line else {}
+        return response
+
+
+def get_resolver_client() -> Optional[ResolverClient]:
+    """
+    Create a client for the configured resolver daemon.
+
+    Returns:
+        ResolverClient, or None if daemon use is disabled or unsupported
+    """
+    config = get_config()
+    if not config.resolverd_enabled or not UNIX_SOCKETS_AVAILABLE:
+        return None
+    return ResolverClient(
+        socket_path=config.resolverd_socket or default_socket_path(),
+        # The daemon spends up to connection_timeout resolving
+        timeout=config.connection_timeout + 5,
+    )
@@ -0,0 +1,339 @@
+"""
+Stream resolver backends for LofiGirl Terminal.
+
+A resolver turns a Station into a playable stream URL. The player only talks
+to the StreamResolver protocol, so the yt-dlp based resolution can be swapped
+for a direct passthrough or for a deterministic offline fake, which makes
+station loading measurable without network access (e.g. in CI).
+
+The backend is chosen with ``config.resolver_backend``:
+
+- ``auto``, ``subprocess``, ``inprocess``: yt-dlp via YouTubeFetcher
+- ``direct``: play station URLs as they are
+- ``fake``: map station IDs to local files or URLs from a JSON file
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional, Protocol
+from urllib.parse import urlsplit
+
+from lofigirl_terminal.config import get_config
+from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.live_discovery import (
+    get_live_discovery,
+    is_channel_url,
+    station_source_url,
+)
+from lofigirl_terminal.modules.stations import Station
+from lofigirl_terminal.modules.youtube_fetcher import (
+    StreamInfo,
+    YouTubeFetcher,
+    get_fetcher,
+    is_youtube_url,
+)
+
+logger = get_logger(__name__)
+
+# Key of the fallback entry in a fake resolver map
+FAKE_DEFAULT_KEY = "*"
+
+# Backends that run yt-dlp
+YT_DLP_BACKENDS = ("auto", "subprocess", "inprocess")
+
+
+class StreamResolver(Protocol):
+    """Resolves stations to playable stream URLs."""
+
+    name: str
+
+    def resolve_station(
+        self, station: Station, bypass_cache: bool = False
+    ) -> Optional[StreamInfo]:
+        """
+        Resolve a station to a playable stream.
+
+        Args:
+            station: Station to resolve
+            bypass_cache: Resolve again even if a cached URL exists, e.g.
+                          because the cached one stopped playing
+
+        Returns:
+            StreamInfo with a URL mpv can open, or None if resolution failed
+
+        Raises:
+            RuntimeError: If the backend cannot run at all
+        """
+        ...
+
+    def retry_in(self, station: Station) -> float:
+        """
+        Get the time until a failed station is resolved again.
+
+        Args:
+            station: Station that failed to resolve
+
+        Returns:
+            Seconds until the next attempt, 0 if there is no cooldown
+        """
+        ...
+
+
+def _passthrough(station: Station) -> StreamInfo:
+    """Wrap a station's own URL in a StreamInfo."""
+    return StreamInfo(url=station.url, title=station.name)
+
+
+class YtDlpResolver:
+    """
+    Resolves YouTube stations with yt-dlp and passes other URLs through.
+
+    Attributes:
+        fetcher: YouTubeFetcher performing the resolutions
+    """
+
+    name = "yt-dlp"
+
+    def __init__(self, fetcher: YouTubeFetcher) -> None:
+        """
+        Initialize the resolver.
+
+        Args:
+            fetcher: YouTubeFetcher performing the resolutions
+        """
+        self.fetcher = fetcher
+
+    def resolve_station(
+        self, station: Station, bypass_cache: bool = False
+    ) -> Optional[StreamInfo]:
+        """
+        Resolve a station with yt-dlp.
+
+        Channel URLs are narrowed down to the station's live stream first.
+
+        Args:
+            station: Station to resolve
+            bypass_cache: Ignore the cached URL; the fresh one replaces it.
+                          A channel station's discovered live stream is
+                          looked up again too, in case it was replaced.
+
+        Returns:
+            StreamInfo if successful, None otherwise
+
+        Raises:
+            RuntimeError: If yt-dlp is not installed
+        """
+        if not is_youtube_url(station.url):
+            return _passthrough(station)
+
+        return self.fetcher.resolve(
+            self._source_url(station, bypass_cache), bypass_cache=bypass_cache
+        )
+
+    async def resolve_station_async(
+        self, station: Station, bypass_cache: bool = False
+    ) -> Optional[StreamInfo]:
+        """
+        Resolve a station with yt-dlp without blocking the event loop.
+
+        The asyncio counterpart of resolve_station(). Cancelling the awaiting
+        task kills the yt-dlp child process, so a superseded station load
+        stops using CPU and network.
+
+        Args:
+            station: Station to resolve
+            bypass_cache: Ignore the cached URL; the fresh one replaces it
+
+        Returns:
+            StreamInfo if successful, None otherwise
+
+        Raises:
+            RuntimeError: If yt-dlp is not installed
+        """
+        if not is_youtube_url(station.url):
+            return _passthrough(station)
+
+        # Live discovery may list the channel, which blocks
+        source_url = await asyncio.get_running_loop().run_in_executor(
+            None, self._source_url, station, bypass_cache
+        )
+        return await self.fetcher.resolve_async(source_url, bypass_cache=bypass_cache)
+
+    def _source_url(self, station: Station, bypass_cache: bool) -> str:
+        """Check for yt-dlp and get the URL to resolve for a YouTube station."""
+        if not self.fetcher.check_yt_dlp_installed():
+            raise RuntimeError(
+                "yt-dlp is not installed. Install it with: pip install yt-dlp"
+            )
+        if (
+            bypass_cache
+            and get_config().live_discovery_enabled
+            and is_channel_url(station.url)
+        ):
+            get_live_discovery().invalidate(station)
+        return station_source_url(station)
+
+    def retry_in(self, station: Station) -> float:
+        """
+        Get the time until a failed station is resolved again.
+
+        Args:
+            station: Station that failed to resolve
+
+        Returns:
+            Seconds left in the station's failure cooldown
+        """
+        if not is_youtube_url(station.url):
+            return 0.0
+        return self.fetcher.retry_in(station_source_url(station))
+
+
+class DirectResolver:
+    """Plays station URLs as they are, without any resolution."""
+
+    name = "direct"
+
+    def resolve_station(
+        self, station: Station, bypass_cache: bool = False
+    ) -> Optional[StreamInfo]:
+        """
+        Return the station's own URL.
+
+        Args:
+            station: Station to resolve
+            bypass_cache: Unused; nothing is cached
+
+        Returns:
+            StreamInfo pointing at station.url
+        """
+        return _passthrough(station)
+
+    def retry_in(self, station: Station) -> float:
+        """Return 0; direct resolution never fails."""
+        return 0.0
+
+
+class FakeResolver:
+    """
+    Deterministic offline resolver for benchmarks and soak tests.
+
+    Station IDs are mapped to local files or URLs (for example a local
+    ``python -m http.server``). The ``"*"`` entry is used for stations
+    without their own entry. Every resolution takes the same configured
+    latency, so load times are reproducible.
+
+    Example:
+        A map file ``fake_streams.json``::
+
+            {"lofi-hip-hop": "audio/beats.ogg", "*": "http://127.0.0.1:8000/x.mp3"}
+    """
+
+    name = "fake"
+
+    def __init__(self, mapping: Dict[str, str], latency: float = 0.0) -> None:
+        """
+        Initialize the fake resolver.
+
+        Args:
+            mapping: Station ID to file path or URL
+            latency: Seconds every resolution takes
+        """
+        self.mapping = mapping
+        self.latency = latency
+
+    @classmethod
+    def from_file(cls, map_file: Path, latency: float = 0.0) -> "FakeResolver":
+        """
+        Load the station map from a JSON file.
+
+        Relative file paths in the map are taken relative to the map file.
+
+        Args:
+            map_file: JSON object mapping station IDs to files or URLs
+            latency: Seconds every resolution takes
+
+        Returns:
+            FakeResolver using the map
+
+        Raises:
+            ValueError: If the file is not a JSON object of strings
+        """
+        raw = json.loads(map_file.read_text("utf-8"))
+        if not isinstance(raw, dict) or not all(
+            isinstance(v, str) for v in raw.values()
+        ):
+            raise ValueError(f"{map_file} must map station IDs to strings")
+
+        mapping = {}
+        for station_id, target in raw.items():
+            if not urlsplit(target).scheme:
+                target = str((map_file.parent / target).resolve())
+            mapping[station_id] = target
+        return cls(mapping, latency)
+
+    def resolve_station(
+        self, station: Station, bypass_cache: bool = False
+    ) -> Optional[StreamInfo]:
+        """
+        Look up the station in the map after the configured latency.
+
+        Args:
+            station: Station to resolve
+            bypass_cache: Unused; nothing is cached
+
+        Returns:
+            StreamInfo for the mapped target, or None if the station is not
+            mapped and there is no ``"*"`` entry
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        target = self.mapping.get(station.id, self.mapping.get(FAKE_DEFAULT_KEY))
+        if target is None:
+            logger.error(f"Fake resolver has no entry for {station.id}")
+            return None
+        return StreamInfo(url=target, title=station.name)
+
+    def retry_in(self, station: Station) -> float:
+        """Return 0; the fake resolver has no failure cooldown."""
+        return 0.0
+
+
+# Cached resolver instance
+_resolver: Optional[StreamResolver] = None
+
+
+def get_resolver(prefer_audio_only: bool = True) -> StreamResolver:
+    """
+    Get or create the resolver selected by ``config.resolver_backend``.
+
+    Args:
+        prefer_audio_only: Whether yt-dlp should prefer audio-only streams
+
+    Returns:
+        StreamResolver instance
+
+    Raises:
+        ValueError: If the fake backend is selected without a valid map file
+
+    Example:
+        >>> info = get_resolver().resolve_station(station)
+    """
+    global _resolver
+    if _resolver is None:
+        config = get_config()
+        if config.resolver_backend == "direct":
+            _resolver = DirectResolver()
+        elif config.resolver_backend == "fake":
+            if config.fake_resolver_map is None:
+                raise ValueError("RESOLVER_BACKEND=fake requires FAKE_RESOLVER_MAP")
+            _resolver = FakeResolver.from_file(
+                config.fake_resolver_map,
+                latency=config.fake_resolver_latency_ms / 1000,
+            )
+        else:
+            _resolver = YtDlpResolver(get_fetcher(prefer_audio_only=prefer_audio_only))
+        logger.info(f"Using {_resolver.name} stream resolver")
+    return _resolver
@@ -0,0 +1,127 @@
+"""
+Retry and latency tracking helpers for LofiGirl Terminal.
+
+This module provides the retry policy used for stream resolution
+(exponential backoff with full jitter) and a rolling latency tracker whose
+percentiles decide when a slow resolution is hedged with a second attempt.
+"""
+
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+from lofigirl_terminal.config import Config
+
+# Backoff before the first retry; doubled for each further retry
+DEFAULT_BASE_DELAY_SECONDS = 0.5
+
+# Upper bound for a single backoff delay
+DEFAULT_MAX_DELAY_SECONDS = 8.0
+
+# Number of recent latencies kept by a LatencyTracker
+LATENCY_WINDOW = 50
+
+# Minimum number of samples before percentiles are trusted
+MIN_LATENCY_SAMPLES = 5
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How often and how quickly a failed operation is retried.
+
+    Attributes:
+        attempts: Total number of attempts, including the first
+        base_delay: Backoff ceiling before the first retry, in seconds
+        max_delay: Upper bound for the backoff ceiling, in seconds
+    """
+
+    attempts: int = 1
+    base_delay: float = DEFAULT_BASE_DELAY_SECONDS
+    max_delay: float = DEFAULT_MAX_DELAY_SECONDS
+
+    @classmethod
+    def from_config(cls, config: Config) -> "RetryPolicy":
+        """
+        Build the policy from the configuration.
+
+        Args:
+            config: Application configuration
+
+        Returns:
+            RetryPolicy making ``1 + config.retry_attempts`` attempts
+        """
+        return cls(attempts=1 + config.retry_attempts)
+
+    def backoff(self, retry: int, rng: Optional[random.Random] = None) -> float:
+        """
+        Get the delay before a retry.
+
+        Uses "full jitter": a uniform delay between zero and an exponentially
+        growing ceiling, so that clients failing together do not retry in
+        lockstep.
+
+        Args:
+            retry: Retry number, starting at 1
+            rng: Random number generator (defaults to the random module)
+
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.base_delay * 2.0 ** (retry - 1), self.max_delay)
+        return (rng or random).uniform(0, ceiling)  # nosec B311 - not crypto
+
+
+class LatencyTracker:
+    """
+    Thread-safe rolling window of operation latencies.
+
+    Example:
+        >>> tracker = LatencyTracker()
+        >>> tracker.record(1.2)
+        >>> tracker.percentile(0.9)
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Number of most recent samples kept
+        """
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """
+        Record the latency of a successful operation.
+
+        Args:
+            seconds: Time the operation took
+        """
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """
+        Get a latency percentile over the window.
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.9 for p90
+
+        Returns:
+            The latency in seconds, or None with too few samples
+        """
+        with self._lock:
+            if len(self._samples) < MIN_LATENCY_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(fraction * len(ordered)))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        """Return the number of recorded samples."""
+        with self._lock:
+            return len(self._samples)
@@ -0,0 +1,362 @@
+"""
+Resolved stream URL cache for LofiGirl Terminal.
+
+This module keeps the direct streaming URLs returned by yt-dlp on disk so that
+station switches and restarts can skip the resolver while the URL is still
+valid. Entries expire based on the ``expire`` timestamp YouTube embeds in
+googlevideo and HLS manifest URLs, and the cache is bounded with LRU eviction.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+from lofigirl_terminal.config import get_config
+from lofigirl_terminal.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Used when a resolved URL carries no expiry information
+DEFAULT_TTL_SECONDS = 3600.0
+
+# Entries are treated as expired this long before their real expiry so that
+# mpv never receives a URL that dies a few seconds into playback
+EXPIRY_SAFETY_MARGIN_SECONDS = 300.0
+
+CACHE_FILE_NAME = "streams.json"
+
+# HLS manifest URLs carry the expiry as a path segment: .../expire/1700000000/...
+_PATH_EXPIRE_RE = re.compile(r"/expire/(\d+)(?:/|$)")
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached stream URL.
+
+    Attributes:
+        url: Direct streaming URL
+        expires_at: Unix timestamp after which the URL must not be used
+        created_at: Unix timestamp of when the URL was resolved
+        info: Stream metadata resolved together with the URL
+    """
+
+    url: str
+    expires_at: float
+    created_at: float
+    info: Optional[Dict[str, Any]] = None
+
+    def is_valid(self, now: Optional[float] = None) -> bool:
+        """
+        Check whether the entry can still be used.
+
+        Args:
+            now: Current Unix timestamp (defaults to time.time())
+
+        Returns:
+            True if the entry has not reached its safety expiry
+        """
+        now = time.time() if now is None else now
+        return now < self.expires_at - EXPIRY_SAFETY_MARGIN_SECONDS
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """
+    Write JSON to a file so that readers never see a partial file.
+
+    The data goes to a uniquely named temporary file next to ``path`` that
+    then replaces it, so concurrent writers (e.g. the resolver daemon and a
+    client) cannot clobber each other's temporary file.
+
+    Args:
+        path: File to write
+        data: JSON-serializable data
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    # Serialized first so that unserializable data leaves no temporary file
+    text = json.dumps(data)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with tmp_file:
+            tmp_file.write(text)
+        os.replace(tmp_file.name, path)
+    except OSError:
+        os.unlink(tmp_file.name)
+        raise
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a source URL so equivalent URLs share a cache key.
+
+    YouTube watch and youtu.be links are reduced to their canonical
+    ``watch?v=`` form; other URLs get a lowercase scheme and host and
+    lose their fragment.
+
+    Args:
+        url: The source URL
+
+    Returns:
+        The normalized URL
+
+    Example:
+        >>> normalize_url("https://youtu.be/jfKfPfyJRdk?t=10")
+        'https://www.youtube.com/watch?v=jfKfPfyJRdk'
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("m."):
+        host = "www." + host[2:]
+
+    video_id: Optional[str] = None
+    if host in ("youtube.com", "www.youtube.com") and parts.path == "/watch":
+        video_id = parse_qs(parts.query).get("v", [None])[0]
+    elif host == "youtu.be":
+        video_id = parts.path.lstrip("/") or None
+
+    if video_id:
+        return f"https://www.youtube.com/watch?v={video_id}"
+
+    return urlunsplit(
+        (parts.scheme.lower(), host, parts.path.rstrip("/"), parts.query, "")
+    )
+
+
+def make_cache_key(source_url: str, format_selector: str, audio_only: bool) -> str:
+    """
+    Build the cache key for a resolved stream.
+
+    Args:
+        source_url: The station/source URL that was resolved
+        format_selector: yt-dlp format selector used for resolution
+        audio_only: Whether the stream was resolved for audio-only playback
+
+    Returns:
+        Cache key string
+    """
+    mode = "audio" if audio_only else "video"
+    return f"{mode}|{format_selector}|{normalize_url(source_url)}"
+
+
+def parse_expiry(stream_url: str) -> Optional[float]:
+    """
+    Extract the expiry timestamp embedded in a googlevideo/HLS URL.
+
+    Args:
+        stream_url: Direct streaming URL returned by yt-dlp
+
+    Returns:
+        Unix timestamp of expiry, or None if the URL carries none
+    """
+    parts = urlsplit(stream_url)
+    values = parse_qs(parts.query).get("expire")
+    if values and values[0].isdigit():
+        return float(values[0])
+
+    match = _PATH_EXPIRE_RE.search(parts.path)
+    if match:
+        return float(match.group(1))
+
+    return None
+
+
+class StreamCache:
+    """
+    Thread-safe, disk-backed LRU cache of resolved stream URLs.
+
+    The cache is loaded lazily from its JSON file on first access and written
+    back atomically whenever it changes.
+    """
+
+    def __init__(
+        self,
+        cache_file: Path,
+        max_entries: int = 64,
+        default_ttl: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the stream cache.
+
+        Args:
+            cache_file: Path of the JSON file used for persistence
+            max_entries: Maximum number of entries kept before LRU eviction
+            default_ttl: Lifetime of URLs that carry no expiry information
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached stream URL.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            The cached URL if present and still valid, None otherwise
+        """
+        entry = self.get_entry(key)
+        return entry.url if entry else None
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get a cached entry, marking it as most recently used.
+
+        Expired entries are dropped on access.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            The CacheEntry if present and still valid, None otherwise
+        """
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if not entry.is_valid():
+                logger.debug(f"Stream cache entry expired: {key}")
+                del self._entries[key]
+                self._save()
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(
+        self, key: str, url: str, info: Optional[Dict[str, Any]] = None
+    ) -> CacheEntry:
+        """
+        Store a resolved stream URL.
+
+        Args:
+            key: Cache key from make_cache_key()
+            url: Direct streaming URL
+            info: Optional stream metadata to memoize with the URL
+
+        Returns:
+            The stored CacheEntry
+        """
+        now = time.time()
+        expires_at = parse_expiry(url) or now + self.default_ttl
+        entry = CacheEntry(url=url, expires_at=expires_at, created_at=now, info=info)
+
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                logger.debug(f"Evicted stream cache entry: {evicted}")
+            self._save()
+
+        logger.debug(
+            f"Cached stream URL for {key} (expires in {expires_at - now:.0f}s)"
+        )
+        return entry
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Remove an entry from the cache.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            True if an entry was removed, False if not found
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if self._entries.pop(key, None) is None:
+                return False
+            self._save()
+            return True
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._save()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    def _ensure_loaded(self) -> None:
+        """Load entries from disk once, discarding expired or corrupt ones."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.cache_file.exists():
+            return
+
+        try:
+            raw: Dict[str, Dict] = json.loads(self.cache_file.read_text("utf-8"))
+            now = time.time()
+            for key, data in raw.items():
+                entry = CacheEntry(**data)
+                if entry.is_valid(now):
+                    self._entries[key] = entry
+            logger.debug(f"Loaded {len(self._entries)} cached stream URLs")
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable stream cache {self.cache_file}: {e}")
+            self._entries.clear()
+
+    def _save(self) -> None:
+        """Write entries to disk atomically."""
+        try:
+            data = {key: asdict(entry) for key, entry in self._entries.items()}
+            write_json_atomic(self.cache_file, data)
+        except OSError as e:
+            logger.warning(f"Failed to persist stream cache: {e}")
+
+
+# Cached stream cache instance
+_stream_cache: Optional[StreamCache] = None
+
+
+def get_stream_cache() -> StreamCache:
+    """
+    Get or create the global StreamCache instance.
+
+    The cache lives in ``config.audio_cache_dir``.
+
+    Returns:
+        StreamCache instance
+    """
+    global _stream_cache
+    if _stream_cache is None:
+        config = get_config()
+        _stream_cache = StreamCache(
+            cache_file=config.audio_cache_dir / CACHE_FILE_NAME,
+            max_entries=config.stream_cache_max_entries,
+        )
+    return _stream_cache
@@ -0,0 +1,224 @@
+"""
+Playback watchdog for LofiGirl Terminal.
+
+Long sessions occasionally end in dead air: the stream stops advancing
+without mpv noticing, or it ends, cleanly or with an error. This module watches the
+player's snapshot from a background thread and, when playback stops making
+progress or fails, re-resolves the station (bypassing cached URLs) and
+restarts it. Consecutive reconnects back off exponentially and stop after a
+configured number of attempts.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from lofigirl_terminal.config import get_config
+from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.player_mpv import ACTIVE_STATES, MPVPlayer, PlayerState
+from lofigirl_terminal.modules.retry import RetryPolicy
+
+logger = get_logger(__name__)
+
+# How often the player is checked
+CHECK_INTERVAL_SECONDS = 1.0
+
+# Backoff ceiling before the second reconnect; doubled for each further one
+RECONNECT_BASE_DELAY_SECONDS = 2.0
+
+# Upper bound for the backoff between reconnects
+RECONNECT_MAX_DELAY_SECONDS = 60.0
+
+# Progress this long after a reconnect resets the attempt count
+RECOVERED_AFTER_SECONDS = 30.0
+
+
+class PlaybackWatchdog:
+    """
+    Reconnects the player when playback stalls or fails.
+
+    Playback has stalled when the position has not advanced for
+    ``stall_seconds`` while the player is playing or rebuffering. It has
+    failed when the player enters ERROR, or mpv reaches the end of the
+    stream, after having played. mpv keeps the ended stream open and
+    pauses, so an end of file counts even though the player reports
+    PAUSED. The first reconnect happens right away; further ones wait for
+    the backoff. Stopping, pausing or changing the station starts over.
+    """
+
+    def __init__(
+        self,
+        player: MPVPlayer,
+        stall_seconds: float,
+        max_attempts: int,
+        policy: Optional[RetryPolicy] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the watchdog.
+
+        Args:
+            player: Player to watch
+            stall_seconds: Time without progress that counts as a stall
+            max_attempts: Consecutive reconnects before giving up
+            policy: Backoff between reconnects (defaults to 2s doubling
+                    up to 60s)
+            clock: Monotonic clock, replaceable for tests
+        """
+        self.player = player
+        self.stall_seconds = stall_seconds
+        self.max_attempts = max_attempts
+        self.policy = policy or RetryPolicy(
+            attempts=max_attempts,
+            base_delay=RECONNECT_BASE_DELAY_SECONDS,
+            max_delay=RECONNECT_MAX_DELAY_SECONDS,
+        )
+        self._clock = clock
+        self._station_id: Optional[str] = None
+        self._armed = False
+        self._last_position: Optional[float] = None
+        self._last_progress = clock()
+        self._attempts = 0
+        self._last_attempt = 0.0
+        self._next_attempt_at = 0.0
+        self._gave_up = False
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def attempts(self) -> int:
+        """Number of consecutive reconnects so far."""
+        return self._attempts
+
+    def start(self) -> None:
+        """Start the background watchdog thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # A fresh event per thread so a stopped thread can never be revived
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stopped,), name="watchdog", daemon=True
+        )
+        self._thread.start()
+        logger.debug("Playback watchdog started")
+
+    def stop(self) -> None:
+        """Stop the background watchdog thread."""
+        self._stopped.set()
+        self._thread = None
+        logger.debug("Playback watchdog stopped")
+
+    def check(self) -> None:
+        """Inspect the player once and reconnect if playback is dead."""
+        now = self._clock()
+        state = self.player.get_state()
+        station = self.player.current_station
+        station_id = station.id if station is not None else None
+        if station_id != self._station_id:
+            # Nothing seen on the previous station counts for this one
+            self._station_id = station_id
+            self._armed = False
+            self._reset(now)
+
+        if self._armed and self.player.get_snapshot().eof_reached:
+            self._reconnect("stream ended", now)
+            return
+        if state in (PlayerState.STOPPED, PlayerState.PAUSED):
+            # Silence the user asked for
+            self._armed = False
+            self._reset(now)
+            return
+        if state == PlayerState.LOADING:
+            # Opening a stream is not a stall; mpv times out on its own
+            self._last_progress = now
+            return
+
+        if state in ACTIVE_STATES:
+            self._armed = True
+            position = self.player.get_snapshot().time_pos
+            if position != self._last_position:
+                self._last_position = position
+                self._last_progress = now
+                if self._attempts and now - self._last_attempt >= (
+                    RECOVERED_AFTER_SECONDS
+                ):
+                    logger.info("Playback recovered")
+                    self._reset(now)
+                return
+            stalled_for = now - self._last_progress
+            if stalled_for < self.stall_seconds:
+                return
+            reason = f"no playback progress for {stalled_for:.0f}s"
+        elif state == PlayerState.ERROR and self._armed:
+            reason = "stream failed"
+        else:
+            return
+
+        self._reconnect(reason, now)
+
+    def _reconnect(self, reason: str, now: float) -> None:
+        """Reconnect unless backing off or out of attempts."""
+        if self._gave_up or now < self._next_attempt_at:
+            return
+        if self._attempts >= self.max_attempts:
+            logger.error(
+                f"Playback watchdog giving up after {self._attempts} reconnects"
+            )
+            self._gave_up = True
+            return
+
+        self._attempts += 1
+        self._last_attempt = now
+        logger.warning(
+            f"Playback watchdog: {reason}, reconnecting "
+            f"(attempt {self._attempts}/{self.max_attempts})"
+        )
+        try:
+            self.player.reconnect()
+        except Exception as e:
+            logger.warning(f"Reconnect failed: {e}")
+
+        # Resolving may have taken a while; the stall timer starts over
+        done = self._clock()
+        self._next_attempt_at = done + self.policy.backoff(self._attempts)
+        self._last_progress = done
+        self._last_position = None
+
+    def _reset(self, now: float) -> None:
+        """Forget reconnect attempts and stall progress."""
+        self._attempts = 0
+        self._next_attempt_at = 0.0
+        self._gave_up = False
+        self._last_position = None
+        self._last_progress = now
+
+    def _run(self, stopped: threading.Event) -> None:
+        """Background loop: check the player every CHECK_INTERVAL_SECONDS."""
+        while not stopped.wait(CHECK_INTERVAL_SECONDS):
+            try:
+                self.check()
+            except Exception as e:
+                logger.exception(f"Error in playback watchdog: {e}")
+
+
+def start_watchdog(player: MPVPlayer) -> Optional[PlaybackWatchdog]:
+    """
+    Start the playback watchdog if enabled in the configuration.
+
+    Args:
+        player: Player to watch
+
+    Returns:
+        The running PlaybackWatchdog, or None if it is disabled
+    """
+    config = get_config()
+    if not config.watchdog_enabled:
+        return None
+
+    watchdog = PlaybackWatchdog(
+        player,
+        stall_seconds=config.watchdog_stall_seconds,
+        max_attempts=config.watchdog_max_attempts,
+    )
+    watchdog.start()
+    return watchdog
@@ -2,17 +2,80 @@
 YouTube stream fetcher for LofiGirl Terminal.
 
 This module handles fetching real streaming URLs from YouTube live streams
-using yt-dlp. It extracts the direct stream URL that can be played by mpv.
+using yt-dlp. It extracts the direct stream URL that can be played by mpv,
+together with the stream metadata, from a single yt-dlp invocation. yt-dlp
+runs either in-process (see ytdl_engine) or as a subprocess, and every
+resolve is available both as a blocking call and as an asyncio coroutine.
+Resolved streams are kept in the on-disk stream cache until they expire.
 """
 
-import subprocess  # nosec B404 - subprocess is needed for yt-dlp integration
-from dataclasses import dataclass
-from typing import Optional
-
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import asdict, dataclass
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlsplit
+
+from lofigirl_terminal.config import get_config
 from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.circuit_breaker import CircuitBreaker, CircuitState
+from lofigirl_terminal.modules.resolverd_client import (
+    ResolverClient,
+    ResolverUnavailable,
+    get_resolver_client,
+)
+from lofigirl_terminal.modules.retry import LatencyTracker, RetryPolicy
+from lofigirl_terminal.modules.stream_cache import (
+    StreamCache,
+    get_stream_cache,
+    make_cache_key,
+)
+from lofigirl_terminal.modules.ytdl_engine import YtDlpEngine, get_engine
+from lofigirl_terminal.modules.ytdl_probe import probe_yt_dlp
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Latency percentile after which a slow resolution is hedged
+HEDGE_PERCENTILE = 0.9
+
+# Fields of a yt-dlp info dictionary that are kept after parsing
+INFO_FIELDS = (
+    "url",
+    "requested_formats",
+    "title",
+    "thumbnail",
+    "description",
+    "is_live",
+    "format_id",
+    "format_note",
+)
+
+# Longest yt-dlp output line read from the subprocess; a single
+# entry with its full format list can exceed a megabyte
+MAX_INFO_LINE_BYTES = 32 * 1024 * 1024
+
+# Hosts whose URLs are resolved with yt-dlp
+YOUTUBE_HOSTS = frozenset(
+    {"youtube.com", "www.youtube.com", "m.youtube.com", "music.youtube.com", "youtu.be"}
+)
+
+# yt-dlp format selectors per audio_quality setting, as (audio-only, video).
+# Live streams usually only offer muxed HLS variants, so the audio-only
+# selectors fall back to the smallest video variant rather than "best".
+QUALITY_FORMATS: Dict[str, Tuple[str, str]] = {
+    "low": ("bestaudio[abr<=64]/worstaudio/worst", "best[height<=360]/worst"),
+    "medium": (
+        "bestaudio[abr<=128]/worstaudio/best[height<=480]/worst",
+        "best[height<=720]/worst",
+    ),
+    "high": ("bestaudio/best", "best"),
+}
+
 
 @dataclass
 class StreamInfo:
@@ -38,32 +101,238 @@ class StreamInfo:
     format_note: Optional[str] = None
 
 
+def get_format_selector(quality: str, audio_only: bool = True) -> str:
+    """
+    Get the yt-dlp format selector for a quality tier.
+
+    Args:
+        quality: Quality tier ("low", "medium" or "high")
+        audio_only: Whether to prefer audio-only formats
+
+    Returns:
+        Format selector usable with ``yt-dlp -f`` and mpv's ytdl-format
+
+    Example:
+        >>> get_format_selector("low")
+        'bestaudio[abr<=64]/worstaudio/worst'
+    """
+    audio_format, video_format = QUALITY_FORMATS.get(quality, QUALITY_FORMATS["high"])
+    return audio_format if audio_only else video_format
+
+
+def parse_stream_info(data: Dict[str, Any]) -> StreamInfo:
+    """
+    Build a StreamInfo from a yt-dlp info dictionary.
+
+    Args:
+        data: Info dictionary as produced by ``yt-dlp --dump-json``
+
+    Returns:
+        StreamInfo with the fields used by the player
+    """
+    url = data.get("url")
+    if not url and data.get("requested_formats"):
+        # Merged selections list their parts instead of a single URL
+        url = data["requested_formats"][0].get("url")
+
+    return StreamInfo(
+        url=url or "",
+        title=data.get("title", "Unknown Title"),
+        thumbnail=data.get("thumbnail"),
+        description=data.get("description", ""),
+        is_live=bool(data.get("is_live", False)),
+        format_id=data.get("format_id"),
+        format_note=data.get("format_note"),
+    )
+
+
+def is_youtube_url(url: str) -> bool:
+    """
+    Check whether a URL points at YouTube and needs yt-dlp resolution.
+
+    Args:
+        url: Station or stream URL
+
+    Returns:
+        True for http(s) URLs whose host is YouTube's or youtu.be
+    """
+    try:
+        parts = urlsplit(url)
+        host = parts.hostname
+    except ValueError:
+        return False
+    # Matching the host, not a substring, keeps e.g. "?youtube.com" out
+    return parts.scheme in ("http", "https") and host in YOUTUBE_HOSTS
+
+
+def parse_info_line(line: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """
+    Parse one line of ``yt-dlp --dump-json`` output.
+
+    Channel/playlist URLs print one large JSON document per entry, with full
+    format lists. Only the fields parse_stream_info() reads are kept, so the
+    rest can be freed right away.
+
+    Args:
+        line: A single output line
+
+    Returns:
+        The trimmed info dictionary if the line is an entry with a playable
+        URL, None otherwise
+    """
+    try:
+        data = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    info = {key: data[key] for key in INFO_FIELDS if key in data}
+    requested = info.pop("requested_formats", None)
+    if not info.get("url") and requested:
+        info["url"] = requested[0].get("url")
+    return info if info.get("url") else None
+
+
+def _run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    The coroutine gets its own event loop on a helper thread, so this is
+    safe to call from a thread that is already running an event loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def _read_all(reader: Optional[asyncio.StreamReader]) -> bytes:
+    """Read a child process pipe until EOF."""
+    return await reader.read() if reader is not None else b""
+
+
+async def _kill_process(process: "asyncio.subprocess.Process") -> None:
+    """Kill an asyncio child process if it is still running and reap it."""
+    if process.returncode is not None:
+        return
+    try:
+        process.kill()
+    except ProcessLookupError:
+        return
+    await process.wait()
+    logger.debug(f"Killed yt-dlp process {process.pid}")
+
+
 class YouTubeFetcher:
     """
     Fetches YouTube stream information and URLs using yt-dlp.
 
     This class provides methods to extract streaming URLs from YouTube videos,
     especially for live streams. It uses yt-dlp to get the best quality audio
-    stream or video stream URL.
+    stream or video stream URL, either through the in-process engine or by
+    running the yt-dlp binary.
     """
 
-    def __init__(self, prefer_audio_only: bool = True) -> None:
+    def __init__(
+        self,
+        prefer_audio_only: bool = True,
+        cache: Optional[StreamCache] = None,
+        backend: Optional[str] = None,
+        quality: Optional[str] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge: Optional[bool] = None,
+        daemon: Optional[ResolverClient] = None,
+    ) -> None:
         """
         Initialize the YouTube fetcher.
 
         Args:
             prefer_audio_only: If True, prefer audio-only streams for better
                              performance. If False, get video streams.
+            cache: Stream URL cache to use. Defaults to the global cache when
+                   stream caching is enabled in the configuration.
+            backend: yt-dlp backend ("auto", "subprocess" or "inprocess").
+                     Defaults to ``config.resolver_backend``.
+            quality: Quality tier ("low", "medium" or "high").
+                     Defaults to ``config.audio_quality``.
+            breaker: Circuit breaker remembering failed resolutions. Defaults
+                     to a new one using the configured failure cooldowns.
+            retry_policy: Retry policy for failed attempts. Defaults to
+                          ``config.retry_attempts`` retries.
+            hedge: Start a second yt-dlp process when an attempt is slower
+                   than the observed p90. Defaults to ``config.resolver_hedging``.
+            daemon: Resolver daemon to forward resolutions to while it is
+                    running; resolutions are local when None.
         """
+        config = get_config()
         self.prefer_audio_only = prefer_audio_only
-        logger.debug(f"YouTubeFetcher initialized (audio_only={prefer_audio_only})")
+        self.quality = quality or config.audio_quality
+        if cache is None and config.stream_cache_enabled:
+            cache = get_stream_cache()
+        self.cache = cache
+        if breaker is None:
+            breaker = CircuitBreaker(
+                base_cooldown=config.failure_cooldown_seconds,
+                max_cooldown=config.failure_cooldown_max_seconds,
+            )
+        self.breaker = breaker
+        self.timeout = float(config.connection_timeout)
+        self.retry_policy = retry_policy or RetryPolicy.from_config(config)
+        self.latency = LatencyTracker()
+        self.daemon = daemon
+        self.engine = self._select_engine(backend or config.resolver_backend)
+        # An in-process extraction cannot be cancelled once it has lost the
+        # race, so only subprocess resolutions can be hedged
+        self.hedge = (config.resolver_hedging if hedge is None else hedge) and (
+            self.engine is None
+        )
+        # Resolutions in progress, keyed like the stream cache (single-flight)
+        self._inflight: Dict[str, "Future[Optional[StreamInfo]]"] = {}
+        self._inflight_lock = threading.Lock()
+        logger.debug(
+            f"YouTubeFetcher initialized (audio_only={prefer_audio_only}, "
+            f"quality={self.quality}, "
+            f"backend={'inprocess' if self.engine else 'subprocess'})"
+        )
+
+    @staticmethod
+    def _select_engine(backend: str) -> Optional[YtDlpEngine]:
+        """
+        Pick the in-process engine when requested and available.
+
+        Args:
+            backend: Configured backend name
+
+        Returns:
+            The shared YtDlpEngine, or None to use the yt-dlp binary
+        """
+        if backend == "subprocess":
+            return None
+
+        engine = get_engine()
+        if engine is None and backend == "inprocess":
+            logger.warning(
+                "yt_dlp library not importable, falling back to the yt-dlp binary"
+            )
+        return engine
+
+    def _format_selector(self) -> str:
+        """Return the yt-dlp format selector for the current mode and quality."""
+        return get_format_selector(self.quality, self.prefer_audio_only)
 
     def get_stream_url(self, youtube_url: str) -> Optional[str]:
         """
         Get the direct streaming URL from a YouTube URL.
 
         This method uses yt-dlp to extract the actual streaming URL that can
-        be played by media players like mpv.
+        be played by media players like mpv. Previously resolved URLs are
+        served from the stream cache while they are still valid.
 
         Args:
             youtube_url: The YouTube video/stream URL
@@ -77,51 +346,8 @@ class YouTubeFetcher:
             >>> print(url)
             https://...m3u8
         """
-        try:
-            logger.info(f"Fetching stream URL for: {youtube_url}")
-
-            # Build yt-dlp command
-            cmd = [
-                "yt-dlp",
-                "--get-url",
-                "--no-warnings",
-                "--quiet",  # Suppress output to prevent UI interference
-                "--no-progress",  # Don't show progress bar
-            ]
-
-            # Add format selector based on preference
-            if self.prefer_audio_only:
-                cmd.extend(["-f", "bestaudio/best"])
-            else:
-                cmd.extend(["-f", "best"])
-
-            cmd.append(youtube_url)
-
-            # Execute yt-dlp
-            # Safe: command is built from a list, not shell=True
-            result = subprocess.run(  # nosec B603
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=False,
-            )
-
-            if result.returncode == 0 and result.stdout:
-                stream_url = result.stdout.strip()
-                logger.info("Successfully fetched stream URL")
-                logger.debug(f"Stream URL: {stream_url[:100]}...")
-                return stream_url
-            else:
-                logger.error(f"Failed to fetch stream URL: {result.stderr}")
-                return None
-
-        except subprocess.TimeoutExpired:
-            logger.error(f"Timeout while fetching stream URL for {youtube_url}")
-            return None
-        except Exception as e:
-            logger.exception(f"Error fetching stream URL: {e}")
-            return None
+        stream_info = self.resolve(youtube_url)
+        return stream_info.url if stream_info else None
 
     def get_stream_info(self, youtube_url: str) -> Optional[StreamInfo]:
         """
@@ -141,70 +367,577 @@ class YouTubeFetcher:
             >>> print(info.title)
             lofi hip hop radio 📚 - beats to relax/study to
         """
+        return self.resolve(youtube_url)
+
+    def resolve(
+        self, youtube_url: str, bypass_cache: bool = False
+    ) -> Optional[StreamInfo]:
+        """
+        Resolve a YouTube URL to its stream URL and metadata.
+
+        A single yt-dlp invocation provides both the playable URL and the
+        stream metadata. The result is memoized in the stream cache, so
+        later calls for the same URL and format return without running
+        yt-dlp until the URL expires. Concurrent calls for the same URL and
+        format share a single in-flight resolution. After a failure the URL
+        fails fast until its circuit breaker cooldown elapses.
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+            bypass_cache: Ignore any cached URL and resolve again; the fresh
+                          result replaces the cached one
+
+        Returns:
+            StreamInfo object if successful, None otherwise
+
+        Example:
+            >>> fetcher = YouTubeFetcher()
+            >>> info = fetcher.resolve("https://www.youtube.com/watch?v=jfKfPfyJRdk")
+            >>> print(info.title, info.url)
+        """
+        cache_key = self._cache_key(youtube_url)
+        if not bypass_cache:
+            cached = self._lookup_cache(cache_key, youtube_url)
+            if cached is not None:
+                return cached
+
+        flight, is_leader = self._join_flight(cache_key)
+        if not is_leader:
+            logger.debug(f"Waiting for in-flight resolution of: {youtube_url}")
+            return flight.result()
+
+        stream_info: Optional[StreamInfo] = None
         try:
-            logger.info(f"Fetching stream info for: {youtube_url}")
-
-            # Build yt-dlp command to get JSON info
-            cmd = [
-                "yt-dlp",
-                "--dump-json",
-                "--no-warnings",
-                "--skip-download",
-                "--quiet",  # Suppress output to prevent UI interference
-                "--no-progress",  # Don't show progress bar
-            ]
-
-            # Add format selector
-            if self.prefer_audio_only:
-                cmd.extend(["-f", "bestaudio/best"])
-            else:
-                cmd.extend(["-f", "best"])
-
-            cmd.append(youtube_url)
-
-            # Execute yt-dlp
-            # Safe: command is built from a list, not shell=True
-            result = subprocess.run(  # nosec B603
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=False,
-            )
+            if self._fail_fast(cache_key, youtube_url):
+                return None
+            logger.info(f"Resolving stream for: {youtube_url}")
+            data = self._extract(youtube_url, bypass_cache)
+            stream_info = self._finish_resolve(cache_key, youtube_url, data)
+        finally:
+            self._land_flight(cache_key, flight, stream_info)
+
+        return stream_info
+
+    async def resolve_async(
+        self, youtube_url: str, bypass_cache: bool = False
+    ) -> Optional[StreamInfo]:
+        """
+        Resolve a YouTube URL without blocking the event loop.
+
+        This is the asyncio counterpart of resolve(). Cancelling the awaiting
+        task kills the yt-dlp child process, so a superseded resolve stops
+        using CPU and network immediately. With the in-process engine a
+        cancelled extraction that has already started runs to completion on
+        the engine thread, but its result is discarded.
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+            bypass_cache: Ignore any cached URL and resolve again
+
+        Returns:
+            StreamInfo object if successful, None otherwise
+
+        Example:
+            >>> info = await get_fetcher().resolve_async(station.url)
+        """
+        cache_key = self._cache_key(youtube_url)
+        if not bypass_cache:
+            cached = self._lookup_cache(cache_key, youtube_url)
+            if cached is not None:
+                return cached
+
+        flight, is_leader = self._join_flight(cache_key)
+        if not is_leader:
+            logger.debug(f"Waiting for in-flight resolution of: {youtube_url}")
+            # Shielded so that cancelling this waiter leaves the flight intact
+            return await asyncio.shield(asyncio.wrap_future(flight))
+
+        stream_info: Optional[StreamInfo] = None
+        try:
+            if self._fail_fast(cache_key, youtube_url):
+                return None
+            logger.info(f"Resolving stream (async) for: {youtube_url}")
+            data = await self._extract_async(youtube_url, bypass_cache)
+            stream_info = self._finish_resolve(cache_key, youtube_url, data)
+        finally:
+            self._land_flight(cache_key, flight, stream_info)
+
+        return stream_info
+
+    async def get_stream_url_async(self, youtube_url: str) -> Optional[str]:
+        """
+        Get the direct streaming URL without blocking the event loop.
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+
+        Returns:
+            Direct streaming URL if successful, None otherwise
+        """
+        stream_info = await self.resolve_async(youtube_url)
+        return stream_info.url if stream_info else None
+
+    def get_cached_expiry(self, youtube_url: str) -> Optional[float]:
+        """
+        Get the expiry time of the cached resolution for a URL.
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+
+        Returns:
+            Unix timestamp at which the cached URL expires, or None if there
+            is no valid cached resolution
+        """
+        if self.cache is None:
+            return None
+        entry = self.cache.get_entry(self._cache_key(youtube_url))
+        return entry.expires_at if entry is not None else None
+
+    def retry_in(self, youtube_url: str) -> float:
+        """
+        Get the time until a failed URL is resolved again.
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+
+        Returns:
+            Seconds left in the URL's failure cooldown, 0 if it is not failing
+        """
+        return self.breaker.retry_in(self._cache_key(youtube_url))
+
+    def _cache_key(self, youtube_url: str) -> str:
+        """Return the stream cache key for a URL in the current mode."""
+        return make_cache_key(
+            youtube_url, self._format_selector(), self.prefer_audio_only
+        )
+
+    def _join_flight(
+        self, cache_key: str
+    ) -> Tuple["Future[Optional[StreamInfo]]", bool]:
+        """
+        Join the in-flight resolution for a key, or start a new one.
+
+        Args:
+            cache_key: Cache key identifying the URL, format and mode
+
+        Returns:
+            Tuple of the shared future and whether the caller is the leader
+            that must perform the resolution
+        """
+        with self._inflight_lock:
+            flight = self._inflight.get(cache_key)
+            if flight is not None:
+                return flight, False
+            flight = Future()
+            self._inflight[cache_key] = flight
+            return flight, True
+
+    def _land_flight(
+        self,
+        cache_key: str,
+        flight: "Future[Optional[StreamInfo]]",
+        stream_info: Optional[StreamInfo],
+    ) -> None:
+        """
+        Publish the leader's result to all waiters and retire the flight.
+
+        A leader that failed or was cancelled publishes None.
+
+        Args:
+            cache_key: Cache key identifying the URL, format and mode
+            flight: The shared future created by _join_flight()
+            stream_info: Resolution result
+        """
+        with self._inflight_lock:
+            self._inflight.pop(cache_key, None)
+        flight.set_result(stream_info)
+
+    def _lookup_cache(self, cache_key: str, youtube_url: str) -> Optional[StreamInfo]:
+        """
+        Return a memoized resolution if the cache holds a valid one.
+
+        Args:
+            cache_key: Cache key for the URL
+            youtube_url: The YouTube video/stream URL (for logging)
+
+        Returns:
+            Cached StreamInfo, or None on a cache miss
+        """
+        if self.cache is None:
+            return None
+
+        entry = self.cache.get_entry(cache_key)
+        if entry is None or entry.info is None:
+            return None
 
-            if result.returncode == 0 and result.stdout:
-                import json
+        logger.info(f"Using cached stream for: {youtube_url}")
+        return StreamInfo(url=entry.url, **entry.info)
 
-                data = json.loads(result.stdout)
+    def _fail_fast(self, cache_key: str, youtube_url: str) -> bool:
+        """
+        Check the circuit breaker before resolving a URL.
+
+        While the URL's circuit is open a background probe is scheduled for
+        the end of the cooldown, so the URL recovers without user action.
+
+        Args:
+            cache_key: Cache key for the URL
+            youtube_url: The YouTube video/stream URL
+
+        Returns:
+            True if the URL is known-bad and must not be resolved now
+        """
+        if self.breaker.allow(cache_key):
+            return False
 
-                # Extract stream info
-                stream_info = StreamInfo(
-                    url=data.get("url", ""),
-                    title=data.get("title", "Unknown Title"),
-                    thumbnail=data.get("thumbnail"),
-                    description=data.get("description", ""),
-                    is_live=data.get("is_live", False),
-                    format_id=data.get("format_id"),
-                    format_note=data.get("format_note"),
+        logger.warning(
+            f"Skipping failing stream {youtube_url} "
+            f"(retry in {self.breaker.retry_in(cache_key):.0f}s)"
+        )
+        # Half-open means a probe is already running
+        if self.breaker.state(cache_key) == CircuitState.OPEN:
+            self.breaker.schedule_probe(cache_key, lambda: self.resolve(youtube_url))
+        return True
+
+    def _finish_resolve(
+        self, cache_key: str, youtube_url: str, data: Optional[Dict[str, Any]]
+    ) -> Optional[StreamInfo]:
+        """
+        Build a StreamInfo from yt-dlp output and store it in the cache.
+
+        The outcome is also recorded with the circuit breaker.
+
+        Args:
+            cache_key: Cache key for the URL
+            youtube_url: The YouTube video/stream URL
+            data: yt-dlp info dictionary, or None if extraction failed
+
+        Returns:
+            StreamInfo object if the output has a playable URL, None otherwise
+        """
+        if data is None:
+            self.breaker.record_failure(cache_key)
+            return None
+
+        stream_info = parse_stream_info(data)
+        if not stream_info.url:
+            logger.error(f"No playable URL in yt-dlp output for {youtube_url}")
+            self.breaker.record_failure(cache_key)
+            return None
+
+        self.breaker.record_success(cache_key)
+
+        logger.info(f"Successfully resolved stream: {stream_info.title}")
+        logger.debug(f"Stream URL: {stream_info.url[:100]}...")
+
+        if self.cache is not None:
+            metadata = asdict(stream_info)
+            del metadata["url"]
+            self.cache.put(cache_key, stream_info.url, info=metadata)
+
+        return stream_info
+
+    def _build_command(self, youtube_url: str) -> List[str]:
+        """
+        Build the yt-dlp command line for resolving a URL.
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+
+        Returns:
+            Command as a list of arguments
+        """
+        # Build yt-dlp command to get JSON info
+        cmd = [
+            "yt-dlp",
+            "--dump-json",
+            "--no-warnings",
+            "--skip-download",
+            "--quiet",  # Suppress output to prevent UI interference
+            "--no-progress",  # Don't show progress bar
+        ]
+
+        # Add format selector
+        cmd.extend(["-f", self._format_selector()])
+
+        cmd.append(youtube_url)
+        return cmd
+
+    def _extract(
+        self, youtube_url: str, bypass_cache: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract the info dictionary, retrying failed attempts.
+
+        A running resolver daemon is asked first. Otherwise all local
+        attempts and the backoff between them share one deadline of
+        ``connection_timeout`` seconds, so retries never extend the worst
+        case station start time.
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+            bypass_cache: Ask the daemon to ignore its cached URL
+
+        Returns:
+            yt-dlp info dictionary if any attempt succeeded, None otherwise
+        """
+        if self.daemon is not None:
+            try:
+                return self.daemon.extract(
+                    youtube_url, self.prefer_audio_only, self.quality, bypass_cache
+                )
+            except ResolverUnavailable:
+                logger.debug("Resolver daemon not running, resolving locally")
+
+        deadline = time.monotonic() + self.timeout
+        for attempt in range(self.retry_policy.attempts):
+            if attempt:
+                delay = self.retry_policy.backoff(attempt)
+                if time.monotonic() + delay >= deadline:
+                    break
+                logger.info(f"Retrying resolve in {delay:.1f}s: {youtube_url}")
+                time.sleep(delay)
+
+            started = time.monotonic()
+            timeout = deadline - started
+            if self.engine is not None:
+                data = self._extract_in_process(self.engine, youtube_url, timeout)
+            elif self.hedge:
+                data = _run_coroutine(self._extract_hedged_async(youtube_url, timeout))
+            else:
+                data = _run_coroutine(
+                    self._extract_with_subprocess_async(youtube_url, timeout)
                 )
 
-                logger.info(f"Successfully fetched stream info: {stream_info.title}")
-                return stream_info
+            if data is not None:
+                self.latency.record(time.monotonic() - started)
+                return data
+        return None
+
+    async def _extract_async(
+        self, youtube_url: str, bypass_cache: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Await the info dictionary, retrying failed attempts.
+
+        This is the asyncio counterpart of _extract().
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+            bypass_cache: Ask the daemon to ignore its cached URL
+
+        Returns:
+            yt-dlp info dictionary if any attempt succeeded, None otherwise
+        """
+        if self.daemon is not None:
+            try:
+                return await self.daemon.extract_async(
+                    youtube_url, self.prefer_audio_only, self.quality, bypass_cache
+                )
+            except ResolverUnavailable:
+                logger.debug("Resolver daemon not running, resolving locally")
+
+        deadline = time.monotonic() + self.timeout
+        for attempt in range(self.retry_policy.attempts):
+            if attempt:
+                delay = self.retry_policy.backoff(attempt)
+                if time.monotonic() + delay >= deadline:
+                    break
+                logger.info(f"Retrying resolve in {delay:.1f}s: {youtube_url}")
+                await asyncio.sleep(delay)
+
+            started = time.monotonic()
+            timeout = deadline - started
+            if self.engine is not None:
+                data = await self._extract_in_process_async(
+                    self.engine, youtube_url, timeout
+                )
+            elif self.hedge:
+                data = await self._extract_hedged_async(youtube_url, timeout)
             else:
-                logger.error(f"Failed to fetch stream info: {result.stderr}")
-                return None
+                data = await self._extract_with_subprocess_async(youtube_url, timeout)
+
+            if data is not None:
+                self.latency.record(time.monotonic() - started)
+                return data
+        return None
+
+    async def _extract_hedged_async(
+        self, youtube_url: str, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run yt-dlp, hedging with a second process if the first is slow.
+
+        Once the first process has run longer than the observed p90
+        resolve latency a second one is started; the first successful
+        answer wins and the other process is killed.
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+            timeout: Maximum time for the whole extraction
+
+        Returns:
+            yt-dlp info dictionary if successful, None otherwise
+        """
+        hedge_after = self.latency.percentile(HEDGE_PERCENTILE)
+        if hedge_after is None or hedge_after >= timeout:
+            return await self._extract_with_subprocess_async(youtube_url, timeout)
+
+        started = time.monotonic()
+        first = asyncio.ensure_future(
+            self._extract_with_subprocess_async(youtube_url, timeout)
+        )
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_after)
+            if not done:
+                logger.info(
+                    f"Resolve slower than p90 ({hedge_after:.1f}s), hedging: "
+                    f"{youtube_url}"
+                )
+                remaining = timeout - (time.monotonic() - started)
+                pending.add(
+                    asyncio.ensure_future(
+                        self._extract_with_subprocess_async(youtube_url, remaining)
+                    )
+                )
 
-        except subprocess.TimeoutExpired:
-            logger.error(f"Timeout while fetching stream info for {youtube_url}")
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    data = task.result()
+                    if data is not None:
+                        return data
+            return None
+        finally:
+            # Cancelling a task kills its yt-dlp process
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _extract_in_process(
+        self, engine: YtDlpEngine, youtube_url: str, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract the info dictionary with the in-process yt-dlp engine.
+
+        Args:
+            engine: The in-process engine to use
+            youtube_url: The YouTube video/stream URL
+            timeout: Maximum time to wait for the extraction
+
+        Returns:
+            yt-dlp info dictionary if successful, None otherwise
+        """
+        try:
+            return engine.extract(youtube_url, self._format_selector(), timeout=timeout)
+        except FutureTimeoutError:
+            logger.error(f"Timeout while resolving stream for {youtube_url}")
             return None
         except Exception as e:
-            logger.exception(f"Error fetching stream info: {e}")
+            logger.error(f"Failed to resolve stream: {e}")
             return None
 
+    async def _extract_in_process_async(
+        self, engine: YtDlpEngine, youtube_url: str, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Await an extraction on the in-process yt-dlp engine.
+
+        Args:
+            engine: The in-process engine to use
+            youtube_url: The YouTube video/stream URL
+            timeout: Maximum time to wait for the extraction
+
+        Returns:
+            yt-dlp info dictionary if successful, None otherwise
+        """
+        future = engine.submit(youtube_url, self._format_selector())
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout while resolving stream for {youtube_url}")
+            return None
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Failed to resolve stream: {e}")
+            return None
+
+    async def _extract_with_subprocess_async(
+        self, youtube_url: str, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract the info dictionary with an asyncio-managed yt-dlp process.
+
+        The output is parsed line by line as it arrives. Once the first
+        playable entry is read, yt-dlp is stopped, so channel/playlist URLs
+        do not wait for (or buffer) the remaining entries. The child process
+        is also killed if the resolve times out or the awaiting task is
+        cancelled. Blocking resolves run this on a helper event loop.
+
+        Args:
+            youtube_url: The YouTube video/stream URL
+            timeout: Maximum time yt-dlp may run
+
+        Returns:
+            yt-dlp info dictionary if successful, None otherwise
+        """
+        try:
+            # Safe: command is built from a list, not a shell string
+            process = await asyncio.create_subprocess_exec(  # nosec B603
+                *self._build_command(youtube_url),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=MAX_INFO_LINE_BYTES,
+            )
+        except OSError as e:
+            logger.error(f"Failed to start yt-dlp: {e}")
+            return None
+
+        async def read_first_info() -> Optional[Dict[str, Any]]:
+            reader = process.stdout
+            while reader is not None and (line := await reader.readline()):
+                info = parse_info_line(line)
+                if info is not None:
+                    return info
+            await process.wait()
+            return None
+
+        # Drained alongside stdout, so a chatty yt-dlp never blocks on a full
+        # stderr pipe
+        stderr_task = asyncio.ensure_future(_read_all(process.stderr))
+        try:
+            data = await asyncio.wait_for(read_first_info(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout while resolving stream for {youtube_url}")
+            return None
+        except ValueError as e:
+            # Raised by readline() for lines longer than MAX_INFO_LINE_BYTES
+            logger.error(f"Invalid yt-dlp output: {e}")
+            return None
+        finally:
+            await _kill_process(process)
+            # The pipe reaches EOF once yt-dlp has exited
+            stderr = await stderr_task
+
+        if data is not None:
+            return data
+
+        logger.error(f"Failed to resolve stream: {stderr.decode('utf-8', 'replace')}")
+        return None
+
     def check_yt_dlp_installed(self) -> bool:
         """
         Check if yt-dlp is installed and accessible.
 
+        When the in-process engine is in use no process is spawned. Otherwise
+        the memoized capability probe is used, so yt-dlp only runs on the
+        first check after it was installed or upgraded.
+
         Returns:
             True if yt-dlp is available, False otherwise
 
@@ -213,28 +946,11 @@ class YouTubeFetcher:
             >>> if fetcher.check_yt_dlp_installed():
             ...     print("yt-dlp is ready!")
         """
-        try:
-            # Safe: command is built from a list, not shell=True
-            # yt-dlp is a standard tool installed by the user
-            result = subprocess.run(  # nosec B603 B607
-                ["yt-dlp", "--version"],
-                capture_output=True,
-                timeout=5,
-                check=False,
-            )
-            is_installed = result.returncode == 0
-
-            if is_installed:
-                version = result.stdout.decode().strip()
-                logger.info(f"yt-dlp is installed: {version}")
-            else:
-                logger.warning("yt-dlp is not installed or not accessible")
-
-            return is_installed
+        if self.engine is not None:
+            logger.debug(f"yt-dlp library is loaded: {self.engine.version}")
+            return True
 
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            logger.warning("yt-dlp is not installed")
-            return False
+        return probe_yt_dlp().installed
 
 
 # Cached fetcher instance
@@ -245,6 +961,9 @@ def get_fetcher(prefer_audio_only: bool = True) -> YouTubeFetcher:
     """
     Get or create a cached YouTubeFetcher instance.
 
+    The instance forwards resolutions to the shared resolver daemon
+    whenever one is running.
+
     Args:
         prefer_audio_only: Whether to prefer audio-only streams
 
@@ -257,5 +976,7 @@ def get_fetcher(prefer_audio_only: bool = True) -> YouTubeFetcher:
     """
     global _fetcher
     if _fetcher is None:
-        _fetcher = YouTubeFetcher(prefer_audio_only=prefer_audio_only)
+        _fetcher = YouTubeFetcher(
+            prefer_audio_only=prefer_audio_only, daemon=get_resolver_client()
+        )
     return _fetcher
@@ -0,0 +1,163 @@
+"""
+In-process yt-dlp extraction engine for LofiGirl Terminal.
+
+This module keeps a long-lived ``yt_dlp.YoutubeDL`` instance inside the
+application process instead of spawning the yt-dlp binary for every resolve.
+Extractions run on a small pool of worker threads, sized so that background
+prefetching and the station being opened can resolve concurrently. Each
+worker keeps its own YoutubeDL instances, so extractor state stays warm
+between resolves and no instance is ever used by two threads at once.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+try:
+    import yt_dlp
+
+    YT_DLP_AVAILABLE = True
+except ImportError:
+    YT_DLP_AVAILABLE = False
+
+from lofigirl_terminal.config import get_config
+from lofigirl_terminal.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class YtDlpEngine:
+    """
+    Long-lived in-process yt-dlp extractor.
+
+    One YoutubeDL instance is kept per worker thread and format selector.
+    Instances are only created and used on the worker that owns them.
+    """
+
+    def __init__(self, workers: int = 1) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            workers: Number of extractions that can run concurrently
+
+        Raises:
+            RuntimeError: If the yt_dlp library is not importable
+        """
+        if not YT_DLP_AVAILABLE:
+            raise RuntimeError(
+                "yt-dlp library is not installed. Install it with: pip install yt-dlp"
+            )
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="yt-dlp-engine"
+        )
+        # Per-thread {format selector: YoutubeDL}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._closed = False
+        logger.debug(f"YtDlpEngine initialized (workers={workers})")
+
+    @property
+    def version(self) -> str:
+        """Return the version of the loaded yt_dlp library."""
+        return str(yt_dlp.version.__version__)
+
+    def submit(self, url: str, format_selector: str) -> "Future[Dict[str, Any]]":
+        """
+        Schedule an extraction on a worker thread.
+
+        Args:
+            url: The YouTube video/stream URL
+            format_selector: yt-dlp format selector
+
+        Returns:
+            Future resolving to the yt-dlp info dictionary
+
+        Raises:
+            RuntimeError: If the engine has been shut down
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("YtDlpEngine has been shut down")
+            return self._executor.submit(self._extract, url, format_selector)
+
+    def extract(
+        self, url: str, format_selector: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract stream information, blocking until it is available.
+
+        Args:
+            url: The YouTube video/stream URL
+            format_selector: yt-dlp format selector
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            The yt-dlp info dictionary for the selected format
+
+        Raises:
+            concurrent.futures.TimeoutError: If the extraction took too long
+            yt_dlp.utils.DownloadError: If yt-dlp could not resolve the URL
+        """
+        return self.submit(url, format_selector).result(timeout=timeout)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads without waiting for pending extractions."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._executor.shutdown(wait=False)
+        logger.debug("YtDlpEngine shut down")
+
+    def _get_instance(self, format_selector: str) -> "yt_dlp.YoutubeDL":
+        """Return this worker's warm YoutubeDL instance for a format selector."""
+        instances: Dict[str, "yt_dlp.YoutubeDL"] = getattr(self._local, "instances", {})
+        self._local.instances = instances
+        instance = instances.get(format_selector)
+        if instance is None:
+            options = {
+                "format": format_selector,
+                "quiet": True,  # Suppress output to prevent UI interference
+                "no_warnings": True,
+                "noprogress": True,
+                "skip_download": True,
+                # Channel tabs such as @LofiGirl/streams only need one entry
+                "playlist_items": "1",
+            }
+            instance = yt_dlp.YoutubeDL(options)
+            instances[format_selector] = instance
+        return instance
+
+    def _extract(self, url: str, format_selector: str) -> Dict[str, Any]:
+        """Run the extraction; called on a worker thread only."""
+        info: Dict[str, Any] = self._get_instance(format_selector).extract_info(
+            url, download=False
+        )
+        entries = info.get("entries")
+        if entries is not None:
+            # Channel/playlist URLs resolve to their first entry
+            first: Optional[Dict[str, Any]] = next(iter(entries), None)
+            info = first or {}
+        return info
+
+
+# Cached engine instance
+_engine: Optional[YtDlpEngine] = None
+
+
+def get_engine() -> Optional[YtDlpEngine]:
+    """
+    Get or create the global YtDlpEngine instance.
+
+    The engine has one worker per background prefetch resolution plus one
+    for the station being opened, so prefetching never queues it behind.
+
+    Returns:
+        YtDlpEngine instance, or None if the yt_dlp library is not importable
+    """
+    global _engine
+    if _engine is None and YT_DLP_AVAILABLE:
+        _engine = YtDlpEngine(workers=get_config().prefetch_workers + 1)
+    return _engine
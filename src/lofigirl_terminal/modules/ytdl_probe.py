@@ -0,0 +1,146 @@
+"""
+yt-dlp capability probe for LofiGirl Terminal.
+
+This module finds the yt-dlp binary and records its version. The result
+is memoized for the lifetime of the process and also persisted next to the
+stream cache, keyed by the binary's path and mtime, so that cold starts only
+run yt-dlp again after it was upgraded or moved.
+"""
+
+import json
+import shutil
+import subprocess  # nosec B404 - subprocess is needed for yt-dlp integration
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from lofigirl_terminal.config import get_config
+from lofigirl_terminal.logger import get_logger
+from lofigirl_terminal.modules.stream_cache import write_json_atomic
+
+logger = get_logger(__name__)
+
+PROBE_FILE_NAME = "yt_dlp_probe.json"
+
+# Maximum time the probe command may take
+PROBE_TIMEOUT_SECONDS = 5
+
+
+@dataclass
+class YtDlpCapabilities:
+    """
+    Which yt-dlp binary is installed.
+
+    Attributes:
+        path: Absolute path of the yt-dlp binary, None if not found
+        mtime: Modification time of the binary when it was probed
+        version: Version string reported by ``yt-dlp --version``
+    """
+
+    path: Optional[str] = None
+    mtime: Optional[float] = None
+    version: Optional[str] = None
+
+    @property
+    def installed(self) -> bool:
+        """Return True if a working yt-dlp binary was found."""
+        return self.path is not None and self.version is not None
+
+
+def _run_yt_dlp(path: str, argument: str) -> Optional[str]:
+    """Run ``yt-dlp <argument>`` and return its stdout, or None on failure."""
+    try:
+        # Safe: command is built from a list, not shell=True
+        result = subprocess.run(  # nosec B603
+            [path, argument],
+            capture_output=True,
+            text=True,
+            timeout=PROBE_TIMEOUT_SECONDS,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"yt-dlp {argument} failed: {e}")
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _probe_binary(path: str, mtime: float) -> YtDlpCapabilities:
+    """Run yt-dlp to discover its version."""
+    version = _run_yt_dlp(path, "--version")
+    return YtDlpCapabilities(
+        path=path, mtime=mtime, version=version.strip() if version else None
+    )
+
+
+def _load_record(record_file: Path) -> Optional[YtDlpCapabilities]:
+    """Read a persisted probe result, ignoring unreadable files."""
+    try:
+        return YtDlpCapabilities(**json.loads(record_file.read_text("utf-8")))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _save_record(record_file: Path, capabilities: YtDlpCapabilities) -> None:
+    """Persist a probe result without ever leaving a truncated record."""
+    try:
+        write_json_atomic(record_file, asdict(capabilities))
+    except OSError as e:
+        logger.warning(f"Failed to persist yt-dlp probe: {e}")
+
+
+# Memoized probe result for this process
+_capabilities: Optional[YtDlpCapabilities] = None
+_probe_lock = threading.Lock()
+
+
+def probe_yt_dlp(
+    record_file: Optional[Path] = None, force: bool = False
+) -> YtDlpCapabilities:
+    """
+    Get the capabilities of the installed yt-dlp binary.
+
+    The first call in a process compares the binary's path and mtime with
+    the persisted record and only runs yt-dlp if they differ. Later calls
+    return the memoized result without touching the filesystem.
+
+    Args:
+        record_file: Where the probe is persisted. Defaults to
+                     ``config.audio_cache_dir / "yt_dlp_probe.json"``.
+        force: Ignore both the memoized and the persisted result
+
+    Returns:
+        YtDlpCapabilities describing the binary
+
+    Example:
+        >>> if probe_yt_dlp().installed:
+        ...     print("yt-dlp is ready!")
+    """
+    global _capabilities
+    with _probe_lock:
+        if _capabilities is not None and not force:
+            return _capabilities
+
+        path = shutil.which("yt-dlp")
+        if path is None:
+            logger.warning("yt-dlp is not installed")
+            _capabilities = YtDlpCapabilities()
+            return _capabilities
+
+        if record_file is None:
+            record_file = get_config().audio_cache_dir / PROBE_FILE_NAME
+        mtime = Path(path).stat().st_mtime
+
+        record = None if force else _load_record(record_file)
+        if record is not None and record.path == path and record.mtime == mtime:
+            logger.debug(f"Using recorded yt-dlp probe: {record.version}")
+            _capabilities = record
+            return _capabilities
+
+        _capabilities = _probe_binary(path, mtime)
+        if _capabilities.installed:
+            logger.info(f"yt-dlp is installed: {_capabilities.version}")
+            _save_record(record_file, _capabilities)
+        else:
+            logger.warning("yt-dlp is not installed or not accessible")
+        return _capabilities
@@ -5,24 +5,33 @@ This module provides a beautiful, interactive terminal interface for the
 lofi radio player with visualizations, controls, and animations.
 """
 
+import asyncio
+import signal
+import time
 import webbrowser
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from rich.align import Align
 from rich.panel import Panel
 from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal
+from textual.message import Message
 from textual.reactive import reactive
 from textual.widgets import Button, Footer, Header, Static
 
 from lofigirl_terminal.config import get_config
 from lofigirl_terminal.logger import get_logger
 from lofigirl_terminal.modules.ascii_art import AsciiArt, get_ascii_art
+from lofigirl_terminal.modules.event_bridge import EventBridge
 from lofigirl_terminal.modules.player_mpv import MPVPlayer, PlayerState
-from lofigirl_terminal.modules.stations import StationManager
+from lofigirl_terminal.modules.prefetch import StationPrefetcher, start_prefetch
+from lofigirl_terminal.modules.stations import Station, StationManager
 from lofigirl_terminal.modules.themes import ColorPalette, get_theme
+from lofigirl_terminal.modules.watchdog import PlaybackWatchdog, start_watchdog
+from lofigirl_terminal.modules.youtube_fetcher import get_fetcher
 
 logger = get_logger(__name__)
 
@@ -49,6 +58,15 @@ LOFI_GIRL_ASCII = """
 """
 
 
+class StationLoaded(Message):
+    """Posted when a background station load finishes."""
+
+    def __init__(self, station: Station, future: "Future[bool]") -> None:
+        self.station = station
+        self.future = future
+        super().__init__()
+
+
 class LofiAsciiArt(Static):
     """
     Animated ASCII art component with dynamic frame cycling.
@@ -145,6 +163,7 @@ class StationInfo(Static):
     station_name: reactive[str] = reactive("No Station")
     status: reactive[str] = reactive("Stopped")
     time_info: reactive[str] = reactive("00:00")
+    cache_health: reactive[str] = reactive("")
 
     def __init__(self, theme: ColorPalette, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -159,6 +178,9 @@ class StationInfo(Static):
         content.append(f"{self.status}\n", style=self.theme.warning)
         content.append("⏱️  Time: ", style=f"bold {self.theme.primary}")
         content.append(f"{self.time_info}", style=self.theme.foreground)
+        if self.cache_health:
+            content.append("\n📶 Cache: ", style=f"bold {self.theme.primary}")
+            content.append(self.cache_health, style=self.theme.foreground)
 
         return Panel(
             content,
@@ -248,6 +270,11 @@ class LofiGirlApp(App):
         self.ascii_art: AsciiArt = get_ascii_art(self.config.ascii_art)
         self.station_manager = StationManager()
         self.player: Optional[MPVPlayer] = None
+        self.prefetcher: Optional[StationPrefetcher] = None
+        self.player_events: Optional[EventBridge[PlayerState]] = None
+        # When quitting began (monotonic clock), to report quit latency
+        self.quit_started: Optional[float] = None
+        self.watchdog: Optional[PlaybackWatchdog] = None
         self.current_station_index = 0
         self.stations = self.station_manager.get_all_stations()
         self.start_time: Optional[datetime] = None
@@ -272,8 +299,24 @@ class LofiGirlApp(App):
         # Initialize player
         try:
             self.player = MPVPlayer(video_mode=False)
-            self.player.set_state_callback(self.on_player_state_change)
+            # State changes arrive on mpv's thread; only the latest of a
+            # burst is applied, on the UI loop
+            self.player_events = EventBridge(
+                asyncio.get_running_loop(),
+                self.on_player_state_change,
+                coalesce=lambda _state: "state",
+            )
+            self.player.set_state_callback(self.player_events.publish)
             logger.info("Player initialized")
+
+            # Warm the stream cache so station switches skip yt-dlp
+            self.prefetcher = start_prefetch(
+                get_fetcher(prefer_audio_only=not self.player.is_video_mode),
+                self.stations,
+                self.current_station_index,
+            )
+            # Reconnect on dead air instead of waiting for a key press
+            self.watchdog = start_watchdog(self.player)
         except Exception as e:
             logger.exception(f"Failed to initialize player: {e}")
             self.notify(
@@ -302,6 +345,14 @@ class LofiGirlApp(App):
             state = self.player.get_state()
             station_info.status = state.value.capitalize()
 
+    def neighbor_stations(self) -> List[Station]:
+        """Return the stations before and after the current one."""
+        count = len(self.stations)
+        return [
+            self.stations[(self.current_station_index - 1) % count],
+            self.stations[(self.current_station_index + 1) % count],
+        ]
+
     def update_time(self) -> None:
         """Update time display."""
         station_info = self.query_one("#station-info", StationInfo)
@@ -312,6 +363,7 @@ class LofiGirlApp(App):
                 hours, remainder = divmod(int(elapsed.total_seconds()), 3600)
                 minutes, seconds = divmod(remainder, 60)
 
+                # Reads the player's snapshot, not libmpv
                 if self.player.is_live_stream():
                     station_info.time_info = (
                         f"{hours:02d}:{minutes:02d}:{seconds:02d} (LIVE)"
@@ -324,8 +376,11 @@ class LofiGirlApp(App):
             station_info.time_info = "--:--:--"
             self.start_time = None
 
+        if self.player:
+            station_info.cache_health = self.player.get_snapshot().describe_health()
+
     def on_player_state_change(self, state: PlayerState) -> None:
-        """Called when player state changes."""
+        """Called on the UI loop when player state changes."""
         self.update_station_info()
 
         if state == PlayerState.PLAYING and self.start_time is None:
@@ -333,6 +388,18 @@ class LofiGirlApp(App):
         elif state in (PlayerState.STOPPED, PlayerState.ERROR):
             self.start_time = None
 
+    def on_station_loaded(self, message: StationLoaded) -> None:
+        """Report the outcome of a background station load."""
+        future = message.future
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Error loading {message.station.name}: {error}")
+            self.notify(f"Error: {error}", severity="error")
+        elif future.result():
+            self.notify(f"▶️ Playing: {message.station.name}")
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         button_id = event.button.id
@@ -370,19 +437,27 @@ class LofiGirlApp(App):
                 self.player.play()
                 self.notify("▶️ Resumed")
             else:
-                # Load and play current station
-                station = self.stations[self.current_station_index]
-                self.notify(f"Loading {station.name}...", timeout=5)
-
-                self.player.load_station(station)
-                self.player.play()
-
-                self.start_time = datetime.now()
-                self.notify(f"▶️ Playing: {station.name}")
+                self.play_current_station()
         except Exception as e:
             logger.exception(f"Error toggling play: {e}")
             self.notify(f"Error: {e}", severity="error")
 
+    def play_current_station(self) -> None:
+        """Load and play the selected station."""
+        if not self.player:
+            return
+
+        station = self.stations[self.current_station_index]
+        self.notify(f"Loading {station.name}...", timeout=5)
+
+        # Resolving can take seconds, so it runs off the UI thread. Queued
+        # neighbours are switched to without resolving at all.
+        self.player.set_neighbor_stations(self.neighbor_stations())
+        future = self.player.load_station_async(station, auto_play=True)
+        future.add_done_callback(
+            lambda done: self.post_message(StationLoaded(station, done))
+        )
+
     def action_stop(self) -> None:
         """Stop playback."""
         if self.player:
@@ -397,9 +472,10 @@ class LofiGirlApp(App):
         )
         self.update_station_info()
 
-        if self.player and self.player.is_playing():
-            self.player.stop()
-            self.action_toggle_play()
+        # A station still loading to play counts as playing
+        if self.player and self.player.wants_playback():
+            # No stop(): it would drop the neighbours queued in mpv
+            self.play_current_station()
         else:
             self.notify(f"Selected: {self.stations[self.current_station_index].name}")
 
@@ -410,9 +486,10 @@ class LofiGirlApp(App):
         )
         self.update_station_info()
 
-        if self.player and self.player.is_playing():
-            self.player.stop()
-            self.action_toggle_play()
+        # A station still loading to play counts as playing
+        if self.player and self.player.wants_playback():
+            # No stop(): it would drop the neighbours queued in mpv
+            self.play_current_station()
         else:
             self.notify(f"Selected: {self.stations[self.current_station_index].name}")
 
@@ -447,9 +524,20 @@ class LofiGirlApp(App):
 
     async def action_quit(self) -> None:
         """Quit the application."""
+        self.quit_started = time.monotonic()
+        self.release_resources()
+        self.exit()
+
+    def release_resources(self) -> None:
+        """Stop background work and release the player; safe to repeat."""
+        if self.prefetcher:
+            self.prefetcher.shutdown()
+        if self.player_events:
+            self.player_events.close()
+        if self.watchdog:
+            self.watchdog.stop()
         if self.player:
             self.player.cleanup()
-        self.exit()
 
 
 def run_tui() -> None:
@@ -459,7 +547,20 @@ def run_tui() -> None:
     This is the main entry point for the interactive TUI mode.
     """
     app = LofiGirlApp()
-    app.run()
+
+    def _stop(_signum: int, _frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    # Treat SIGTERM like Ctrl+C so mpv is released on the way out
+    signal.signal(signal.SIGTERM, _stop)
+    try:
+        app.run()
+    finally:
+        # Also covers exits that bypass action_quit
+        app.release_resources()
+    if app.quit_started is not None:
+        elapsed = time.monotonic() - app.quit_started
+        logger.debug(f"Quit to prompt took {elapsed * 1000:.0f} ms")
 
 
 if __name__ == "__main__":
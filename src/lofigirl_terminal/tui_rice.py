@@ -5,27 +5,48 @@ Compact, beautiful interface inspired by btop and other rice terminals.
 Features: ASCII art, audio visualization, minimal controls, clean design.
 """
 
+import asyncio
 import random
+import signal
+import time
 import webbrowser
+from concurrent.futures import Future
 from typing import Any, Optional
 
 from rich.text import Text
 from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, VerticalScroll
+from textual.message import Message
 from textual.reactive import reactive
 from textual.widgets import Button, Footer, Header, Label, Static
 
 from lofigirl_terminal.config import get_config
 from lofigirl_terminal.logger import get_logger
 from lofigirl_terminal.modules.ascii_art import AsciiArt, get_ascii_art
-from lofigirl_terminal.modules.player_mpv import MPVPlayer
+from lofigirl_terminal.modules.event_bridge import EventBridge
+from lofigirl_terminal.modules.player_mpv import MPVPlayer, PlayerState
+from lofigirl_terminal.modules.prefetch import StationPrefetcher, start_prefetch
 from lofigirl_terminal.modules.stations import Station, StationManager
 from lofigirl_terminal.modules.themes import ColorPalette, get_theme
+from lofigirl_terminal.modules.watchdog import PlaybackWatchdog, start_watchdog
+from lofigirl_terminal.modules.youtube_fetcher import get_fetcher
 
 logger = get_logger(__name__)
 
 
+class StationLoaded(Message):
+    """Posted when a background station load finishes."""
+
+    def __init__(
+        self, station: Station, future: "Future[bool]", auto_play: bool
+    ) -> None:
+        self.station = station
+        self.future = future
+        self.auto_play = auto_play
+        super().__init__()
+
+
 class CompactAsciiArt(Static):
     """Compact animated ASCII art - rice style."""
 
@@ -110,6 +131,7 @@ class CompactInfo(Static):
     state: reactive[str] = reactive("●")
     volume: reactive[int] = reactive(50)
     elapsed_time: reactive[str] = reactive("00:00")
+    cache_health: reactive[str] = reactive("")
 
     def __init__(self, theme: ColorPalette, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -157,6 +179,10 @@ class CompactInfo(Static):
             volume_bar = "━" * 10
         info.append(f"🔊 {volume_bar} {self.volume}%", style=self.theme.secondary)
 
+        if self.cache_health:
+            info.append("\n")
+            info.append(f"📶 {self.cache_health}", style=self.theme.muted)
+
         return info
 
 
@@ -271,6 +297,11 @@ class RiceLofiApp(App):
 
         # Initialize player and station manager
         self.player: Optional[MPVPlayer] = None
+        self.prefetcher: Optional[StationPrefetcher] = None
+        self.player_events: Optional[EventBridge[PlayerState]] = None
+        # When quitting began (monotonic clock), to report quit latency
+        self.quit_started: Optional[float] = None
+        self.watchdog: Optional[PlaybackWatchdog] = None
         self.station_manager = StationManager()
         self.current_station: Optional[Station] = None
         self.current_station_index = 0
@@ -312,15 +343,49 @@ class RiceLofiApp(App):
         # Initialize player
         try:
             self.player = MPVPlayer(video_mode=False)
+            # State changes arrive on mpv's thread; only the latest of a
+            # burst is applied, on the UI loop
+            self.player_events = EventBridge(
+                asyncio.get_running_loop(),
+                self.on_player_state_change,
+                coalesce=lambda _state: "state",
+            )
+            self.player.set_state_callback(self.player_events.publish)
             logger.info("MPV Player initialized")
 
             # Load first station
             if self.stations:
                 self.load_station(0)
+
+            # Warm the stream cache for the remaining stations
+            self.prefetcher = start_prefetch(
+                get_fetcher(prefer_audio_only=not self.player.is_video_mode),
+                self.stations,
+                self.current_station_index,
+            )
+            # Reconnect on dead air instead of waiting for a key press
+            self.watchdog = start_watchdog(self.player)
         except Exception as e:
             logger.exception(f"Failed to initialize player: {e}")
             self.notify(f"Player error: {e}", severity="error", timeout=5)
 
+        self.set_interval(1.0, self.update_cache_health)
+
+    def update_cache_health(self) -> None:
+        """Show cache fill, throughput and stalls from the player snapshot."""
+        if not self.player:
+            return
+        info = self.query_one("#info", CompactInfo)
+        info.cache_health = self.player.get_snapshot().describe_health()
+
+    def on_player_state_change(self, state: PlayerState) -> None:
+        """Reflect rebuffering, which no key press causes, in the info panel."""
+        info = self.query_one("#info", CompactInfo)
+        if state == PlayerState.BUFFERING:
+            info.state = "◌"
+        elif state == PlayerState.PLAYING and info.state == "◌":
+            info.state = "▶"
+
     def load_station(self, index: int, auto_play: bool = False) -> None:
         """Load a station by index and optionally start playback.
 
@@ -334,23 +399,52 @@ class RiceLofiApp(App):
         self.current_station_index = index % len(self.stations)
         self.current_station = self.stations[self.current_station_index]
 
+        count = len(self.stations)
+        self.player.set_neighbor_stations(
+            [
+                self.stations[(self.current_station_index - 1) % count],
+                self.stations[(self.current_station_index + 1) % count],
+            ]
+        )
+
         try:
-            self.player.load_station(self.current_station)
             info = self.query_one("#info", CompactInfo)
             info.station_name = self.current_station.name
-
-            if auto_play:
-                # Automatically start playback
-                self.player.play()
-                info.state = "▶"
-                logger.info(f"Loaded and playing station: {self.current_station.name}")
-            else:
-                info.state = "●"
-                logger.info(f"Loaded station: {self.current_station.name}")
+            info.state = "…"
+
+            # Resolving can take seconds, so it runs off the UI thread;
+            # post_message is safe to call from the loader thread
+            station = self.current_station
+            future = self.player.load_station_async(station, auto_play=auto_play)
+            future.add_done_callback(
+                lambda done: self.post_message(StationLoaded(station, done, auto_play))
+            )
         except Exception as e:
             logger.exception(f"Failed to load station: {e}")
             self.notify(f"Failed to load station: {e}", severity="error")
 
+    def on_station_loaded(self, message: StationLoaded) -> None:
+        """Show the outcome of a background station load."""
+        future = message.future
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Failed to load station: {error}")
+            self.notify(f"Failed to load station: {error}", severity="error")
+            return
+        if not future.result():
+            # Superseded by a newer station change
+            return
+
+        info = self.query_one("#info", CompactInfo)
+        if message.auto_play:
+            info.state = "▶"
+            logger.info(f"Loaded and playing station: {message.station.name}")
+        else:
+            info.state = "●"
+            logger.info(f"Loaded station: {message.station.name}")
+
     @on(Button.Pressed, "#play_pause")
     def action_play_pause(self) -> None:
         """Toggle play/pause."""
@@ -393,12 +487,10 @@ class RiceLofiApp(App):
         if not self.player:
             return
 
-        # Remember if we were playing
-        was_playing = self.player.is_playing()
-
-        # Stop current playback if playing
-        if was_playing:
-            self.player.stop()
+        # Remember if we were playing, or loading a station to play;
+        # playback is not stopped first, so the neighbours queued in mpv
+        # can be switched to directly
+        was_playing = self.player.wants_playback()
 
         # Load next station and auto-play if we were playing
         self.load_station(self.current_station_index + 1, auto_play=was_playing)
@@ -414,12 +506,10 @@ class RiceLofiApp(App):
         if not self.player:
             return
 
-        # Remember if we were playing
-        was_playing = self.player.is_playing()
-
-        # Stop current playback if playing
-        if was_playing:
-            self.player.stop()
+        # Remember if we were playing, or loading a station to play;
+        # playback is not stopped first, so the neighbours queued in mpv
+        # can be switched to directly
+        was_playing = self.player.wants_playback()
 
         # Load previous station and auto-play if we were playing
         self.load_station(self.current_station_index - 1, auto_play=was_playing)
@@ -486,15 +576,39 @@ class RiceLofiApp(App):
 
     def action_quit(self) -> None:
         """Quit the application."""
+        self.quit_started = time.monotonic()
+        self.release_resources()
+        self.exit()
+
+    def release_resources(self) -> None:
+        """Stop background work and release the player; safe to repeat."""
+        if self.prefetcher:
+            self.prefetcher.shutdown()
+        if self.player_events:
+            self.player_events.close()
+        if self.watchdog:
+            self.watchdog.stop()
         if self.player:
             self.player.cleanup()
-        self.exit()
 
 
 def run_rice_tui() -> None:
     """Run the rice-style TUI application."""
     app = RiceLofiApp()
-    app.run()
+
+    def _stop(_signum: int, _frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    # Treat SIGTERM like Ctrl+C so mpv is released on the way out
+    signal.signal(signal.SIGTERM, _stop)
+    try:
+        app.run()
+    finally:
+        # Also covers exits that bypass action_quit
+        app.release_resources()
+    if app.quit_started is not None:
+        elapsed = time.monotonic() - app.quit_started
+        logger.debug(f"Quit to prompt took {elapsed * 1000:.0f} ms")
 
 
 if __name__ == "__main__":
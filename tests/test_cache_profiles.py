@@ -0,0 +1,74 @@
+"""Tests for the mpv cache profiles module."""
+
+import pytest
+
+from lofigirl_terminal.modules.cache_profiles import (
+    MEMORY_BUDGETS,
+    MIB,
+    current_rss_bytes,
+    format_bytes,
+    get_cache_profile,
+)
+
+
+class TestGetCacheProfile:
+    """Test suite for get_cache_profile."""
+
+    @pytest.mark.parametrize(
+        "name, max_bytes, max_back_bytes, cache_secs",
+        [
+            ("minimal", 1 * MIB, 0, 10),
+            ("balanced", 4 * MIB, 1 * MIB, 30),
+            ("resilient", 16 * MIB, 8 * MIB, 120),
+        ],
+    )
+    def test_audio_profiles(
+        self, name: str, max_bytes: int, max_back_bytes: int, cache_secs: int
+    ) -> None:
+        """Test that the audio limits scale with the buffer size."""
+        profile = get_cache_profile(name, 4096, video=False)
+
+        assert profile.max_bytes == max_bytes
+        assert profile.max_back_bytes == max_back_bytes
+        assert profile.cache_secs == cache_secs
+
+    def test_video_gets_more(self) -> None:
+        """Test that video profiles are larger than audio ones."""
+        audio = get_cache_profile("balanced", 4096, video=False)
+        video = get_cache_profile("balanced", 4096, video=True)
+
+        assert video.max_bytes > audio.max_bytes
+        assert video.mode == "video"
+
+    @pytest.mark.parametrize("video", [False, True])
+    def test_budget_caps_total(self, video: bool) -> None:
+        """Test that no profile exceeds its mode's memory budget."""
+        profile = get_cache_profile("resilient", 65536, video=video)
+
+        assert profile.total_bytes <= MEMORY_BUDGETS[profile.mode]
+        assert profile.max_back_bytes > 0
+
+    def test_mpv_options(self) -> None:
+        """Test that the limits are passed to mpv in bytes."""
+        options = get_cache_profile("balanced", 4096, video=False).mpv_options()
+
+        assert options["demuxer_max_bytes"] == str(4 * MIB)
+        assert options["demuxer_max_back_bytes"] == str(1 * MIB)
+        assert options["cache_secs"] == 30
+
+    def test_unknown_profile(self) -> None:
+        """Test that unknown profile names are rejected."""
+        with pytest.raises(ValueError):
+            get_cache_profile("huge", 4096, video=False)
+
+
+def test_current_rss_bytes() -> None:
+    """Test that the RSS of the test process is reported."""
+    rss = current_rss_bytes()
+    assert rss is None or rss > MIB
+
+
+def test_format_bytes() -> None:
+    """Test byte formatting."""
+    assert format_bytes(512 * 1024) == "512 KiB"
+    assert format_bytes(3 * MIB // 2) == "1.5 MiB"
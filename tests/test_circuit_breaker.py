@@ -0,0 +1,78 @@
+"""Tests for the circuit breaker module."""
+
+import threading
+
+from lofigirl_terminal.modules.circuit_breaker import (
+    PROBE_LEASE_SECONDS,
+    CircuitBreaker,
+    CircuitState,
+)
+
+KEY = "audio|bestaudio/best|https://www.youtube.com/watch?v=dead"
+
+
+class TestCircuitBreaker:
+    """Test suite for CircuitBreaker class."""
+
+    def test_closed_by_default(self) -> None:
+        """Test that unknown keys are allowed."""
+        breaker = CircuitBreaker()
+        assert breaker.allow(KEY, now=0)
+        assert breaker.state(KEY) == CircuitState.CLOSED
+
+    def test_failure_opens_circuit(self) -> None:
+        """Test that a failure blocks requests until the cooldown elapses."""
+        breaker = CircuitBreaker(base_cooldown=10)
+        breaker.record_failure(KEY, now=0)
+
+        assert breaker.state(KEY) == CircuitState.OPEN
+        assert not breaker.allow(KEY, now=5)
+        assert breaker.retry_in(KEY, now=5) == 5
+
+    def test_cooldown_grows_and_is_capped(self) -> None:
+        """Test that consecutive failures double the cooldown up to the cap."""
+        breaker = CircuitBreaker(base_cooldown=10, max_cooldown=30)
+        cooldowns = [breaker.record_failure(KEY, now=0) for _ in range(4)]
+        assert cooldowns == [10, 20, 30, 30]
+
+    def test_half_open_lets_one_probe_through(self) -> None:
+        """Test that only one caller probes after the cooldown."""
+        breaker = CircuitBreaker(base_cooldown=10)
+        breaker.record_failure(KEY, now=0)
+
+        assert breaker.allow(KEY, now=10)
+        assert breaker.state(KEY) == CircuitState.HALF_OPEN
+        assert not breaker.allow(KEY, now=11)
+
+    def test_abandoned_probe_is_replaced(self) -> None:
+        """Test that a probe that never reports back does not block forever."""
+        breaker = CircuitBreaker(base_cooldown=10)
+        breaker.record_failure(KEY, now=0)
+        breaker.allow(KEY, now=10)
+        assert breaker.allow(KEY, now=10 + PROBE_LEASE_SECONDS)
+
+    def test_success_closes_circuit(self) -> None:
+        """Test that a successful probe resets the failure count."""
+        breaker = CircuitBreaker(base_cooldown=10)
+        breaker.record_failure(KEY, now=0)
+        breaker.record_failure(KEY, now=0)
+        breaker.record_success(KEY)
+
+        assert breaker.state(KEY) == CircuitState.CLOSED
+        assert breaker.record_failure(KEY, now=0) == 10
+
+    def test_schedule_probe_runs_once(self) -> None:
+        """Test that a scheduled probe runs once the cooldown has elapsed."""
+        breaker = CircuitBreaker(base_cooldown=0.2)
+        breaker.record_failure(KEY)
+        probed = threading.Event()
+        calls = []
+
+        def probe() -> None:
+            calls.append(KEY)
+            probed.set()
+
+        breaker.schedule_probe(KEY, probe)
+        breaker.schedule_probe(KEY, probe)
+        assert probed.wait(timeout=5)
+        assert len(calls) == 1
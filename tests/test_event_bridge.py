@@ -0,0 +1,98 @@
+"""Tests for the event bridge module."""
+
+import asyncio
+import threading
+from typing import List
+
+from lofigirl_terminal.modules.event_bridge import EventBridge
+
+
+async def settle() -> None:
+    """Let callbacks scheduled on the loop run."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestEventBridge:
+    """Test suite for EventBridge class."""
+
+    def test_delivers_on_loop_thread(self) -> None:
+        """Test that events published from a thread reach the loop thread."""
+        received: List[int] = []
+        threads: List[int] = []
+
+        def handler(event: int) -> None:
+            received.append(event)
+            threads.append(threading.get_ident())
+
+        async def scenario() -> None:
+            bridge = EventBridge(asyncio.get_running_loop(), handler)
+            publisher = threading.Thread(
+                target=lambda: [bridge.publish(n) for n in range(3)]
+            )
+            publisher.start()
+            publisher.join()
+            await settle()
+
+        asyncio.run(scenario())
+        assert received == [0, 1, 2]
+        assert set(threads) == {threading.get_ident()}
+
+    def test_coalesces_bursts(self) -> None:
+        """Test that a burst with one key is delivered as its latest event."""
+        received: List[str] = []
+
+        async def scenario() -> None:
+            bridge = EventBridge(
+                asyncio.get_running_loop(),
+                received.append,
+                coalesce=lambda event: event.split(":")[0],
+            )
+            for n in range(100):
+                bridge.publish(f"state:{n}")
+            bridge.publish("volume:5")
+            await settle()
+            bridge.publish("state:again")
+            await settle()
+
+        asyncio.run(scenario())
+        assert received == ["state:99", "volume:5", "state:again"]
+
+    def test_bounded(self) -> None:
+        """Test that the oldest events are dropped beyond the bound."""
+        received: List[int] = []
+
+        async def scenario() -> EventBridge:
+            bridge = EventBridge(
+                asyncio.get_running_loop(), received.append, max_pending=3
+            )
+            for n in range(5):
+                bridge.publish(n)
+            await settle()
+            return bridge
+
+        bridge = asyncio.run(scenario())
+        assert received == [2, 3, 4]
+        assert bridge.dropped == 2
+
+    def test_closed_bridge_ignores_events(self) -> None:
+        """Test that nothing is delivered after close()."""
+        received: List[int] = []
+
+        async def scenario() -> None:
+            bridge = EventBridge(asyncio.get_running_loop(), received.append)
+            bridge.publish(1)
+            bridge.close()
+            bridge.publish(2)
+            await settle()
+
+        asyncio.run(scenario())
+        assert received == []
+
+    def test_closed_loop(self) -> None:
+        """Test that publishing after the loop closed does not raise."""
+        loop = asyncio.new_event_loop()
+        bridge: EventBridge[int] = EventBridge(loop, lambda _event: None)
+        loop.close()
+
+        bridge.publish(1)
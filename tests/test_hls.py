@@ -0,0 +1,219 @@
+"""Tests for the HLS manifest module."""
+
+import httpx
+import pytest
+
+from lofigirl_terminal.modules import hls
+from lofigirl_terminal.modules.hls import (
+    HlsVariant,
+    MasterPlaylist,
+    is_hls_master_url,
+    parse_master_playlist,
+    select_media_playlist,
+    select_variant,
+)
+
+MASTER_URL = "https://manifest.googlevideo.com/api/manifest/hls_variant/id/x/index.m3u8"
+BASE = "https://manifest.googlevideo.com/api/manifest/hls_playlist/id/x"
+
+# Shaped like the master playlist of a YouTube live stream: muxed variants only
+YOUTUBE_MASTER = f"""#EXTM3U
+#EXT-X-INDEPENDENT-SEGMENTS
+#EXT-X-STREAM-INF:BANDWIDTH=290288,CODECS="mp4a.40.5,avc1.42c00b",RESOLUTION=256x144,FRAME-RATE=30
+{BASE}/itag/91/index.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=546239,CODECS="mp4a.40.5,avc1.4d4015",RESOLUTION=426x240,FRAME-RATE=30
+{BASE}/itag/92/index.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=1209916,CODECS="mp4a.40.2,avc1.4d401e",RESOLUTION=640x360,FRAME-RATE=30
+{BASE}/itag/93/index.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=1568654,CODECS="mp4a.40.2,avc1.4d401f",RESOLUTION=854x480,FRAME-RATE=30
+{BASE}/itag/94/index.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=2969974,CODECS="mp4a.40.2,avc1.4d401f",RESOLUTION=1280x720,FRAME-RATE=30
+{BASE}/itag/95/index.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=5420712,CODECS="mp4a.40.2,avc1.640028",RESOLUTION=1920x1080,FRAME-RATE=30
+{BASE}/itag/96/index.m3u8
+"""
+
+AUDIO_MASTER = """#EXTM3U
+#EXT-X-STREAM-INF:BANDWIDTH=48000,CODECS="mp4a.40.5"
+audio/48k.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=128000,CODECS="mp4a.40.2"
+audio/128k.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=256000,CODECS="mp4a.40.2"
+audio/256k.m3u8
+#EXT-X-STREAM-INF:BANDWIDTH=1209916,CODECS="mp4a.40.2,avc1.4d401e",RESOLUTION=640x360
+video/360p.m3u8
+"""
+
+
+def youtube_master() -> MasterPlaylist:
+    """Parse the YouTube-like master playlist."""
+    playlist = parse_master_playlist(YOUTUBE_MASTER, MASTER_URL)
+    assert playlist is not None
+    return playlist
+
+
+class TestParseMasterPlaylist:
+    """Test suite for parse_master_playlist."""
+
+    def test_parses_variants(self) -> None:
+        """Test that variant attributes are read."""
+        playlist = youtube_master()
+
+        assert len(playlist.variants) == 6
+        first = playlist.variants[0]
+        assert first.uri == f"{BASE}/itag/91/index.m3u8"
+        assert first.bandwidth == 290288
+        assert first.codecs == ("mp4a.40.5", "avc1.42c00b")
+        assert first.height == 144
+        assert not first.audio_only
+
+    def test_relative_uris(self) -> None:
+        """Test that relative URIs are resolved against the playlist URL."""
+        playlist = parse_master_playlist(
+            AUDIO_MASTER, "https://cdn.example/live/m.m3u8"
+        )
+
+        assert playlist is not None
+        assert playlist.variants[0].uri == "https://cdn.example/live/audio/48k.m3u8"
+        assert playlist.variants[0].audio_only
+
+    def test_audio_renditions(self) -> None:
+        """Test that separate audio renditions are collected."""
+        text = (
+            "#EXTM3U\n"
+            '#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aud",NAME="en",URI="a.m3u8"\n'
+            '#EXT-X-STREAM-INF:BANDWIDTH=800000,AUDIO="aud",RESOLUTION=640x360\n'
+            "v.m3u8\n"
+        )
+        playlist = parse_master_playlist(text, "https://cdn.example/m.m3u8")
+
+        assert playlist is not None
+        assert [v.uri for v in playlist.audio_renditions] == [
+            "https://cdn.example/a.m3u8"
+        ]
+
+    def test_media_playlist_is_not_master(self) -> None:
+        """Test that media playlists and other text are rejected."""
+        media = "#EXTM3U\n#EXT-X-TARGETDURATION:5\n#EXTINF:5.0,\nseg1.ts\n"
+        assert parse_master_playlist(media, MASTER_URL) is None
+        assert parse_master_playlist("<html></html>", MASTER_URL) is None
+
+
+class TestSelectVariant:
+    """Test suite for select_variant."""
+
+    @pytest.mark.parametrize(
+        "quality, audio_only, itag",
+        [
+            ("low", True, 91),
+            ("medium", True, 94),
+            ("high", True, 96),
+            ("low", False, 93),
+            ("medium", False, 95),
+            ("high", False, 96),
+        ],
+    )
+    def test_muxed_only(self, quality: str, audio_only: bool, itag: int) -> None:
+        """Test the tiers on a stream without audio-only variants."""
+        variant = select_variant(youtube_master(), quality, audio_only)
+        assert f"/itag/{itag}/" in variant.uri
+
+    @pytest.mark.parametrize(
+        "quality, name", [("low", "48k"), ("medium", "128k"), ("high", "256k")]
+    )
+    def test_prefers_audio_only_variants(self, quality: str, name: str) -> None:
+        """Test that audio-only sessions never pick a video variant."""
+        playlist = parse_master_playlist(AUDIO_MASTER, "https://cdn.example/m.m3u8")
+
+        assert playlist is not None
+        variant = select_variant(playlist, quality, audio_only=True)
+        assert variant.uri.endswith(f"audio/{name}.m3u8")
+
+    @pytest.mark.parametrize("quality", ["low", "medium", "high"])
+    def test_audio_rendition_fallback(self, quality: str) -> None:
+        """Test that unranked audio renditions fall back to the first one."""
+        playlist = MasterPlaylist(
+            variants=[HlsVariant("https://a/v", 800_000, ("avc1.4d401e",), 360)],
+            audio_renditions=[HlsVariant("https://a/en"), HlsVariant("https://a/de")],
+        )
+        assert select_variant(playlist, quality, audio_only=True).uri == "https://a/en"
+        assert select_variant(playlist, quality, audio_only=False).uri == "https://a/v"
+
+    def test_smallest_when_nothing_fits(self) -> None:
+        """Test that the smallest variant is used when all exceed the cap."""
+        playlist = MasterPlaylist(
+            variants=[
+                HlsVariant("https://a/big", 3_000_000, ("avc1.4d401f",), 720),
+                HlsVariant("https://a/small", 1_500_000, ("avc1.4d401f",), 480),
+            ]
+        )
+        assert (
+            select_variant(playlist, "low", audio_only=False).uri == "https://a/small"
+        )
+
+
+class TestSelectMediaPlaylist:
+    """Test suite for select_media_playlist."""
+
+    @pytest.fixture
+    def requests(self, monkeypatch: pytest.MonkeyPatch) -> list:
+        """Serve the YouTube-like master playlist through a mock transport."""
+        seen: list = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(str(request.url))
+            if "hls_variant" not in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, text=YOUTUBE_MASTER)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(hls, "_client", client)
+        monkeypatch.setattr(hls, "_selections", {})
+        return seen
+
+    def test_master_url_detection(self) -> None:
+        """Test which URLs are treated as master playlists."""
+        assert is_hls_master_url(MASTER_URL)
+        assert is_hls_master_url("https://cdn.example/live/master.m3u8")
+        assert not is_hls_master_url(f"{BASE}/itag/91/index.m3u8")
+        assert not is_hls_master_url("https://rr1.googlevideo.com/videoplayback?x=1")
+
+    def test_returns_media_playlist(self, requests: list) -> None:
+        """Test that a master URL is replaced by the selected variant."""
+        url = select_media_playlist(MASTER_URL, "low", audio_only=True)
+
+        assert url == f"{BASE}/itag/91/index.m3u8"
+        assert requests == [MASTER_URL]
+
+    def test_other_urls_untouched(self, requests: list) -> None:
+        """Test that non-master URLs are returned without a request."""
+        url = "https://rr1.googlevideo.com/videoplayback?expire=1"
+
+        assert select_media_playlist(url, "low") == url
+        assert requests == []
+
+    def test_fetch_failure_keeps_master(self, requests: list) -> None:
+        """Test that mpv still gets the master when it cannot be fetched."""
+        url = "https://cdn.example/live/master.m3u8"
+
+        assert select_media_playlist(url, "low") == url
+        assert requests == [url]
+
+    def test_selection_is_remembered(self, requests: list) -> None:
+        """Test that a master URL is only fetched once per tier."""
+        first = select_media_playlist(MASTER_URL, "low", audio_only=True)
+        again = select_media_playlist(MASTER_URL, "low", audio_only=True)
+        video = select_media_playlist(MASTER_URL, "low", audio_only=False)
+
+        assert again == first
+        assert video != first
+        assert requests == [MASTER_URL, MASTER_URL]
+
+    def test_expired_master_is_fetched_again(self, requests: list) -> None:
+        """Test that picks are not reused once the master URL expired."""
+        url = MASTER_URL.replace("/id/x/", "/expire/1/id/x/")
+
+        select_media_playlist(url, "low")
+        select_media_playlist(url, "low")
+
+        assert requests == [url, url]
@@ -0,0 +1,224 @@
+"""Tests for the live stream discovery module."""
+
+import json
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from lofigirl_terminal.modules import live_discovery
+from lofigirl_terminal.modules.live_discovery import (
+    LiveDiscovery,
+    LiveStream,
+    is_channel_url,
+    match_stream,
+    parse_flat_playlist,
+    streams_tab_url,
+)
+from lofigirl_terminal.modules.stations import Station
+
+CHANNEL_URL = "https://www.youtube.com/@LofiGirl/streams"
+
+LISTING = [
+    {"id": "study", "title": "lofi hip hop radio 📚 beats to relax/study to"},
+    {"id": "sleep", "title": "lofi hip hop radio 💤 beats to sleep/chill to"},
+    {"id": "synth", "title": "synthwave radio 🌌 beats to chill/game to"},
+    {"id": "old", "title": "jazz lofi radio 🎷 (ended)", "live_status": "was_live"},
+]
+
+
+class FakeYtDlp:
+    """Stand-in for subprocess.run that returns a flat channel listing."""
+
+    def __init__(self, entries: List[dict], returncode: int = 0) -> None:
+        self.entries = entries
+        self.returncode = returncode
+        self.calls: List[List[str]] = []
+
+    def __call__(self, cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        self.calls.append(cmd)
+        stdout = "".join(json.dumps(entry) + "\n" for entry in self.entries)
+        return subprocess.CompletedProcess(cmd, self.returncode, stdout, "error")
+
+
+def make_station(station_id: str, name: str, genre: str) -> Station:
+    """Create a channel station for testing."""
+    return Station(
+        id=station_id, name=name, url=CHANNEL_URL, description="", genre=genre
+    )
+
+
+@pytest.fixture
+def fake_yt_dlp(monkeypatch: pytest.MonkeyPatch) -> FakeYtDlp:
+    """Replace subprocess.run in the discovery module with a fake yt-dlp."""
+    fake = FakeYtDlp(LISTING)
+    monkeypatch.setattr(live_discovery.subprocess, "run", fake)
+    return fake
+
+
+@pytest.fixture
+def discovery(tmp_path: Path) -> LiveDiscovery:
+    """Create an isolated discovery instance."""
+    return LiveDiscovery(tmp_path / "live_streams.json")
+
+
+class TestHelpers:
+    """Test suite for the URL and parsing helpers."""
+
+    def test_is_channel_url(self) -> None:
+        """Test channel URL detection."""
+        assert is_channel_url(CHANNEL_URL)
+        assert is_channel_url("https://youtube.com/channel/UCabc")
+        assert not is_channel_url("https://www.youtube.com/watch?v=jfKfPfyJRdk")
+        assert not is_channel_url("https://example.com/@LofiGirl")
+
+    def test_streams_tab_url(self) -> None:
+        """Test that any channel URL maps to its streams tab."""
+        assert streams_tab_url("https://m.youtube.com/@LofiGirl") == CHANNEL_URL
+        assert streams_tab_url("https://www.youtube.com/@LofiGirl/videos/") == (
+            CHANNEL_URL
+        )
+
+    def test_parse_flat_playlist_skips_finished_streams(self) -> None:
+        """Test that only live entries are kept."""
+        stdout = "".join(json.dumps(entry) + "\n" for entry in LISTING)
+        streams = parse_flat_playlist(stdout + "not json\n")
+        assert [s.video_id for s in streams] == ["study", "sleep", "synth"]
+
+    def test_match_stream_by_name_and_genre(self) -> None:
+        """Test that the most specific title wins."""
+        streams = [LiveStream(entry["id"], entry["title"]) for entry in LISTING[:3]]
+        sleep = make_station(
+            "lofi-sleep", "💤 Lofi Hip Hop Radio - Beats to Sleep/Chill", "lofi-sleep"
+        )
+        synth = make_station(
+            "synthwave", "🌌 Synthwave Radio - Beats to Chill/Game", "synthwave"
+        )
+        jazz = make_station("lofi-jazz", "🎷 Jazz Radio", "lofi-jazz")
+
+        assert match_stream(sleep, streams) == streams[1]
+        assert match_stream(synth, streams) == streams[2]
+        assert match_stream(jazz, streams) is None
+
+
+class TestLiveDiscovery:
+    """Test suite for LiveDiscovery class."""
+
+    def test_maps_channel_station_to_watch_url(
+        self, discovery: LiveDiscovery, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that a channel station resolves to its live stream."""
+        station = make_station("synthwave", "Synthwave Radio", "synthwave")
+        url = discovery.source_url(station)
+
+        assert url == "https://www.youtube.com/watch?v=synth"
+        assert "--flat-playlist" in fake_yt_dlp.calls[0]
+
+    def test_channel_listed_once_for_all_stations(
+        self, discovery: LiveDiscovery, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that stations sharing a channel reuse one listing."""
+        discovery.source_url(make_station("synthwave", "Synthwave", "synthwave"))
+        discovery.source_url(make_station("lofi-sleep", "Sleep", "lofi-sleep"))
+        assert len(fake_yt_dlp.calls) == 1
+
+    def test_mapping_persists(
+        self, discovery: LiveDiscovery, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that a new instance reuses the persisted mapping."""
+        station = make_station("synthwave", "Synthwave", "synthwave")
+        discovery.source_url(station)
+
+        reloaded = LiveDiscovery(discovery.cache_file)
+        assert reloaded.source_url(station) == "https://www.youtube.com/watch?v=synth"
+        assert len(fake_yt_dlp.calls) == 1
+
+    def test_expired_mapping_is_rediscovered(
+        self, tmp_path: Path, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that mappings are not reused after their TTL."""
+        discovery = LiveDiscovery(tmp_path / "live_streams.json", ttl=-1)
+        station = make_station("synthwave", "Synthwave", "synthwave")
+        discovery.source_url(station)
+        discovery.source_url(station)
+        assert len(fake_yt_dlp.calls) == 2
+
+    def test_failed_listing_keeps_station_url(
+        self, discovery: LiveDiscovery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that discovery failures fall back to the channel URL."""
+        monkeypatch.setattr(
+            live_discovery.subprocess, "run", FakeYtDlp([], returncode=1)
+        )
+        station = make_station("synthwave", "Synthwave", "synthwave")
+        assert discovery.source_url(station) == CHANNEL_URL
+
+    def test_failed_listing_is_remembered(
+        self, discovery: LiveDiscovery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unreachable channel is not listed on every lookup."""
+        failing = FakeYtDlp([], returncode=1)
+        monkeypatch.setattr(live_discovery.subprocess, "run", failing)
+        station = make_station("synthwave", "Synthwave", "synthwave")
+        discovery.source_url(station)
+        discovery.source_url(make_station("study", "Study", "hip-hop"))
+        assert len(failing.calls) == 1
+
+        discovery.invalidate(station)
+        discovery.source_url(station)
+        assert len(failing.calls) == 2
+
+    def test_concurrent_lookups_share_listing(
+        self, discovery: LiveDiscovery, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that lookups during a listing wait for it instead of relisting."""
+        started = threading.Event()
+        release = threading.Event()
+        fake = FakeYtDlp(LISTING)
+
+        def slow_listing(cmd: List[str], **kwargs: Any) -> Any:
+            started.set()
+            release.wait(5)
+            return fake(cmd, **kwargs)
+
+        other = Station(
+            id="other",
+            name="Synthwave",
+            url="https://www.youtube.com/@Other/streams",
+            description="",
+            genre="synthwave",
+        )
+        monkeypatch.setattr(live_discovery.subprocess, "run", fake)
+        assert discovery.source_url(other).endswith("v=synth")
+
+        monkeypatch.setattr(live_discovery.subprocess, "run", slow_listing)
+        synthwave = make_station("synthwave", "Synthwave", "synthwave")
+        sleep = make_station("sleep", "Sleep", "sleep")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(discovery.source_url, synthwave)
+            assert started.wait(5)
+            second = executor.submit(discovery.source_url, sleep)
+            # Stations of other channels are not held up behind the listing
+            assert discovery.source_url(other).endswith("v=synth")
+            assert not first.done()
+            release.set()
+
+            assert first.result(5) == "https://www.youtube.com/watch?v=synth"
+            assert second.result(5) == "https://www.youtube.com/watch?v=sleep"
+        assert len(fake.calls) == 2
+
+    def test_video_stations_are_untouched(
+        self, discovery: LiveDiscovery, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that stations with a video URL skip discovery."""
+        station = Station(
+            id="direct",
+            name="direct",
+            url="https://www.youtube.com/watch?v=jfKfPfyJRdk",
+            description="",
+        )
+        assert discovery.source_url(station) == station.url
+        assert fake_yt_dlp.calls == []
@@ -0,0 +1,750 @@
+"""Tests for the mpv player module, using a fake python-mpv."""
+
+import threading
+import types
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pytest
+
+from lofigirl_terminal.modules import player_mpv
+from lofigirl_terminal.modules.player_mpv import (
+    MPVPlayer,
+    PlayerSnapshot,
+    PlayerState,
+    _fade_filter,
+)
+from lofigirl_terminal.modules.stations import Station
+from lofigirl_terminal.modules.youtube_fetcher import StreamInfo
+
+
+class FakeMPV:
+    """Records what the player asks of mpv."""
+
+    def __init__(self, **options: Any) -> None:
+        self.options = options
+        self.played: List[str] = []
+        self.playlist: List[str] = []
+        self.position = -1
+        self.observers: Dict[str, Callable[..., None]] = {}
+        self.events: Dict[str, Callable[..., None]] = {}
+        self.pause = False
+        self.volume = options.get("volume", 50)
+        self.mute = False
+        self.af = ""
+        self.stops = 0
+        self.terminated = False
+
+    def property_observer(self, name: str) -> Callable[..., Any]:
+        def register(callback: Callable[..., None]) -> Callable[..., None]:
+            self.observers[name] = callback
+            return callback
+
+        return register
+
+    def observe_property(self, name: str, callback: Callable[..., None]) -> None:
+        self.observers[name] = callback
+
+    def event_callback(self, name: str) -> Callable[..., Any]:
+        def register(callback: Callable[..., None]) -> Callable[..., None]:
+            self.events[name] = callback
+            return callback
+
+        return register
+
+    @property
+    def playlist_pos(self) -> int:
+        return self.position
+
+    @playlist_pos.setter
+    def playlist_pos(self, index: int) -> None:
+        self.position = index
+        self.played.append(self.playlist[index])
+
+    def play(self, url: str) -> None:
+        self.loadfile(url)
+
+    def loadfile(self, url: str, mode: str = "replace") -> None:
+        if mode == "append":
+            self.playlist.append(url)
+            return
+        self.playlist = [url]
+        self.position = 0
+        self.played.append(url)
+
+    def playlist_clear(self) -> None:
+        # Like mpv, keeps the entry that is playing
+        self.playlist = [self.playlist[self.position]]
+        self.position = 0
+
+    def stop(self) -> None:
+        self.stops += 1
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+
+class BlockingResolver:
+    """Resolver whose resolutions wait until released."""
+
+    name = "blocking"
+
+    def __init__(self) -> None:
+        self.release: Dict[str, threading.Event] = {}
+        self.fail: Optional[str] = None
+        self.bypassed: List[str] = []
+
+    def resolve_station(
+        self, station: Station, bypass_cache: bool = False
+    ) -> Optional[StreamInfo]:
+        self.release.setdefault(station.id, threading.Event()).wait(timeout=5)
+        if bypass_cache:
+            self.bypassed.append(station.id)
+        if station.id == self.fail:
+            return None
+        return StreamInfo(url=f"https://cdn.example/{station.id}", title=station.name)
+
+    def retry_in(self, station: Station) -> float:
+        return 0.0
+
+    def finish(self, station_id: str) -> None:
+        self.release.setdefault(station_id, threading.Event()).set()
+
+
+def make_station(station_id: str) -> Station:
+    """Create a station for testing."""
+    return Station(
+        id=station_id,
+        name=station_id.title(),
+        url=f"https://example.com/{station_id}.mp3",
+        description="",
+    )
+
+
+@pytest.fixture
+def resolver(monkeypatch: pytest.MonkeyPatch) -> BlockingResolver:
+    """Install a blocking resolver as the player's resolver."""
+    blocking = BlockingResolver()
+    monkeypatch.setattr(player_mpv, "get_resolver", lambda **_: blocking)
+    return blocking
+
+
+@pytest.fixture
+def player(monkeypatch: pytest.MonkeyPatch) -> Iterator[MPVPlayer]:
+    """Create a player backed by FakeMPV."""
+    monkeypatch.setattr(
+        player_mpv, "mpv", types.SimpleNamespace(MPV=FakeMPV), raising=False
+    )
+    monkeypatch.setattr(player_mpv, "MPV_AVAILABLE", True)
+    instance = MPVPlayer()
+    yield instance
+    instance.cleanup()
+
+
+def fake_mpv(player: MPVPlayer) -> FakeMPV:
+    """Get the fake mpv instance behind a player."""
+    assert isinstance(player._mpv, FakeMPV)
+    return player._mpv
+
+
+def played(player: MPVPlayer) -> List[str]:
+    """Get the URLs the fake mpv started playing."""
+    return fake_mpv(player).played
+
+
+def wait_for_queue(player: MPVPlayer, length: int) -> None:
+    """Wait until the neighbours are queued behind the current station."""
+    for _ in range(250):
+        if len(player._queued) == length:
+            return
+        threading.Event().wait(0.02)
+    raise AssertionError(f"queue never reached {length} entries")
+
+
+def wait_for_release(core: FakeMPV) -> None:
+    """Wait until a released core has been terminated in the background."""
+    for _ in range(250):
+        if core.terminated:
+            return
+        threading.Event().wait(0.02)
+    raise AssertionError("core was never terminated")
+
+
+class TestLoadStationAsync:
+    """Test suite for MPVPlayer.load_station_async."""
+
+    def test_returns_before_resolution(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that the caller is not blocked and sees the LOADING state."""
+        states: List[PlayerState] = []
+        player.set_state_callback(states.append)
+
+        future = player.load_station_async(make_station("a"), auto_play=True)
+
+        assert not future.done()
+        assert player.get_state() == PlayerState.LOADING
+        resolver.finish("a")
+        assert future.result(timeout=5) is True
+        assert states == [PlayerState.LOADING, PlayerState.PLAYING]
+        assert played(player) == ["https://cdn.example/a"]
+
+    def test_without_auto_play(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that a loaded station waits for play()."""
+        resolver.finish("a")
+        assert player.load_station_async(make_station("a")).result(timeout=5)
+
+        assert player.get_state() == PlayerState.STOPPED
+        assert played(player) == []
+        player.play()
+        assert played(player) == ["https://cdn.example/a"]
+
+    def test_play_while_loading(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that play() during a load starts playback once it is ready."""
+        future = player.load_station_async(make_station("a"))
+        player.play()
+        assert played(player) == []
+
+        resolver.finish("a")
+        future.result(timeout=5)
+        assert player.get_state() == PlayerState.PLAYING
+        assert played(player) == ["https://cdn.example/a"]
+
+    def test_newer_load_supersedes(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that a slow earlier load is cancelled by a newer one."""
+        first = player.load_station_async(make_station("a"), auto_play=True)
+        second = player.load_station_async(make_station("b"), auto_play=True)
+
+        resolver.finish("b")
+        assert second.result(timeout=5) is True
+        resolver.finish("a")
+        assert first.cancelled()
+
+        assert player.current_station is not None
+        assert player.current_station.id == "b"
+        assert played(player) == ["https://cdn.example/b"]
+
+    def test_double_switch_while_loading(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that a second station change during a load keeps playing."""
+        resolver.finish("a")
+        player.load_station_async(make_station("a"), auto_play=True).result(5)
+        player.load_station_async(make_station("b"), auto_play=True)
+        assert not player.is_playing()
+        assert player.wants_playback()
+
+        third = player.load_station_async(
+            make_station("c"), auto_play=player.wants_playback()
+        )
+        resolver.finish("c")
+        assert third.result(timeout=5) is True
+        resolver.finish("b")
+
+        assert player.get_state() == PlayerState.PLAYING
+        assert player.current_station is not None
+        assert player.current_station.id == "c"
+        assert played(player)[-1] == "https://cdn.example/c"
+
+    def test_load_without_auto_play_stops_mpv(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that mpv does not keep playing a station the state calls STOPPED."""
+        resolver.finish("a")
+        resolver.finish("b")
+        player.load_station_async(make_station("a"), auto_play=True).result(5)
+        core = fake_mpv(player)
+
+        assert player.load_station_async(make_station("b")).result(5) is True
+        assert player.get_state() == PlayerState.STOPPED
+        assert core.stops == 1
+
+    def test_stop_while_loading(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that stopping during a load keeps the player stopped."""
+        future = player.load_station_async(make_station("a"), auto_play=True)
+        player.stop()
+
+        assert future.cancelled()
+        assert player.get_state() == PlayerState.STOPPED
+        assert not player.wants_playback()
+        resolver.finish("a")
+        threading.Event().wait(0.1)
+        assert player.get_state() == PlayerState.STOPPED
+        assert played(player) == []
+
+    def test_failure(self, player: MPVPlayer, resolver: BlockingResolver) -> None:
+        """Test that a failed load raises from the future and sets ERROR."""
+        resolver.fail = "a"
+        resolver.finish("a")
+        future: Future = player.load_station_async(make_station("a"))
+
+        with pytest.raises(RuntimeError, match="Failed to fetch stream URL"):
+            future.result(timeout=5)
+        assert player.get_state() == PlayerState.ERROR
+
+    def test_empty_url_rejected(self, player: MPVPlayer) -> None:
+        """Test that invalid stations are rejected immediately."""
+        station = Station(id="x", name="X", url="", description="")
+        with pytest.raises(ValueError):
+            player.load_station_async(station)
+
+
+def test_cache_profile_applied(player: MPVPlayer, resolver: BlockingResolver) -> None:
+    """Test that mpv gets the profile's cache limits and they are reported."""
+    resolver.finish("a")
+    player.load_station_async(make_station("a"), auto_play=True).result(5)
+
+    options = fake_mpv(player).options
+    assert options["demuxer_max_bytes"] == str(player.cache_profile.max_bytes)
+    assert options["cache_secs"] == player.cache_profile.cache_secs
+    report = player.get_cache_report()
+    assert report["max_bytes"] == player.cache_profile.max_bytes
+    assert report["cached_bytes"] is None
+    assert player.describe_cache().startswith(player.cache_profile.describe())
+
+
+class TestNeighborQueue:
+    """Test suite for queueing neighbouring stations in mpv's playlist."""
+
+    @pytest.fixture
+    def playing(self, player: MPVPlayer, resolver: BlockingResolver) -> MPVPlayer:
+        """Play station "b" with "a" and "c" as its neighbours."""
+        for station_id in ("a", "b", "c"):
+            resolver.finish(station_id)
+        player.set_neighbor_stations([make_station("a"), make_station("c")])
+        player.load_station_async(make_station("b"), auto_play=True).result(5)
+        wait_for_queue(player, 3)
+        return player
+
+    def test_neighbors_queued(self, playing: MPVPlayer) -> None:
+        """Test that the next station directly follows the current one."""
+        assert fake_mpv(playing).playlist == [
+            "https://cdn.example/b",
+            "https://cdn.example/c",
+            "https://cdn.example/a",
+        ]
+        assert fake_mpv(playing).options["prefetch_playlist"] is True
+
+    def test_switch_is_a_playlist_jump(
+        self, playing: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that switching to a queued station skips resolving."""
+        # Resolving "c" again would block until the test times out
+        resolver.release["c"] = threading.Event()
+
+        future = playing.load_station_async(make_station("c"), auto_play=True)
+
+        assert future.done() and future.result() is True
+        assert playing.get_state() == PlayerState.PLAYING
+        assert playing.current_station is not None
+        assert playing.current_station.id == "c"
+        assert fake_mpv(playing).playlist_pos == 1
+        assert played(playing)[-1] == "https://cdn.example/c"
+        resolver.finish("c")
+
+    def test_switch_cancels_pending_load(
+        self, playing: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that jumping to a queued station cancels a load in flight."""
+        pending = playing.load_station_async(make_station("d"), auto_play=True)
+        playing.load_station_async(make_station("c"), auto_play=True)
+
+        assert pending.cancelled()
+        assert playing.current_station is not None
+        assert playing.current_station.id == "c"
+        resolver.finish("d")
+
+    def test_stop_clears_queue(self, playing: MPVPlayer) -> None:
+        """Test that a stopped player does not jump to stale entries."""
+        playing.stop()
+        assert playing._queued == []
+
+        future = playing.load_station_async(make_station("c"), auto_play=True)
+        assert future.result(timeout=5) is True
+        # Resolved and played afresh rather than jumped to
+        assert fake_mpv(playing).playlist[0] == "https://cdn.example/c"
+        assert fake_mpv(playing).playlist_pos == 0
+
+
+class TestStreamRefresh:
+    """Test suite for adopting refreshed stream URLs."""
+
+    def test_hot_swap_loads_selected_variant(
+        self,
+        player: MPVPlayer,
+        resolver: BlockingResolver,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a hot-swapped URL goes through variant selection."""
+        monkeypatch.setattr(player.config, "hls_variant_selection", True)
+        monkeypatch.setattr(player.config, "stream_refresh_hot_swap", True)
+        monkeypatch.setattr(
+            player_mpv,
+            "select_media_playlist",
+            lambda url, quality, audio_only: f"{url}#variant",
+        )
+        station = make_station("a")
+        resolver.finish("a")
+        player.load_station_async(station, auto_play=True).result(5)
+
+        player._on_stream_refreshed(
+            station, StreamInfo(url="https://cdn.example/fresh", title="a")
+        )
+
+        assert played(player)[-1] == "https://cdn.example/fresh#variant"
+
+
+class TestCrossfade:
+    """Test suite for crossfading between stations on two mpv cores."""
+
+    @pytest.fixture
+    def fading(
+        self,
+        player: MPVPlayer,
+        resolver: BlockingResolver,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> MPVPlayer:
+        """Play station "a" with crossfading enabled."""
+        monkeypatch.setattr(player.config, "crossfade_enabled", True)
+        monkeypatch.setattr(player.config, "crossfade_seconds", 0.1)
+        for station_id in ("a", "b"):
+            resolver.finish(station_id)
+        player.load_station_async(make_station("a"), auto_play=True).result(5)
+        return player
+
+    def test_fade_filter(self) -> None:
+        """Test that the ramps run from silence to full volume and back."""
+        assert _fade_filter("in", 2) == (
+            "@crossfade:lavfi=[volume=volume='min(1,(t-startt)/2)':eval=frame]"
+        )
+        assert "max(0,1-(t-startt)/0.5)" in _fade_filter("out", 0.5)
+
+    def test_switch_overlaps_cores(self, fading: MPVPlayer) -> None:
+        """Test that the old core plays on until the new one is audible."""
+        outgoing = fake_mpv(fading)
+        assert fading.load_station_async(make_station("b"), auto_play=True).result(5)
+
+        incoming = fake_mpv(fading)
+        assert incoming is not outgoing
+        assert incoming.played == ["https://cdn.example/b"]
+        assert "min(1," in incoming.af
+        assert outgoing.af == "" and not outgoing.terminated
+
+        # Events of the outgoing core no longer drive the player state
+        outgoing.events["end-file"]({"reason": "error"})
+        assert fading.get_state() == PlayerState.PLAYING
+
+        incoming.events["playback-restart"]({})
+        assert "max(0," in outgoing.af
+        wait_for_release(outgoing)
+        assert fading._outgoing is None
+
+    def test_stop_releases_outgoing(
+        self, fading: MPVPlayer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that stopping mid-fade silences both cores without blocking."""
+        outgoing = fake_mpv(fading)
+        fading.load_station_async(make_station("b"), auto_play=True).result(5)
+        shutting_down = threading.Event()
+
+        def slow_terminate() -> None:
+            shutting_down.wait(timeout=5)
+            outgoing.terminated = True
+
+        monkeypatch.setattr(outgoing, "terminate", slow_terminate)
+        fading.stop()
+        assert outgoing.mute and not outgoing.terminated
+        assert fading._outgoing is None
+        assert fading.get_state() == PlayerState.STOPPED
+
+        shutting_down.set()
+        wait_for_release(outgoing)
+
+    def test_pause_releases_outgoing(self, fading: MPVPlayer) -> None:
+        """Test that pausing mid-fade does not leave the old stream playing."""
+        outgoing = fake_mpv(fading)
+        fading.load_station_async(make_station("b"), auto_play=True).result(5)
+
+        fading.pause()
+        assert fake_mpv(fading).pause
+        assert fading._outgoing is None
+        wait_for_release(outgoing)
+
+    def test_mute_and_volume_reach_outgoing(self, fading: MPVPlayer) -> None:
+        """Test that mute and volume apply to both cores mid-fade."""
+        outgoing = fake_mpv(fading)
+        fading.load_station_async(make_station("b"), auto_play=True).result(5)
+        incoming = fake_mpv(fading)
+
+        fading.set_volume(30)
+        fading.toggle_mute()
+        assert incoming.volume == outgoing.volume == 30
+        assert incoming.mute and outgoing.mute
+
+    def test_paused_player_cuts(self, fading: MPVPlayer) -> None:
+        """Test that nothing fades when the current stream is silent."""
+        outgoing = fake_mpv(fading)
+        fading.pause()
+        fading.load_station_async(make_station("b"), auto_play=True).result(5)
+
+        assert fake_mpv(fading) is outgoing
+        assert outgoing.played[-1] == "https://cdn.example/b"
+
+
+class TestSnapshot:
+    """Test suite for the property snapshot fed by mpv observers."""
+
+    @pytest.fixture
+    def core(self, player: MPVPlayer, resolver: BlockingResolver) -> FakeMPV:
+        """Play a station and return its fake mpv core."""
+        resolver.finish("a")
+        player.load_station_async(make_station("a"), auto_play=True).result(5)
+        return fake_mpv(player)
+
+    def test_observed_properties(self, player: MPVPlayer, core: FakeMPV) -> None:
+        """Test that observed values replace the snapshot."""
+        before = player.get_snapshot()
+        core.observers["time-pos"]("time-pos", 12.5)
+        core.observers["audio-bitrate"]("audio-bitrate", 128000.0)
+        core.observers["demuxer-cache-state"](
+            "demuxer-cache-state", {"total-bytes": 2048}
+        )
+        core.observers["demuxer-cache-duration"]("demuxer-cache-duration", 9.5)
+
+        snapshot = player.get_snapshot()
+        assert snapshot is not before
+        assert before.time_pos is None
+        assert snapshot.time_pos == 12.5
+        assert snapshot.bitrate == 128000.0
+        assert snapshot.cache_bytes == 2048
+        assert snapshot.cache_duration == 9.5
+        assert player.get_time_pos() == 12.5
+        assert player.get_cache_report()["cached_bytes"] == 2048
+
+    def test_getters_do_not_touch_mpv(
+        self, player: MPVPlayer, core: FakeMPV, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the UI-facing getters only read the snapshot."""
+
+        def fail(*_: Any) -> None:
+            raise AssertionError("libmpv property read")
+
+        monkeypatch.setattr(FakeMPV, "__getattr__", fail, raising=False)
+        core.observers["duration"]("duration", 180.0)
+
+        assert player.get_duration() == 180.0
+        assert not player.is_live_stream()
+
+    def test_new_file_resets_position(self, player: MPVPlayer, core: FakeMPV) -> None:
+        """Test that a new stream does not report the old one's position."""
+        core.observers["time-pos"]("time-pos", 30.0)
+        core.observers["volume"]("volume", 40.0)
+        core.events["start-file"]({})
+
+        snapshot = player.get_snapshot()
+        assert snapshot.time_pos is None
+        assert snapshot.volume == 40.0
+        assert player.is_live_stream()
+
+
+class TestBuffering:
+    """Test suite for the BUFFERING state and stall statistics."""
+
+    @pytest.fixture
+    def core(self, player: MPVPlayer, resolver: BlockingResolver) -> FakeMPV:
+        """Play a station and return its fake mpv core."""
+        resolver.finish("a")
+        player.load_station_async(make_station("a"), auto_play=True).result(5)
+        return fake_mpv(player)
+
+    def test_stall_is_recorded(self, player: MPVPlayer, core: FakeMPV) -> None:
+        """Test that a dry cache enters BUFFERING and counts a stall."""
+        states: List[PlayerState] = []
+        player.set_state_callback(states.append)
+        core.observers["cache-speed"]("cache-speed", 49152.0)
+
+        core.observers["paused-for-cache"]("paused-for-cache", True)
+        assert player.get_state() == PlayerState.BUFFERING
+        assert player.is_playing()
+        assert player.get_snapshot().buffering
+
+        core.observers["paused-for-cache"]("paused-for-cache", False)
+        snapshot = player.get_snapshot()
+        assert states == [PlayerState.BUFFERING, PlayerState.PLAYING]
+        assert snapshot.stalls == 1
+        assert snapshot.stall_seconds >= 0
+        assert not snapshot.buffering
+
+    def test_initial_buffering_is_not_a_stall(
+        self, player: MPVPlayer, core: FakeMPV
+    ) -> None:
+        """Test that filling the cache of a new stream is part of LOADING."""
+        core.events["start-file"]({})
+        core.observers["paused-for-cache"]("paused-for-cache", True)
+
+        assert player.get_state() == PlayerState.LOADING
+        assert player.get_snapshot().stalls == 0
+
+    def test_unpause_only_resumes_paused(
+        self, player: MPVPlayer, core: FakeMPV
+    ) -> None:
+        """Test that transitions are only taken from the expected state."""
+        core.events["start-file"]({})
+        core.observers["pause"]("pause", False)
+        assert player.get_state() == PlayerState.LOADING
+
+        core.observers["pause"]("pause", True)
+        core.observers["pause"]("pause", False)
+        assert player.get_state() == PlayerState.PLAYING
+
+    def test_pause_while_buffering(self, player: MPVPlayer, core: FakeMPV) -> None:
+        """Test that a rebuffering player can still be paused and stopped."""
+        core.observers["paused-for-cache"]("paused-for-cache", True)
+        player.pause()
+        assert core.pause is True
+
+        player.stop()
+        assert player.get_state() == PlayerState.STOPPED
+        assert not player.get_snapshot().buffering
+
+
+def test_describe_health() -> None:
+    """Test the cache health summary shown by the TUIs."""
+    assert PlayerSnapshot().describe_health() == ""
+    assert (
+        PlayerSnapshot(
+            cache_duration=12.4, cache_speed=49152, stalls=2, stall_seconds=3.42
+        ).describe_health()
+        == "cache 12s · 48 KiB/s · 2 stalls (3.4s)"
+    )
+    assert PlayerSnapshot(buffering=True, buffering_percent=40).describe_health() == (
+        "buffering 40%"
+    )
+
+
+class TestReconnect:
+    """Test suite for MPVPlayer.reconnect."""
+
+    def test_re_resolves_and_plays(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that a failed stream is resolved afresh and restarted."""
+        resolver.finish("a")
+        player.load_station_async(make_station("a"), auto_play=True).result(5)
+        fake_mpv(player).events["end-file"]({"reason": "error"})
+        assert player.get_state() == PlayerState.ERROR
+
+        assert player.reconnect() is True
+        assert resolver.bypassed == ["a"]
+        assert player.get_state() == PlayerState.PLAYING
+        assert played(player) == ["https://cdn.example/a"] * 2
+
+    def test_restarts_ended_stream(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that a stream mpv paused at its end is loaded afresh."""
+        resolver.finish("a")
+        player.load_station_async(make_station("a"), auto_play=True).result(5)
+        core = fake_mpv(player)
+        core.observers["eof-reached"]("eof-reached", True)
+        core.pause = True
+        core.observers["pause"]("pause", True)
+        assert player.get_snapshot().eof_reached
+        assert player.get_state() == PlayerState.PAUSED
+
+        assert player.reconnect() is True
+        assert not core.pause
+        assert player.get_state() == PlayerState.PLAYING
+        assert played(player) == ["https://cdn.example/a"] * 2
+
+    def test_failure_raises(
+        self, player: MPVPlayer, resolver: BlockingResolver
+    ) -> None:
+        """Test that a station that no longer resolves is reported."""
+        resolver.finish("a")
+        player.load_station_async(make_station("a"), auto_play=True).result(5)
+        resolver.fail = "a"
+
+        with pytest.raises(RuntimeError):
+            player.reconnect()
+
+    def test_without_station(self, player: MPVPlayer) -> None:
+        """Test that there is nothing to reconnect before a load."""
+        assert player.reconnect() is False
+
+
+class TestCleanup:
+    """Test suite for closing the player."""
+
+    def test_idempotent(self, player: MPVPlayer, resolver: BlockingResolver) -> None:
+        """Test that only the first cleanup terminates mpv."""
+        resolver.finish("a")
+        player.load_station_async(make_station("a"), auto_play=True).result(5)
+        core = fake_mpv(player)
+
+        assert player.cleanup() is True
+        assert core.terminated
+        assert player.get_state() == PlayerState.STOPPED
+
+        core.terminated = False
+        assert player.cleanup() is True
+        assert not core.terminated
+
+    def test_context_manager(self, player: MPVPlayer) -> None:
+        """Test that leaving a with block closes the player."""
+        with player as entered:
+            entered.load_station(make_station("a"), fetch_stream=False)
+            core = fake_mpv(entered)
+
+        assert core.terminated
+        assert player._mpv is None
+
+    def test_bounded(self, player: MPVPlayer, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a core stuck terminating does not hold up cleanup."""
+        player.load_station(make_station("a"), fetch_stream=False)
+        core = fake_mpv(player)
+        release = threading.Event()
+
+        def stuck() -> None:
+            release.wait(5)
+            core.terminated = True
+
+        monkeypatch.setattr(core, "terminate", stuck)
+        try:
+            assert player.cleanup(timeout=0.05) is False
+            assert not core.terminated
+        finally:
+            release.set()
+
+    def test_closed_player_does_not_restart_mpv(self, player: MPVPlayer) -> None:
+        """Test that a closed player refuses to create a new core."""
+        player.cleanup()
+
+        with pytest.raises(RuntimeError):
+            player.load_station(make_station("a"), fetch_stream=False)
+        assert player._mpv is None
+
+    def test_late_load_starts_nothing(
+        self,
+        player: MPVPlayer,
+        resolver: BlockingResolver,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a load finishing after cleanup starts no new work."""
+        monkeypatch.setattr(player.config, "stream_refresh_enabled", True)
+        player.load_station(make_station("a"), fetch_stream=False)
+        player.set_neighbor_stations([make_station("b")])
+        player.cleanup()
+
+        player._track_refresh(types.SimpleNamespace(cache=object()))
+        player._queue_neighbors(player._load_generation)
+        assert player._refresher is None
+        assert "b" not in resolver.release
@@ -0,0 +1,111 @@
+"""Tests for the station prefetch module."""
+
+import threading
+from typing import List, Optional
+
+import pytest
+
+from lofigirl_terminal.modules.prefetch import StationPrefetcher, prioritize_stations
+from lofigirl_terminal.modules.stations import Station
+from lofigirl_terminal.modules.youtube_fetcher import StreamInfo
+
+
+def make_station(station_id: str, url: str) -> Station:
+    """Create a station for testing."""
+    return Station(id=station_id, name=station_id, url=url, description="")
+
+
+class RecordingFetcher:
+    """Fetcher stand-in that records resolved URLs."""
+
+    def __init__(self, fail_on: Optional[str] = None) -> None:
+        self.fail_on = fail_on
+        self.resolved: List[str] = []
+        self._lock = threading.Lock()
+
+    def resolve(self, url: str) -> Optional[StreamInfo]:
+        with self._lock:
+            self.resolved.append(url)
+        if url == self.fail_on:
+            raise RuntimeError("boom")
+        return StreamInfo(url=f"{url}#stream", title=url)
+
+
+@pytest.fixture
+def stations() -> List[Station]:
+    """Create five YouTube stations with distinct URLs."""
+    return [
+        make_station(f"s{i}", f"https://www.youtube.com/watch?v=video{i}")
+        for i in range(5)
+    ]
+
+
+class TestPrioritizeStations:
+    """Test suite for prioritize_stations."""
+
+    def test_orders_by_ring_distance(self, stations: List[Station]) -> None:
+        """Test current station first, then alternating neighbours."""
+        ordered = prioritize_stations(stations, 2)
+        assert [s.id for s in ordered] == ["s2", "s3", "s1", "s4", "s0"]
+
+    def test_wraps_around(self, stations: List[Station]) -> None:
+        """Test neighbours wrap around the station list."""
+        ordered = prioritize_stations(stations, 0)
+        assert [s.id for s in ordered][:3] == ["s0", "s1", "s4"]
+
+    def test_deduplicates_shared_urls(self) -> None:
+        """Test that stations sharing a video URL are resolved once."""
+        shared = "https://www.youtube.com/watch?v=shared"
+        stations = [
+            make_station("a", "https://www.youtube.com/watch?v=x"),
+            make_station("b", shared),
+            make_station("c", "https://youtu.be/shared"),
+        ]
+        assert [s.id for s in prioritize_stations(stations, 0)] == ["a", "b"]
+
+    def test_keeps_stations_sharing_a_channel(self) -> None:
+        """Test that channel stations are kept, as each maps to its own stream."""
+        shared = "https://www.youtube.com/@LofiGirl/streams"
+        stations = [make_station("a", shared), make_station("b", shared)]
+        assert [s.id for s in prioritize_stations(stations, 0)] == ["a", "b"]
+
+
+class TestStationPrefetcher:
+    """Test suite for StationPrefetcher class."""
+
+    def test_resolves_in_priority_order(self, stations: List[Station]) -> None:
+        """Test that a single worker resolves stations by priority."""
+        fetcher = RecordingFetcher()
+        prefetcher = StationPrefetcher(fetcher, max_workers=1)
+        futures = prefetcher.start(stations, 1)
+        for future in futures:
+            future.result(timeout=5)
+        prefetcher.shutdown()
+
+        assert fetcher.resolved == [stations[i].url for i in (1, 2, 0, 3, 4)]
+
+    def test_skips_non_youtube_stations(self) -> None:
+        """Test that direct stream URLs are not resolved."""
+        fetcher = RecordingFetcher()
+        prefetcher = StationPrefetcher(fetcher)
+        futures = prefetcher.start(
+            [make_station("direct", "https://example.com/stream.mp3")]
+        )
+        assert futures == []
+        prefetcher.shutdown()
+
+    def test_failures_do_not_propagate(self, stations: List[Station]) -> None:
+        """Test that a failing station does not stop the others."""
+        fetcher = RecordingFetcher(fail_on=stations[0].url)
+        prefetcher = StationPrefetcher(fetcher)
+        results = [f.result(timeout=5) for f in prefetcher.start(stations)]
+        prefetcher.shutdown()
+
+        assert results[0] is None
+        assert all(r is not None for r in results[1:])
+
+    def test_start_after_shutdown_is_noop(self, stations: List[Station]) -> None:
+        """Test that a shut down prefetcher queues nothing."""
+        prefetcher = StationPrefetcher(RecordingFetcher())
+        prefetcher.shutdown()
+        assert prefetcher.start(stations) == []
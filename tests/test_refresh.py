@@ -0,0 +1,125 @@
+"""Tests for the stream refresh module."""
+
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from lofigirl_terminal.modules.refresh import (
+    MAX_SLEEP_SECONDS,
+    REFRESH_LEAD_SECONDS,
+    RETRY_DELAY_SECONDS,
+    StreamRefreshScheduler,
+)
+from lofigirl_terminal.modules.stations import Station
+from lofigirl_terminal.modules.stream_cache import EXPIRY_SAFETY_MARGIN_SECONDS
+from lofigirl_terminal.modules.youtube_fetcher import StreamInfo
+
+NOW = 1_700_000_000.0
+LIFETIME = 6 * 3600.0
+
+
+class FakeFetcher:
+    """Fetcher stand-in with controllable cache expiry."""
+
+    def __init__(self) -> None:
+        self.expiry: Dict[str, float] = {}
+        self.resolved: List[Tuple[str, bool]] = []
+        self.fail = False
+
+    def get_cached_expiry(self, url: str) -> Optional[float]:
+        return self.expiry.get(url)
+
+    def resolve(self, url: str, bypass_cache: bool = False) -> Optional[StreamInfo]:
+        self.resolved.append((url, bypass_cache))
+        if self.fail:
+            return None
+        self.expiry[url] = NOW + LIFETIME
+        return StreamInfo(url=f"{url}#fresh", title=url)
+
+
+def make_station(station_id: str) -> Station:
+    """Create a YouTube station for testing."""
+    return Station(
+        id=station_id,
+        name=station_id,
+        url=f"https://www.youtube.com/watch?v={station_id}",
+        description="",
+    )
+
+
+@pytest.fixture
+def fetcher() -> FakeFetcher:
+    """Create a fake fetcher."""
+    return FakeFetcher()
+
+
+class TestStreamRefreshScheduler:
+    """Test suite for StreamRefreshScheduler class."""
+
+    def test_refreshes_uncached_stations(self, fetcher: FakeFetcher) -> None:
+        """Test that tracked stations without a cached URL are resolved."""
+        refreshed: List[str] = []
+        scheduler = StreamRefreshScheduler(
+            fetcher, on_refresh=lambda station, info: refreshed.append(info.url)
+        )
+        stations = [make_station("a"), make_station("b")]
+        scheduler.track(stations)
+        scheduler.refresh_due(now=NOW)
+
+        assert fetcher.resolved == [(s.url, True) for s in stations]
+        assert refreshed == [f"{s.url}#fresh" for s in stations]
+
+    def test_fresh_urls_are_left_alone(self, fetcher: FakeFetcher) -> None:
+        """Test that URLs far from expiry are not re-resolved."""
+        station = make_station("a")
+        fetcher.expiry[station.url] = NOW + LIFETIME
+        scheduler = StreamRefreshScheduler(fetcher)
+        scheduler.track([station])
+
+        delay = scheduler.refresh_due(now=NOW)
+        assert fetcher.resolved == []
+        assert delay == MAX_SLEEP_SECONDS
+
+    def test_refreshes_before_expiry(self, fetcher: FakeFetcher) -> None:
+        """Test that a URL inside the lead window is refreshed."""
+        station = make_station("a")
+        fetcher.expiry[station.url] = (
+            NOW + EXPIRY_SAFETY_MARGIN_SECONDS + REFRESH_LEAD_SECONDS - 1
+        )
+        scheduler = StreamRefreshScheduler(fetcher)
+        scheduler.track([station])
+        scheduler.refresh_due(now=NOW)
+
+        assert fetcher.resolved == [(station.url, True)]
+
+    def test_sleeps_until_next_due(self, fetcher: FakeFetcher) -> None:
+        """Test that the returned delay targets the next refresh."""
+        station = make_station("a")
+        fetcher.expiry[station.url] = (
+            NOW + EXPIRY_SAFETY_MARGIN_SECONDS + REFRESH_LEAD_SECONDS + 120
+        )
+        scheduler = StreamRefreshScheduler(fetcher)
+        scheduler.track([station])
+        assert scheduler.refresh_due(now=NOW) == pytest.approx(120)
+
+    def test_failed_refresh_backs_off(self, fetcher: FakeFetcher) -> None:
+        """Test that failures are retried after a delay, not immediately."""
+        fetcher.fail = True
+        scheduler = StreamRefreshScheduler(fetcher)
+        scheduler.track([make_station("a")])
+
+        assert scheduler.refresh_due(now=NOW) == RETRY_DELAY_SECONDS
+        scheduler.refresh_due(now=NOW + 1)
+        assert len(fetcher.resolved) == 1
+
+    def test_track_skips_duplicates_and_direct_urls(self, fetcher: FakeFetcher) -> None:
+        """Test that only distinct YouTube stations are tracked."""
+        station = make_station("a")
+        direct = Station(
+            id="direct", name="direct", url="https://example.com/x.mp3", description=""
+        )
+        scheduler = StreamRefreshScheduler(fetcher)
+        scheduler.track([station, station, direct])
+        scheduler.refresh_due(now=NOW)
+
+        assert fetcher.resolved == [(station.url, True)]
@@ -0,0 +1,174 @@
+"""Tests for the shared resolver daemon and its client."""
+
+import asyncio
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+import pytest
+
+from lofigirl_terminal.modules import resolverd
+from lofigirl_terminal.modules.resolverd import ResolverDaemon
+from lofigirl_terminal.modules.resolverd_client import (
+    ResolverClient,
+    ResolverUnavailable,
+)
+from lofigirl_terminal.modules.stream_cache import StreamCache
+from lofigirl_terminal.modules.youtube_fetcher import StreamInfo, YouTubeFetcher
+
+VIDEO_URL = "https://www.youtube.com/watch?v=jfKfPfyJRdk"
+
+
+class StubFetcher:
+    """Fetcher stand-in recording the resolutions the daemon makes."""
+
+    calls: List[tuple] = []
+
+    def __init__(self, prefer_audio_only: bool, quality: str, **_: Any) -> None:
+        self.prefer_audio_only = prefer_audio_only
+        self.quality = quality
+
+    def resolve(self, url: str, bypass_cache: bool = False) -> Optional[StreamInfo]:
+        StubFetcher.calls.append((url, self.prefer_audio_only, bypass_cache))
+        return StreamInfo(url=f"{url}#{self.quality}", title="stream", is_live=True)
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Short socket path; tmp_path may exceed the Unix socket length limit."""
+    directory = Path(tempfile.mkdtemp(prefix="lofi"))
+    yield directory / "r.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Run a daemon with stub fetchers in a background thread."""
+    StubFetcher.calls = []
+    monkeypatch.setattr(resolverd, "YouTubeFetcher", StubFetcher)
+    server = ResolverDaemon(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    client = ResolverClient(socket_path, timeout=5)
+    for _ in range(100):
+        if client.ping():
+            break
+        threading.Event().wait(0.02)
+
+    yield socket_path
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+class TestResolverDaemon:
+    """Test suite for the daemon and ResolverClient."""
+
+    def test_ping(self, daemon: Path) -> None:
+        """Test that a running daemon answers pings."""
+        assert ResolverClient(daemon, timeout=5).ping()
+
+    def test_socket_is_private(self, daemon: Path) -> None:
+        """Test that only the owner may connect by default."""
+        assert daemon.stat().st_mode & 0o777 == 0o600
+
+    def test_resolve(self, daemon: Path) -> None:
+        """Test that resolutions are answered with the stream info."""
+        client = ResolverClient(daemon, timeout=5)
+        info = client.extract(VIDEO_URL, False, "low", bypass_cache=True)
+
+        assert info is not None
+        assert info["url"] == f"{VIDEO_URL}#low"
+        assert info["is_live"] is True
+        assert StubFetcher.calls == [(VIDEO_URL, False, True)]
+
+    def test_resolve_async(self, daemon: Path) -> None:
+        """Test resolving without blocking the event loop."""
+        client = ResolverClient(daemon, timeout=5)
+        info = asyncio.run(client.extract_async(VIDEO_URL, True, "high"))
+
+        assert info is not None
+        assert info["url"] == f"{VIDEO_URL}#high"
+
+    def test_rejects_other_urls(self, daemon: Path) -> None:
+        """Test that the daemon only resolves YouTube URLs."""
+        client = ResolverClient(daemon, timeout=5)
+
+        assert client.extract("https://example.com/x.mp3", True, "high") is None
+        for url in (
+            "http://127.0.0.1:8080/x?youtube.com",
+            "https://example.com/youtu.be/x",
+            "https://youtube.com.example.com/watch?v=x",
+            "file:///youtube.com/x",
+        ):
+            assert client.extract(url, True, "high") is None
+        assert StubFetcher.calls == []
+
+    def test_second_daemon_refused(self, daemon: Path) -> None:
+        """Test that a live socket is not taken over."""
+        with pytest.raises(RuntimeError, match="already running"):
+            ResolverDaemon(daemon).serve_forever()
+
+    def test_socket_removed_on_shutdown(
+        self, socket_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the socket file is deleted when the daemon stops."""
+        monkeypatch.setattr(resolverd, "YouTubeFetcher", StubFetcher)
+        server = ResolverDaemon(socket_path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        while not ResolverClient(socket_path, timeout=5).ping():
+            threading.Event().wait(0.02)
+
+        server.shutdown()
+        thread.join(timeout=5)
+        assert not socket_path.exists()
+
+
+class TestFallback:
+    """Test suite for resolving without a daemon."""
+
+    def test_client_raises_without_daemon(self, socket_path: Path) -> None:
+        """Test that a missing daemon is reported as unavailable."""
+        client = ResolverClient(socket_path, timeout=1)
+
+        assert not client.ping()
+        with pytest.raises(ResolverUnavailable):
+            client.extract(VIDEO_URL, True, "high")
+
+    def test_fetcher_uses_daemon(self, daemon: Path, tmp_path: Path) -> None:
+        """Test that the fetcher forwards resolutions to the daemon."""
+        fetcher = YouTubeFetcher(
+            prefer_audio_only=True,
+            quality="medium",
+            cache=StreamCache(tmp_path / "streams.json"),
+            daemon=ResolverClient(daemon, timeout=5),
+        )
+        info = fetcher.resolve(VIDEO_URL)
+
+        assert info is not None
+        assert info.url == f"{VIDEO_URL}#medium"
+
+    def test_fetcher_falls_back(
+        self, socket_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the fetcher resolves locally without a daemon."""
+        fetcher = YouTubeFetcher(
+            backend="subprocess",
+            cache=StreamCache(tmp_path / "streams.json"),
+            daemon=ResolverClient(socket_path, timeout=1),
+        )
+        local: List[str] = []
+
+        async def fake_subprocess(url: str, timeout: float) -> dict:
+            local.append(url)
+            return {"url": "https://cdn.example/stream", "title": "local"}
+
+        monkeypatch.setattr(fetcher, "_extract_with_subprocess_async", fake_subprocess)
+        info = fetcher.resolve(VIDEO_URL)
+
+        assert info is not None
+        assert info.url == "https://cdn.example/stream"
+        assert local == [VIDEO_URL]
@@ -0,0 +1,153 @@
+"""Tests for the stream resolver backends."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from lofigirl_terminal.modules.resolvers import (
+    DirectResolver,
+    FakeResolver,
+    StreamResolver,
+    YtDlpResolver,
+)
+from lofigirl_terminal.modules.stations import Station
+from lofigirl_terminal.modules.youtube_fetcher import StreamInfo
+
+
+def make_station(station_id: str, url: str) -> Station:
+    """Create a station for testing."""
+    return Station(id=station_id, name=station_id.title(), url=url, description="")
+
+
+class StubFetcher:
+    """Fetcher stand-in that resolves every URL to a fixed stream."""
+
+    def __init__(self, installed: bool = True) -> None:
+        self.installed = installed
+        self.resolved: list = []
+        self.bypassed: list = []
+
+    def check_yt_dlp_installed(self) -> bool:
+        return self.installed
+
+    def resolve(self, url: str, bypass_cache: bool = False) -> Optional[StreamInfo]:
+        self.resolved.append(url)
+        self.bypassed.append(bypass_cache)
+        return StreamInfo(url=f"{url}#stream", title="stream")
+
+    async def resolve_async(
+        self, url: str, bypass_cache: bool = False
+    ) -> Optional[StreamInfo]:
+        return self.resolve(url, bypass_cache)
+
+    def retry_in(self, url: str) -> float:
+        return 0.0
+
+
+class TestYtDlpResolver:
+    """Test suite for YtDlpResolver class."""
+
+    def test_resolves_youtube_stations(self) -> None:
+        """Test that YouTube stations go through the fetcher."""
+        fetcher = StubFetcher()
+        resolver: StreamResolver = YtDlpResolver(fetcher)
+        url = "https://www.youtube.com/watch?v=jfKfPfyJRdk"
+        info = resolver.resolve_station(make_station("a", url))
+
+        assert info is not None
+        assert info.url == f"{url}#stream"
+        assert fetcher.resolved == [url]
+        assert fetcher.bypassed == [False]
+
+    def test_bypass_cache(self) -> None:
+        """Test that a cache bypass reaches the fetcher."""
+        fetcher = StubFetcher()
+        url = "https://www.youtube.com/watch?v=jfKfPfyJRdk"
+        YtDlpResolver(fetcher).resolve_station(
+            make_station("a", url), bypass_cache=True
+        )
+
+        assert fetcher.bypassed == [True]
+
+    def test_resolve_async(self) -> None:
+        """Test that the asyncio variant goes through the async fetcher API."""
+        fetcher = StubFetcher()
+        url = "https://www.youtube.com/watch?v=jfKfPfyJRdk"
+        info = asyncio.run(
+            YtDlpResolver(fetcher).resolve_station_async(make_station("a", url))
+        )
+
+        assert info is not None
+        assert info.url == f"{url}#stream"
+        assert fetcher.resolved == [url]
+
+    def test_passes_other_urls_through(self) -> None:
+        """Test that non-YouTube stations are played as they are."""
+        fetcher = StubFetcher(installed=False)
+        resolver = YtDlpResolver(fetcher)
+        info = resolver.resolve_station(make_station("a", "https://example.com/x.mp3"))
+
+        assert info is not None
+        assert info.url == "https://example.com/x.mp3"
+        assert fetcher.resolved == []
+
+    def test_missing_yt_dlp_raises(self) -> None:
+        """Test that a missing yt-dlp binary is reported."""
+        resolver = YtDlpResolver(StubFetcher(installed=False))
+        with pytest.raises(RuntimeError, match="yt-dlp is not installed"):
+            resolver.resolve_station(
+                make_station("a", "https://www.youtube.com/watch?v=x")
+            )
+
+
+class TestDirectResolver:
+    """Test suite for DirectResolver class."""
+
+    def test_returns_station_url(self) -> None:
+        """Test that the station URL is returned unchanged."""
+        station = make_station("a", "https://www.youtube.com/watch?v=x")
+        info = DirectResolver().resolve_station(station)
+        assert info is not None
+        assert info.url == station.url
+        assert info.title == station.name
+
+
+class TestFakeResolver:
+    """Test suite for FakeResolver class."""
+
+    def test_maps_station_ids(self, tmp_path: Path) -> None:
+        """Test that stations map to files relative to the map, or URLs."""
+        map_file = tmp_path / "fake.json"
+        map_file.write_text(
+            json.dumps({"a": "audio/a.ogg", "*": "http://127.0.0.1:8000/x.mp3"})
+        )
+        resolver = FakeResolver.from_file(map_file)
+
+        info_a = resolver.resolve_station(make_station("a", "unused"))
+        info_b = resolver.resolve_station(make_station("b", "unused"))
+        assert info_a is not None and info_b is not None
+        assert info_a.url == str(tmp_path / "audio" / "a.ogg")
+        assert info_b.url == "http://127.0.0.1:8000/x.mp3"
+
+    def test_unmapped_station_fails(self) -> None:
+        """Test that stations without an entry or default fail to resolve."""
+        resolver = FakeResolver({"a": "/tmp/a.ogg"})
+        assert resolver.resolve_station(make_station("b", "unused")) is None
+
+    def test_latency_is_applied(self) -> None:
+        """Test that every resolution takes the configured latency."""
+        resolver = FakeResolver({"*": "/tmp/a.ogg"}, latency=0.05)
+        started = time.perf_counter()
+        resolver.resolve_station(make_station("a", "unused"))
+        assert time.perf_counter() - started >= 0.05
+
+    def test_rejects_invalid_map(self, tmp_path: Path) -> None:
+        """Test that a map that is not an object of strings is rejected."""
+        map_file = tmp_path / "fake.json"
+        map_file.write_text(json.dumps(["a.ogg"]))
+        with pytest.raises(ValueError):
+            FakeResolver.from_file(map_file)
@@ -0,0 +1,55 @@
+"""Tests for the retry module."""
+
+import random
+
+from lofigirl_terminal.config import Config
+from lofigirl_terminal.modules.retry import (
+    MIN_LATENCY_SAMPLES,
+    LatencyTracker,
+    RetryPolicy,
+)
+
+
+class TestRetryPolicy:
+    """Test suite for RetryPolicy class."""
+
+    def test_from_config(self) -> None:
+        """Test that retry_attempts counts retries after the first attempt."""
+        assert RetryPolicy.from_config(Config(retry_attempts=0)).attempts == 1
+        assert RetryPolicy.from_config(Config(retry_attempts=3)).attempts == 4
+
+    def test_backoff_grows_with_jitter_and_cap(self) -> None:
+        """Test that delays stay below an exponentially growing, capped ceiling."""
+        policy = RetryPolicy(attempts=10, base_delay=1, max_delay=4)
+        rng = random.Random(0)
+        for retry, ceiling in [(1, 1), (2, 2), (3, 4), (6, 4)]:
+            delays = [policy.backoff(retry, rng) for _ in range(50)]
+            assert all(0 <= d <= ceiling for d in delays)
+            assert max(delays) > ceiling / 2
+
+
+class TestLatencyTracker:
+    """Test suite for LatencyTracker class."""
+
+    def test_needs_enough_samples(self) -> None:
+        """Test that percentiles are withheld until enough samples exist."""
+        tracker = LatencyTracker()
+        for _ in range(MIN_LATENCY_SAMPLES - 1):
+            tracker.record(1.0)
+        assert tracker.percentile(0.9) is None
+
+    def test_percentile(self) -> None:
+        """Test percentile selection over the window."""
+        tracker = LatencyTracker(window=10)
+        for seconds in range(1, 11):
+            tracker.record(float(seconds))
+        assert tracker.percentile(0.9) == 10.0
+        assert tracker.percentile(0.5) == 6.0
+
+    def test_window_drops_old_samples(self) -> None:
+        """Test that only the most recent samples are kept."""
+        tracker = LatencyTracker(window=5)
+        for seconds in [100.0] * 5 + [1.0] * 5:
+            tracker.record(seconds)
+        assert len(tracker) == 5
+        assert tracker.percentile(0.9) == 1.0
@@ -0,0 +1,144 @@
+"""Tests for the stream cache module."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from lofigirl_terminal.modules.stream_cache import (
+    EXPIRY_SAFETY_MARGIN_SECONDS,
+    StreamCache,
+    make_cache_key,
+    normalize_url,
+    parse_expiry,
+    write_json_atomic,
+)
+
+
+class TestUrlHelpers:
+    """Test suite for URL normalization and expiry parsing."""
+
+    def test_normalize_youtube_urls(self) -> None:
+        """Test that equivalent YouTube URLs normalize to the same form."""
+        canonical = "https://www.youtube.com/watch?v=jfKfPfyJRdk"
+        assert normalize_url("https://youtu.be/jfKfPfyJRdk") == canonical
+        assert normalize_url("https://m.youtube.com/watch?v=jfKfPfyJRdk") == canonical
+        assert (
+            normalize_url(" https://www.youtube.com/watch?v=jfKfPfyJRdk&t=42 ")
+            == canonical
+        )
+
+    def test_normalize_other_urls(self) -> None:
+        """Test that non-watch URLs lose fragments and trailing slashes."""
+        assert (
+            normalize_url("HTTPS://WWW.YouTube.com/@LofiGirl/streams/#top")
+            == "https://www.youtube.com/@LofiGirl/streams"
+        )
+
+    def test_cache_key_depends_on_mode_and_format(self) -> None:
+        """Test that cache keys separate formats and audio/video mode."""
+        url = "https://www.youtube.com/watch?v=abc"
+        assert make_cache_key(url, "best", True) != make_cache_key(url, "best", False)
+        assert make_cache_key(url, "best", True) != make_cache_key(
+            url, "bestaudio/best", True
+        )
+
+    def test_parse_expiry_query_param(self) -> None:
+        """Test expiry extraction from googlevideo query strings."""
+        url = "https://rr1.googlevideo.com/videoplayback?expire=1700000000&id=x"
+        assert parse_expiry(url) == 1700000000.0
+
+    def test_parse_expiry_path_segment(self) -> None:
+        """Test expiry extraction from HLS manifest paths."""
+        url = "https://manifest.googlevideo.com/api/manifest/hls_variant/expire/1700000000/ei/x/index.m3u8"
+        assert parse_expiry(url) == 1700000000.0
+
+    def test_parse_expiry_missing(self) -> None:
+        """Test URLs without expiry information."""
+        assert parse_expiry("https://example.com/stream.mp3") is None
+
+
+class TestStreamCache:
+    """Test suite for StreamCache class."""
+
+    @pytest.fixture
+    def cache_file(self, tmp_path: Path) -> Path:
+        """Return a temporary cache file path."""
+        return tmp_path / "streams.json"
+
+    def test_put_and_get(self, cache_file: Path) -> None:
+        """Test storing and retrieving a URL."""
+        cache = StreamCache(cache_file)
+        cache.put("key", "https://example.com/stream")
+        assert cache.get("key") == "https://example.com/stream"
+        assert cache.get("missing") is None
+
+    def test_persists_to_disk(self, cache_file: Path) -> None:
+        """Test that entries survive a new cache instance."""
+        StreamCache(cache_file).put("key", "https://example.com/stream")
+        assert StreamCache(cache_file).get("key") == "https://example.com/stream"
+
+    def test_expired_entries_are_dropped(self, cache_file: Path) -> None:
+        """Test that URLs past their embedded expiry are not served."""
+        cache = StreamCache(cache_file)
+        soon = int(time.time() + EXPIRY_SAFETY_MARGIN_SECONDS / 2)
+        cache.put("key", f"https://x.googlevideo.com/videoplayback?expire={soon}")
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, cache_file: Path) -> None:
+        """Test that the least recently used entry is evicted first."""
+        cache = StreamCache(cache_file, max_entries=2)
+        cache.put("a", "https://example.com/a")
+        cache.put("b", "https://example.com/b")
+        cache.get("a")
+        cache.put("c", "https://example.com/c")
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_invalidate(self, cache_file: Path) -> None:
+        """Test removing a single entry."""
+        cache = StreamCache(cache_file)
+        cache.put("key", "https://example.com/stream")
+        assert cache.invalidate("key") is True
+        assert cache.invalidate("key") is False
+        assert cache.get("key") is None
+
+    def test_concurrent_writers(self, cache_file: Path) -> None:
+        """Test that writers sharing a file use their own temporary files."""
+        caches = [StreamCache(cache_file) for _ in range(4)]
+        threads = [
+            threading.Thread(
+                target=lambda c=cache, n=n: [
+                    c.put(f"key{n}-{i}", "https://example.com/s") for i in range(20)
+                ]
+            )
+            for n, cache in enumerate(caches)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert json.loads(cache_file.read_text("utf-8"))
+        assert list(cache_file.parent.iterdir()) == [cache_file]
+
+    def test_failed_write_leaves_no_file(self, cache_file: Path) -> None:
+        """Test that a write that fails keeps the old file and no temporary."""
+        write_json_atomic(cache_file, {"key": 1})
+
+        with pytest.raises(TypeError):
+            write_json_atomic(cache_file, {"key": object()})
+        assert json.loads(cache_file.read_text("utf-8")) == {"key": 1}
+        assert list(cache_file.parent.iterdir()) == [cache_file]
+
+    def test_corrupt_file_is_ignored(self, cache_file: Path) -> None:
+        """Test that an unreadable cache file does not raise."""
+        cache_file.write_text("{not json", "utf-8")
+        cache = StreamCache(cache_file)
+        assert cache.get("key") is None
+        cache.put("key", "https://example.com/stream")
+        assert json.loads(cache_file.read_text("utf-8"))["key"]["url"]
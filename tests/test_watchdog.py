@@ -0,0 +1,227 @@
+"""Tests for the playback watchdog module."""
+
+from typing import Optional
+
+import pytest
+
+from lofigirl_terminal.modules.player_mpv import PlayerSnapshot, PlayerState
+from lofigirl_terminal.modules.retry import RetryPolicy
+from lofigirl_terminal.modules.stations import Station
+from lofigirl_terminal.modules.watchdog import (
+    RECOVERED_AFTER_SECONDS,
+    PlaybackWatchdog,
+)
+
+BACKOFF_SECONDS = 5.0
+
+
+class FixedBackoff(RetryPolicy):
+    """Retry policy without jitter."""
+
+    def backoff(self, retry: int, rng: Optional[object] = None) -> float:
+        return BACKOFF_SECONDS
+
+
+class FakePlayer:
+    """Player stand-in whose state and position the tests control."""
+
+    def __init__(self) -> None:
+        self.state = PlayerState.PLAYING
+        self.position: Optional[float] = 0.0
+        self.current_station: Optional[Station] = Station(
+            id="a", name="A", url="https://example.com/a.mp3", description=""
+        )
+        self.eof_reached = False
+        self.reconnects = 0
+        self.fail = False
+
+    def get_state(self) -> PlayerState:
+        return self.state
+
+    def get_snapshot(self) -> PlayerSnapshot:
+        return PlayerSnapshot(time_pos=self.position, eof_reached=self.eof_reached)
+
+    def reconnect(self) -> bool:
+        self.reconnects += 1
+        if self.fail:
+            raise RuntimeError("Failed to fetch stream URL")
+        self.state = PlayerState.PLAYING
+        self.eof_reached = False
+        return True
+
+
+class Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Create a manual clock."""
+    return Clock()
+
+
+@pytest.fixture
+def player() -> FakePlayer:
+    """Create a playing fake player."""
+    return FakePlayer()
+
+
+@pytest.fixture
+def watchdog(player: FakePlayer, clock: Clock) -> PlaybackWatchdog:
+    """Create a watchdog with a 10s stall timeout and 3 attempts."""
+    dog = PlaybackWatchdog(
+        player,
+        stall_seconds=10,
+        max_attempts=3,
+        policy=FixedBackoff(),
+        clock=clock,
+    )
+    dog.check()
+    return dog
+
+
+def tick(watchdog: PlaybackWatchdog, clock: Clock, seconds: float) -> None:
+    """Advance the clock and let the watchdog look at the player."""
+    clock.now += seconds
+    watchdog.check()
+
+
+class TestPlaybackWatchdog:
+    """Test suite for PlaybackWatchdog class."""
+
+    def test_progress_is_not_a_stall(
+        self, watchdog: PlaybackWatchdog, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that an advancing position never triggers a reconnect."""
+        for second in range(1, 30):
+            player.position = float(second)
+            tick(watchdog, clock, 1)
+
+        assert player.reconnects == 0
+
+    def test_stall_reconnects(
+        self, watchdog: PlaybackWatchdog, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that a frozen position triggers a reconnect after the timeout."""
+        tick(watchdog, clock, 9)
+        assert player.reconnects == 0
+
+        tick(watchdog, clock, 1)
+        assert player.reconnects == 1
+
+    def test_long_rebuffering_reconnects(
+        self, watchdog: PlaybackWatchdog, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that buffering without end counts as a stall."""
+        player.state = PlayerState.BUFFERING
+        tick(watchdog, clock, 10)
+
+        assert player.reconnects == 1
+
+    def test_error_reconnects_immediately(
+        self, watchdog: PlaybackWatchdog, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that an error end-file is acted on at the next check."""
+        player.state = PlayerState.ERROR
+        tick(watchdog, clock, 1)
+
+        assert player.reconnects == 1
+
+    def test_error_before_playing_is_ignored(
+        self, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that a load that never played is left to the user."""
+        player.state = PlayerState.ERROR
+        dog = PlaybackWatchdog(player, stall_seconds=10, max_attempts=3, clock=clock)
+        tick(dog, clock, 1)
+
+        assert player.reconnects == 0
+
+    def test_user_silence_is_respected(
+        self, watchdog: PlaybackWatchdog, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that stopped and paused players are left alone."""
+        for state in (PlayerState.PAUSED, PlayerState.STOPPED):
+            player.state = state
+            tick(watchdog, clock, 60)
+        player.state = PlayerState.ERROR
+        tick(watchdog, clock, 1)
+
+        assert player.reconnects == 0
+
+    def test_ended_stream_reconnects(
+        self, watchdog: PlaybackWatchdog, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that mpv pausing at the end of a stream is not a user pause."""
+        player.eof_reached = True
+        player.state = PlayerState.PAUSED
+        tick(watchdog, clock, 1)
+
+        assert player.reconnects == 1
+        assert player.state == PlayerState.PLAYING
+
+    def test_station_change_disarms(
+        self, watchdog: PlaybackWatchdog, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that a stall on the old station does not carry over."""
+        tick(watchdog, clock, 9)
+        player.current_station = Station(
+            id="b", name="B", url="https://example.com/b.mp3", description=""
+        )
+        player.state = PlayerState.ERROR
+        tick(watchdog, clock, 1)
+        assert player.reconnects == 0
+
+        player.state = PlayerState.PLAYING
+        tick(watchdog, clock, 9)
+        assert player.reconnects == 0
+
+    def test_backoff_and_give_up(
+        self, watchdog: PlaybackWatchdog, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that failing reconnects back off and stop after the limit."""
+        player.fail = True
+        player.state = PlayerState.ERROR
+        tick(watchdog, clock, 1)
+        assert player.reconnects == 1
+
+        tick(watchdog, clock, BACKOFF_SECONDS - 1)
+        assert player.reconnects == 1
+        tick(watchdog, clock, 1)
+        assert player.reconnects == 2
+
+        for _ in range(5):
+            tick(watchdog, clock, BACKOFF_SECONDS)
+        assert player.reconnects == 3
+
+        # A station change starts over once the new station has played
+        player.current_station = Station(
+            id="b", name="B", url="https://example.com/b.mp3", description=""
+        )
+        player.state = PlayerState.PLAYING
+        tick(watchdog, clock, 1)
+        player.state = PlayerState.ERROR
+        tick(watchdog, clock, 1)
+        assert player.reconnects == 4
+
+    def test_recovery_resets_attempts(
+        self, watchdog: PlaybackWatchdog, player: FakePlayer, clock: Clock
+    ) -> None:
+        """Test that sustained progress after a reconnect clears the count."""
+        player.state = PlayerState.ERROR
+        tick(watchdog, clock, 1)
+        assert watchdog.attempts == 1
+
+        elapsed = 0.0
+        while elapsed <= RECOVERED_AFTER_SECONDS:
+            player.position = (player.position or 0.0) + 1
+            tick(watchdog, clock, 1)
+            elapsed += 1
+
+        assert watchdog.attempts == 0
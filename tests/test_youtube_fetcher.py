@@ -0,0 +1,531 @@
+"""Tests for the YouTube fetcher module."""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from lofigirl_terminal.modules import youtube_fetcher
+from lofigirl_terminal.modules.circuit_breaker import CircuitBreaker
+from lofigirl_terminal.modules.retry import RetryPolicy
+from lofigirl_terminal.modules.stream_cache import StreamCache
+from lofigirl_terminal.modules.youtube_fetcher import (
+    StreamInfo,
+    YouTubeFetcher,
+    get_format_selector,
+    parse_info_line,
+    parse_stream_info,
+)
+
+STREAM_URL = "https://rr1.googlevideo.com/videoplayback?expire=4102444800&id=x"
+YOUTUBE_URL = "https://www.youtube.com/watch?v=jfKfPfyJRdk"
+
+
+class FakeProcess:
+    """Stand-in for a yt-dlp asyncio.subprocess.Process object."""
+
+    pid = 4242
+
+    def __init__(self, stdout: str, returncode: int) -> None:
+        self.stdout = asyncio.StreamReader()
+        self.stdout.feed_data(stdout.encode())
+        self.stdout.feed_eof()
+        self.stderr = asyncio.StreamReader()
+        self.stderr.feed_data(b"error")
+        self.stderr.feed_eof()
+        self.returncode: Optional[int] = None
+        self.exit_code = returncode
+        self.killed = False
+
+    async def wait(self) -> int:
+        if self.returncode is None:
+            self.returncode = self.exit_code
+        return self.returncode
+
+    def kill(self) -> None:
+        self.killed = True
+        self.returncode = -9
+
+
+class FakeYtDlp:
+    """Stand-in for asyncio.create_subprocess_exec recording yt-dlp runs."""
+
+    def __init__(self, payload: Any, returncode: int = 0) -> None:
+        self.payload = payload
+        self.returncode = returncode
+        self.calls: List[List[str]] = []
+
+    async def __call__(self, *cmd: str, **kwargs: Any) -> FakeProcess:
+        self.calls.append(list(cmd))
+        stdout = json.dumps(self.payload) + "\n" if self.payload else ""
+        return FakeProcess(stdout, self.returncode)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> StreamCache:
+    """Create an isolated stream cache."""
+    return StreamCache(tmp_path / "streams.json")
+
+
+@pytest.fixture
+def fake_yt_dlp(monkeypatch: pytest.MonkeyPatch) -> FakeYtDlp:
+    """Replace the fetcher's yt-dlp subprocess with a fake."""
+    fake = FakeYtDlp(
+        {
+            "url": STREAM_URL,
+            "title": "lofi hip hop radio",
+            "is_live": True,
+            "format_id": "234",
+        }
+    )
+    monkeypatch.setattr(youtube_fetcher.asyncio, "create_subprocess_exec", fake)
+    return fake
+
+
+@pytest.fixture
+def yt_dlp_script(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Put a fake yt-dlp executable first on PATH.
+
+    The script records its PID and each invocation, sleeps for the number of seconds in
+    ``delay`` (if present) or ``delay_once`` (consumed by the first call that sees it)
+    and prints a JSON document. With a ``linger`` file it then keeps running for that
+    many seconds, like yt-dlp working through further playlist entries. A ``noisy``
+    file makes it write that many bytes of warnings to stderr first.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "yt-dlp"
+    payload = json.dumps({"url": STREAM_URL, "title": "async radio"})
+    script.write_text(f"""#!{sys.executable}
+import os, pathlib, sys, time
+here = pathlib.Path(__file__).parent
+(here / "pid").write_text(str(os.getpid()))
+with open(here / "calls", "a") as calls:
+    calls.write("call\\n")
+noisy = here / "noisy"
+if noisy.exists():
+    sys.stderr.write("W" * int(noisy.read_text()))
+    sys.stderr.flush()
+delay = here / "delay"
+if delay.exists():
+    time.sleep(float(delay.read_text()))
+once = here / "delay_once"
+if once.exists():
+    seconds = float(once.read_text())
+    once.unlink()
+    time.sleep(seconds)
+print({payload!r}, flush=True)
+linger = here / "linger"
+if linger.exists():
+    time.sleep(float(linger.read_text()))
+""")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return script
+
+
+class TestParseInfoLine:
+    """Test suite for parse_info_line."""
+
+    def test_keeps_only_needed_fields(self) -> None:
+        """Test that format lists and other bulk fields are dropped."""
+        line = json.dumps(
+            {
+                "url": STREAM_URL,
+                "title": "Radio",
+                "is_live": True,
+                "formats": [{"url": "x"}] * 100,
+                "thumbnails": [{"url": "y"}] * 50,
+            }
+        )
+        assert parse_info_line(line) == {
+            "url": STREAM_URL,
+            "title": "Radio",
+            "is_live": True,
+        }
+
+    def test_requested_formats_url(self) -> None:
+        """Test that merged selections are reduced to their first URL."""
+        line = json.dumps({"requested_formats": [{"url": STREAM_URL}, {"url": "a"}]})
+        assert parse_info_line(line) == {"url": STREAM_URL}
+
+    def test_skips_unplayable_lines(self) -> None:
+        """Test that non-JSON output and entries without a URL are skipped."""
+        assert parse_info_line("WARNING: something") is None
+        assert parse_info_line(json.dumps({"title": "upcoming"})) is None
+        assert parse_info_line(b"[1, 2]") is None
+
+
+class TestParseStreamInfo:
+    """Test suite for parse_stream_info."""
+
+    def test_single_format(self) -> None:
+        """Test parsing a single-format info dict."""
+        info = parse_stream_info({"url": STREAM_URL, "title": "Radio"})
+        assert info.url == STREAM_URL
+        assert info.title == "Radio"
+        assert info.is_live is False
+
+    def test_requested_formats_fallback(self) -> None:
+        """Test that merged selections use their first part's URL."""
+        info = parse_stream_info({"requested_formats": [{"url": STREAM_URL}]})
+        assert info.url == STREAM_URL
+        assert info.title == "Unknown Title"
+
+
+class TestGetFormatSelector:
+    """Test suite for get_format_selector."""
+
+    def test_high_keeps_best_formats(self) -> None:
+        """Test that the high tier requests the best available formats."""
+        assert get_format_selector("high") == "bestaudio/best"
+        assert get_format_selector("high", audio_only=False) == "best"
+
+    def test_lower_tiers_cap_bitrate_and_resolution(self) -> None:
+        """Test that low and medium tiers cap audio bitrate and video height."""
+        assert get_format_selector("low").startswith("bestaudio[abr<=64]")
+        assert get_format_selector("medium").startswith("bestaudio[abr<=128]")
+        assert "height<=360" in get_format_selector("low", audio_only=False)
+        assert "height<=720" in get_format_selector("medium", audio_only=False)
+
+
+class TestYouTubeFetcher:
+    """Test suite for YouTubeFetcher class."""
+
+    def test_resolve_single_invocation(
+        self, cache: StreamCache, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that resolve returns URL and metadata from one yt-dlp call."""
+        fetcher = YouTubeFetcher(cache=cache, backend="subprocess")
+        info = fetcher.resolve(YOUTUBE_URL)
+
+        assert isinstance(info, StreamInfo)
+        assert info.url == STREAM_URL
+        assert info.title == "lofi hip hop radio"
+        assert info.is_live is True
+        assert len(fake_yt_dlp.calls) == 1
+        assert "--dump-json" in fake_yt_dlp.calls[0]
+
+    def test_url_and_info_share_cache(
+        self, cache: StreamCache, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that URL and metadata lookups reuse one resolution."""
+        fetcher = YouTubeFetcher(cache=cache, backend="subprocess")
+        assert fetcher.get_stream_url(YOUTUBE_URL) == STREAM_URL
+
+        info = fetcher.get_stream_info(YOUTUBE_URL)
+        assert info is not None
+        assert info.title == "lofi hip hop radio"
+        assert len(fake_yt_dlp.calls) == 1
+
+    def test_cache_survives_new_fetcher(
+        self, cache: StreamCache, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that a restarted fetcher reuses persisted resolutions."""
+        YouTubeFetcher(cache=cache, backend="subprocess").resolve(YOUTUBE_URL)
+        reloaded = StreamCache(cache.cache_file)
+        assert (
+            YouTubeFetcher(cache=reloaded, backend="subprocess").get_stream_url(
+                YOUTUBE_URL
+            )
+            == STREAM_URL
+        )
+        assert len(fake_yt_dlp.calls) == 1
+
+    def test_cache_separates_modes(
+        self, cache: StreamCache, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that audio and video resolutions are cached separately."""
+        YouTubeFetcher(
+            prefer_audio_only=True, cache=cache, backend="subprocess"
+        ).resolve(YOUTUBE_URL)
+        YouTubeFetcher(
+            prefer_audio_only=False, cache=cache, backend="subprocess"
+        ).resolve(YOUTUBE_URL)
+        assert len(fake_yt_dlp.calls) == 2
+
+    def test_quality_sets_format_and_cache_key(
+        self, cache: StreamCache, fake_yt_dlp: FakeYtDlp
+    ) -> None:
+        """Test that the quality tier reaches yt-dlp and separates cache entries."""
+        YouTubeFetcher(cache=cache, backend="subprocess", quality="low").resolve(
+            YOUTUBE_URL
+        )
+        YouTubeFetcher(cache=cache, backend="subprocess", quality="high").resolve(
+            YOUTUBE_URL
+        )
+        assert len(fake_yt_dlp.calls) == 2
+        first = fake_yt_dlp.calls[0]
+        assert first[first.index("-f") + 1] == get_format_selector("low")
+
+    def test_failed_resolve_is_not_cached(
+        self, cache: StreamCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that failures return None and are retried after the cooldown."""
+        fake = FakeYtDlp(None, returncode=1)
+        monkeypatch.setattr(youtube_fetcher.asyncio, "create_subprocess_exec", fake)
+        fetcher = YouTubeFetcher(
+            cache=cache,
+            backend="subprocess",
+            breaker=CircuitBreaker(base_cooldown=0),
+            retry_policy=RetryPolicy(),
+        )
+
+        assert fetcher.get_stream_url(YOUTUBE_URL) is None
+        assert fetcher.get_stream_url(YOUTUBE_URL) is None
+        assert len(fake.calls) == 2
+        assert len(cache) == 0
+
+    def test_failing_url_fails_fast(
+        self, cache: StreamCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed URL is not resolved again during its cooldown."""
+        fake = FakeYtDlp(None, returncode=1)
+        monkeypatch.setattr(youtube_fetcher.asyncio, "create_subprocess_exec", fake)
+        breaker = CircuitBreaker(base_cooldown=60)
+        fetcher = YouTubeFetcher(
+            cache=cache,
+            backend="subprocess",
+            breaker=breaker,
+            retry_policy=RetryPolicy(),
+        )
+
+        assert fetcher.get_stream_url(YOUTUBE_URL) is None
+        assert fetcher.get_stream_url(YOUTUBE_URL) is None
+        breaker.cancel_probes()
+        assert len(fake.calls) == 1
+        assert fetcher.retry_in(YOUTUBE_URL) > 0
+
+    def test_transient_failure_is_retried(
+        self,
+        cache: StreamCache,
+        fake_yt_dlp: FakeYtDlp,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a failed attempt is retried within the same resolve."""
+        payloads = [None, fake_yt_dlp.payload]
+
+        async def flaky(*cmd: str, **kwargs: Any) -> FakeProcess:
+            fake_yt_dlp.payload = payloads.pop(0)
+            return await fake_yt_dlp(*cmd, **kwargs)
+
+        monkeypatch.setattr(youtube_fetcher.asyncio, "create_subprocess_exec", flaky)
+        fetcher = YouTubeFetcher(
+            cache=cache,
+            backend="subprocess",
+            retry_policy=RetryPolicy(attempts=3, base_delay=0),
+        )
+
+        assert fetcher.get_stream_url(YOUTUBE_URL) == STREAM_URL
+        assert len(fake_yt_dlp.calls) == 2
+        assert len(fetcher.latency) == 1
+
+    def test_in_process_engine(
+        self, cache: StreamCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the in-process engine is used without spawning yt-dlp."""
+
+        class FakeEngine:
+            version = "2024.01.01"
+
+            def __init__(self) -> None:
+                self.calls: List[str] = []
+
+            def extract(self, url: str, fmt: str, timeout: float) -> Dict[str, Any]:
+                self.calls.append(url)
+                return {"url": STREAM_URL, "title": "in-process"}
+
+        engine = FakeEngine()
+        monkeypatch.setattr(youtube_fetcher, "get_engine", lambda: engine)
+        monkeypatch.setattr(youtube_fetcher.asyncio, "create_subprocess_exec", None)
+
+        fetcher = YouTubeFetcher(cache=cache, backend="inprocess")
+        assert fetcher.check_yt_dlp_installed() is True
+        info = fetcher.resolve(YOUTUBE_URL)
+        assert info is not None
+        assert info.title == "in-process"
+        assert engine.calls == [YOUTUBE_URL]
+
+    def test_in_process_falls_back_to_subprocess(
+        self,
+        cache: StreamCache,
+        fake_yt_dlp: FakeYtDlp,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test fallback to the binary when yt_dlp is not importable."""
+        monkeypatch.setattr(youtube_fetcher, "get_engine", lambda: None)
+        fetcher = YouTubeFetcher(cache=cache, backend="inprocess")
+        assert fetcher.engine is None
+        assert fetcher.get_stream_url(YOUTUBE_URL) == STREAM_URL
+        assert len(fake_yt_dlp.calls) == 1
+
+    def test_first_playable_entry_wins(
+        self, cache: StreamCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that multi-entry output stops at the first playable entry."""
+        lines = [
+            json.dumps({"title": "upcoming premiere"}),
+            json.dumps({"url": STREAM_URL, "title": "live now"}),
+            json.dumps({"url": "https://example.com/other", "title": "later"}),
+        ]
+        processes: List[FakeProcess] = []
+
+        async def popen(*cmd: str, **kwargs: Any) -> FakeProcess:
+            processes.append(FakeProcess("\n".join(lines) + "\n", 0))
+            return processes[-1]
+
+        monkeypatch.setattr(youtube_fetcher.asyncio, "create_subprocess_exec", popen)
+        info = YouTubeFetcher(cache=cache, backend="subprocess").resolve(YOUTUBE_URL)
+
+        assert info is not None
+        assert info.title == "live now"
+        assert processes[0].killed
+
+    def test_concurrent_resolves_share_one_flight(
+        self, cache: StreamCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that concurrent callers for one URL run yt-dlp once."""
+        release = threading.Event()
+        fake = FakeYtDlp({"url": STREAM_URL, "title": "shared"})
+
+        async def slow_popen(*cmd: str, **kwargs: Any) -> FakeProcess:
+            release.wait(timeout=5)
+            return await fake(*cmd, **kwargs)
+
+        monkeypatch.setattr(
+            youtube_fetcher.asyncio, "create_subprocess_exec", slow_popen
+        )
+        fetcher = YouTubeFetcher(cache=cache, backend="subprocess")
+        results: List[Any] = []
+        urls = [YOUTUBE_URL, "https://youtu.be/jfKfPfyJRdk"] * 3
+        threads = [
+            threading.Thread(target=lambda u=url: results.append(fetcher.resolve(u)))
+            for url in urls
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(fake.calls) == 1
+        assert len(results) == len(urls)
+        assert all(r is not None and r.url == STREAM_URL for r in results)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX fake yt-dlp")
+class TestYouTubeFetcherAsync:
+    """Test suite for the asyncio resolver API."""
+
+    def test_resolve_async(self, cache: StreamCache, yt_dlp_script: Path) -> None:
+        """Test resolving through an asyncio subprocess."""
+        fetcher = YouTubeFetcher(cache=cache, backend="subprocess")
+        info = asyncio.run(fetcher.resolve_async(YOUTUBE_URL))
+        assert info is not None
+        assert info.title == "async radio"
+        assert asyncio.run(fetcher.get_stream_url_async(YOUTUBE_URL)) == STREAM_URL
+
+    def test_async_resolves_share_one_flight(
+        self, cache: StreamCache, yt_dlp_script: Path
+    ) -> None:
+        """Test that concurrent coroutines share a single yt-dlp process."""
+        (yt_dlp_script.parent / "delay").write_text("0.3")
+        fetcher = YouTubeFetcher(cache=cache, backend="subprocess")
+        fetcher.cache = None  # Force every call past the cache
+
+        async def resolve_many() -> List[Any]:
+            return list(
+                await asyncio.gather(
+                    *(fetcher.resolve_async(YOUTUBE_URL) for _ in range(4))
+                )
+            )
+
+        results = asyncio.run(resolve_many())
+        assert all(r is not None and r.title == "async radio" for r in results)
+        calls = (yt_dlp_script.parent / "calls").read_text().splitlines()
+        assert len(calls) == 1
+
+    def test_slow_resolve_is_hedged(
+        self, cache: StreamCache, yt_dlp_script: Path
+    ) -> None:
+        """Test that an attempt slower than p90 is raced by a second process."""
+        (yt_dlp_script.parent / "delay_once").write_text("30")
+        fetcher = YouTubeFetcher(cache=cache, backend="subprocess", hedge=True)
+        for _ in range(5):
+            fetcher.latency.record(0.2)
+
+        started = time.monotonic()
+        info = fetcher.resolve(YOUTUBE_URL)
+
+        assert info is not None
+        assert info.url == STREAM_URL
+        assert time.monotonic() - started < 10
+        calls = (yt_dlp_script.parent / "calls").read_text().splitlines()
+        assert len(calls) == 2
+
+    def test_stops_yt_dlp_after_first_entry(
+        self, cache: StreamCache, yt_dlp_script: Path
+    ) -> None:
+        """Test that yt-dlp is not waited for once an entry was read."""
+        (yt_dlp_script.parent / "linger").write_text("30")
+        pid_file = yt_dlp_script.parent / "pid"
+
+        fetcher = YouTubeFetcher(cache=cache, backend="subprocess")
+        fetcher.cache = None  # Force every call past the cache
+
+        for resolve in (
+            fetcher.resolve,
+            lambda url: asyncio.run(fetcher.resolve_async(url)),
+        ):
+            started = time.monotonic()
+            info = resolve(YOUTUBE_URL)
+
+            assert info is not None
+            assert info.url == STREAM_URL
+            assert time.monotonic() - started < 10
+            with pytest.raises(ProcessLookupError):
+                os.kill(int(pid_file.read_text()), 0)
+
+    def test_chatty_stderr_does_not_block(
+        self, cache: StreamCache, yt_dlp_script: Path
+    ) -> None:
+        """Test that stderr is drained while the output is read."""
+        # Far more than a pipe buffer holds
+        (yt_dlp_script.parent / "noisy").write_text(str(1024 * 1024))
+        fetcher = YouTubeFetcher(cache=cache, backend="subprocess")
+
+        info = fetcher.resolve(YOUTUBE_URL)
+
+        assert info is not None
+        assert info.url == STREAM_URL
+
+    def test_cancel_kills_child_process(
+        self, cache: StreamCache, yt_dlp_script: Path
+    ) -> None:
+        """Test that cancelling a resolve kills the yt-dlp process."""
+        (yt_dlp_script.parent / "delay").write_text("30")
+        pid_file = yt_dlp_script.parent / "pid"
+        fetcher = YouTubeFetcher(cache=cache, backend="subprocess")
+
+        async def cancel_resolve() -> None:
+            task = asyncio.ensure_future(fetcher.resolve_async(YOUTUBE_URL))
+            deadline = time.monotonic() + 10
+            while not pid_file.exists() and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_resolve())
+
+        pid = int(pid_file.read_text())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+        assert len(cache) == 0
@@ -0,0 +1,65 @@
+"""Tests for the in-process yt-dlp engine module."""
+
+import threading
+import types
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from lofigirl_terminal.modules import ytdl_engine
+from lofigirl_terminal.modules.ytdl_engine import YtDlpEngine
+
+
+class FakeYoutubeDL:
+    """Records which thread created each instance."""
+
+    created: List[int] = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    def __init__(self, options: Dict[str, Any]) -> None:
+        self.options = options
+        self.owner = threading.get_ident()
+        FakeYoutubeDL.created.append(self.owner)
+
+    def extract_info(self, url: str, download: bool) -> Dict[str, Any]:
+        assert threading.get_ident() == self.owner
+        # Both extractions must be running at once to get past this
+        FakeYoutubeDL.barrier.wait()
+        return {"url": f"{url}/stream"}
+
+
+@pytest.fixture
+def engine(monkeypatch: pytest.MonkeyPatch) -> Iterator[YtDlpEngine]:
+    """Create an engine backed by FakeYoutubeDL."""
+    FakeYoutubeDL.created = []
+    FakeYoutubeDL.barrier.reset()
+    monkeypatch.setattr(
+        ytdl_engine,
+        "yt_dlp",
+        types.SimpleNamespace(YoutubeDL=FakeYoutubeDL),
+        raising=False,
+    )
+    monkeypatch.setattr(ytdl_engine, "YT_DLP_AVAILABLE", True)
+    instance = YtDlpEngine(workers=2)
+    yield instance
+    instance.shutdown()
+
+
+class TestYtDlpEngine:
+    """Test suite for YtDlpEngine class."""
+
+    def test_concurrent_extractions(self, engine: YtDlpEngine) -> None:
+        """Test that workers extract concurrently with their own instances."""
+        first = engine.submit("https://a", "bestaudio")
+        second = engine.submit("https://b", "bestaudio")
+
+        assert first.result(5) == {"url": "https://a/stream"}
+        assert second.result(5) == {"url": "https://b/stream"}
+        assert len(set(FakeYoutubeDL.created)) == 2
+
+    def test_shutdown(self, engine: YtDlpEngine) -> None:
+        """Test that a shut down engine refuses new work."""
+        engine.shutdown()
+
+        with pytest.raises(RuntimeError):
+            engine.submit("https://a", "bestaudio")
@@ -0,0 +1,113 @@
+"""Tests for the yt-dlp capability probe module."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from lofigirl_terminal.modules import stream_cache, ytdl_probe
+from lofigirl_terminal.modules.ytdl_probe import YtDlpCapabilities, probe_yt_dlp
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="uses a POSIX fake yt-dlp"
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_memo(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clear the per-process memoized probe."""
+    monkeypatch.setattr(ytdl_probe, "_capabilities", None)
+
+
+@pytest.fixture
+def yt_dlp_bin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Put a fake yt-dlp that logs its invocations first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "yt-dlp"
+    script.write_text(f"""#!{sys.executable}
+import pathlib, sys
+here = pathlib.Path(__file__).parent
+with open(here / "calls", "a") as calls:
+    calls.write(sys.argv[1] + "\\n")
+print("2024.01.01")
+""")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    return script
+
+
+def read_calls(yt_dlp_bin: Path) -> list:
+    """Return the arguments the fake yt-dlp was called with."""
+    calls_file = yt_dlp_bin.parent / "calls"
+    return calls_file.read_text().splitlines() if calls_file.exists() else []
+
+
+class TestProbeYtDlp:
+    """Test suite for probe_yt_dlp."""
+
+    def test_probe_reports_version(self, yt_dlp_bin: Path, tmp_path: Path) -> None:
+        """Test that the probe parses the version."""
+        caps = probe_yt_dlp(record_file=tmp_path / "probe.json")
+        assert caps.installed
+        assert caps.path == str(yt_dlp_bin)
+        assert caps.version == "2024.01.01"
+
+    def test_probe_is_memoized(self, yt_dlp_bin: Path, tmp_path: Path) -> None:
+        """Test that repeated probes do not run yt-dlp again."""
+        probe_yt_dlp(record_file=tmp_path / "probe.json")
+        probe_yt_dlp(record_file=tmp_path / "probe.json")
+        assert read_calls(yt_dlp_bin) == ["--version"]
+
+    def test_record_skips_probe_on_cold_start(
+        self, yt_dlp_bin: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a matching on-disk record avoids running yt-dlp."""
+        record = tmp_path / "probe.json"
+        probe_yt_dlp(record_file=record)
+        monkeypatch.setattr(ytdl_probe, "_capabilities", None)
+
+        caps = probe_yt_dlp(record_file=record)
+        assert caps.version == "2024.01.01"
+        assert len(read_calls(yt_dlp_bin)) == 1
+
+    def test_upgrade_invalidates_record(
+        self, yt_dlp_bin: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a changed binary mtime triggers a new probe."""
+        record = tmp_path / "probe.json"
+        probe_yt_dlp(record_file=record)
+        monkeypatch.setattr(ytdl_probe, "_capabilities", None)
+        stat = yt_dlp_bin.stat()
+        os.utime(yt_dlp_bin, (stat.st_atime, stat.st_mtime + 60))
+
+        probe_yt_dlp(record_file=record)
+        assert len(read_calls(yt_dlp_bin)) == 2
+
+    def test_record_written_atomically(
+        self, yt_dlp_bin: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed write keeps the previous record intact."""
+        record = tmp_path / "probe.json"
+        probe_yt_dlp(record_file=record)
+        before = record.read_text()
+        stat = yt_dlp_bin.stat()
+        os.utime(yt_dlp_bin, (stat.st_atime, stat.st_mtime + 60))
+
+        def fail_replace(*_: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(stream_cache.os, "replace", fail_replace)
+        assert probe_yt_dlp(record_file=record, force=True).installed
+        assert record.read_text() == before
+        assert [path.name for path in tmp_path.glob("*.json*")] == ["probe.json"]
+
+    def test_missing_binary(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a missing binary reports not installed."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        caps = probe_yt_dlp(record_file=tmp_path / "probe.json")
+        assert caps == YtDlpCapabilities()
+        assert not caps.installed